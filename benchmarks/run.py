@@ -0,0 +1,365 @@
+"""
+Benchmarks of the pymojis hot paths.
+
+Measures startup (import, dataset load, index build), single lookups, text
+scanning and transforms over synthetic corpora, and random selection, for the
+light and full datasets. Results can be written as JSON and compared with a
+previous run to spot regressions between releases:
+
+    python benchmarks/run.py --output before.json
+    python benchmarks/run.py --compare before.json
+
+The checkout's ``src`` directory is benchmarked, not an installed release.
+Corpora are generated from a fixed seed, so runs are comparable across
+machines and releases.
+"""
+
+import argparse
+import json
+import os
+import platform
+import statistics
+import subprocess  # nosec B404
+import sys
+import time
+import tomllib
+from collections.abc import Callable, Iterator
+from dataclasses import asdict, dataclass, field
+from datetime import UTC, datetime
+from itertools import islice
+from pathlib import Path
+from random import Random
+from typing import Any
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT / "src"))
+
+from pymojis.application.pymojis_manager import PymojisManager
+from pymojis.infrastructure.data_loader.emojis_loader import (
+    DatasetConfig,
+    EmojiDataLoader,
+)
+from pymojis.infrastructure.dataset_registry import DatasetRegistry
+from pymojis.infrastructure.pymojis_repository import (
+    PymojisRepositoryImpl,
+)
+
+SEED = 20240601
+# (name, length in characters, share of tokens that are emojis)
+CORPORA = [
+    ("short-plain", 80, 0.0),
+    ("short-dense", 80, 0.3),
+    ("chat-1k", 1_000, 0.05),
+    ("log-100k", 100_000, 0.01),
+    ("dense-100k", 100_000, 0.2),
+]
+QUICK_CORPORA = {"short-dense", "chat-1k"}
+
+
+@dataclass
+class Result:
+    name: str
+    dataset: str
+    params: dict[str, Any] = field(default_factory=dict)
+    # Seconds per operation, over every repeat
+    best: float = 0.0
+    median: float = 0.0
+    # Characters processed per operation, for throughput
+    chars: int = 0
+
+    @property
+    def key(self) -> str:
+        params = ",".join(f"{name}={value}" for name, value in self.params.items())
+        return f"{self.dataset}:{self.name}" + (f"[{params}]" if params else "")
+
+
+def measure(function: Callable[[], Any], repeat: int, min_time: float) -> list[float]:
+    """Time ``function``, calibrating the loop count like timeit.autorange."""
+    number = 1
+    while True:
+        start = time.perf_counter()
+        for _ in range(number):
+            function()
+        elapsed = time.perf_counter() - start
+        if elapsed >= min_time:
+            break
+        number *= 10 if elapsed < min_time / 10 else 2
+
+    timings = [elapsed / number]
+    for _ in range(repeat - 1):
+        start = time.perf_counter()
+        for _ in range(number):
+            function()
+        timings.append((time.perf_counter() - start) / number)
+    return timings
+
+
+class Runner:
+    """Runs the benchmarks selected by the command line."""
+
+    def __init__(self, repeat: int, min_time: float, selection: str | None):
+        self.repeat = repeat
+        self.min_time = min_time
+        self.selection = selection
+
+    def __call__(
+        self,
+        name: str,
+        dataset: str,
+        function: Callable[[], Any],
+        chars: int = 0,
+        **params: Any,
+    ) -> Iterator[Result]:
+        result = Result(name, dataset, params, chars=chars)
+        if self.selection and self.selection not in result.key:
+            return
+        timings = measure(function, self.repeat, self.min_time)
+        result.best = min(timings)
+        result.median = statistics.median(timings)
+        yield result
+
+
+def make_corpus(manager: PymojisManager, length: int, density: float) -> str:
+    rng = Random(SEED)
+    emojis = [emoji.emoji for emoji in manager.get_all_emojis()]
+    words = sorted(
+        {word for emoji in manager.get_all_emojis() for word in emoji.name.split()}
+    )
+    words += ["the", "and", "hello", "today", "really", "ok", "lol", "see", "you"]
+
+    tokens: list[str] = []
+    size = 0
+    while size < length:
+        token = rng.choice(emojis) if rng.random() < density else rng.choice(words)
+        tokens.append(token)
+        size += len(token) + 1
+    return " ".join(tokens)[:length]
+
+
+def bench_startup(run: Runner, config: DatasetConfig) -> Iterator[Result]:
+    def load() -> PymojisRepositoryImpl:
+        # A fresh registry, so that every load reads the dataset again
+        repository = PymojisRepositoryImpl(
+            dataset_configs=[config], registry=DatasetRegistry()
+        )
+        repository.load_emojis()
+        return repository
+
+    yield from run("load", config.dataset_type, load)
+    yield from run("load+warmup", config.dataset_type, lambda: load().warmup())
+
+
+def bench_import(run: Runner) -> Iterator[Result]:
+    code = "from pymojis import PymojisManager"
+    environment = {**os.environ, "PYTHONPATH": str(ROOT / "src")}
+    # Includes the interpreter start, subtract the "python" baseline to compare
+    for name, command in (("python", "pass"), ("import", code)):
+        yield from run(
+            name,
+            "-",
+            lambda command=command: subprocess.run(  # nosec B603
+                [sys.executable, "-c", command], check=True, env=environment
+            ),
+        )
+
+
+def bench_manager(
+    run: Runner,
+    manager: PymojisManager,
+    dataset: str,
+    corpora: list[tuple[str, int, float]],
+) -> Iterator[Result]:
+    emojis = manager.get_all_emojis()
+    sample = Random(SEED).sample(emojis, 100)
+    codes = [emoji.code[0] for emoji in sample]
+    names = [emoji.name for emoji in sample]
+    glyphs = [emoji.emoji for emoji in sample]
+
+    # Lookups: one operation resolves the 100 sampled keys
+    for name, lookup, keys in (
+        ("get_by_code", manager.get_by_code, codes),
+        ("get_by_name", manager.get_by_name, names),
+        ("get_by_emoji", manager.get_by_emoji, glyphs),
+        ("is_emoji", manager.is_emoji, glyphs),
+        ("to_html", manager.to_html, glyphs),
+    ):
+        yield from run(
+            name,
+            dataset,
+            lambda lookup=lookup, keys=keys: [lookup(key) for key in keys],
+            keys=len(keys),
+        )
+    yield from run("get_by_category", dataset, lambda: manager.get_by_category("Flags"))
+
+    # Type-ahead: one operation searches every keystroke of 10 sampled names
+    queries = [name[:end] for name in names[:10] for end in range(1, len(name) + 1)]
+    yield from run(
+        "search",
+        dataset,
+        lambda: [manager.search(query) for query in queries],
+        queries=len(queries),
+    )
+
+    # Random selection
+    for length, exclude in ((1, None), (100, None), (10, "complex")):
+        yield from run(
+            "get_random",
+            dataset,
+            lambda length=length, exclude=exclude: manager.get_random(
+                length=length, exclude=exclude
+            ),
+            length=length,
+            exclude=exclude,
+        )
+    stream = manager.iter_random(window=50)
+    yield from run(
+        "iter_random", dataset, lambda: list(islice(stream, 100)), n=100, window=50
+    )
+
+    # Text scanning and transforms
+    for corpus, length, density in corpora:
+        text = make_corpus(manager, length, density)
+        for name, transform in (
+            ("contains_emojis", manager.contains_emojis),
+            ("find_emojis", manager.find_emojis),
+            ("emojifie", manager.emojifie),
+            ("text_to_html", manager.text_to_html),
+        ):
+            yield from run(
+                name,
+                dataset,
+                lambda transform=transform, text=text: transform(text),
+                chars=len(text),
+                corpus=corpus,
+            )
+
+
+def format_result(result: Result) -> str:
+    line = f"{result.key:<60} {result.best * 1e6:>12.2f} us"
+    if result.chars:
+        line += f" {result.chars / result.best / 1e6:>9.2f} Mchar/s"
+    return line
+
+
+def compare(results: list[Result], baseline_path: Path, threshold: float) -> int:
+    baseline = {
+        entry["key"]: entry
+        for entry in json.loads(baseline_path.read_text())["results"]
+    }
+    regressions = 0
+    print(f"\nComparison with {baseline_path} (best times):")
+    for result in results:
+        previous = baseline.get(result.key)
+        if previous is None:
+            continue
+        ratio = result.best / previous["best"]
+        flag = ""
+        if ratio > 1 + threshold:
+            flag = "  REGRESSION"
+            regressions += 1
+        elif ratio < 1 - threshold:
+            flag = "  improvement"
+        print(f"{result.key:<60} {ratio:>7.2f}x{flag}")
+    return regressions
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[1])
+    parser.add_argument(
+        "--dataset",
+        nargs="+",
+        choices=["light", "full"],
+        default=["light", "full"],
+        help="datasets to benchmark, skipped if not available",
+    )
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument(
+        "--min-time", type=float, default=0.2, help="seconds per timing loop"
+    )
+    parser.add_argument(
+        "--quick", action="store_true", help="fewer corpora, shorter loops"
+    )
+    parser.add_argument("--filter", help="only run benchmarks whose key contains this")
+    parser.add_argument("--output", type=Path, help="write the results as JSON")
+    parser.add_argument("--compare", type=Path, help="JSON results of a previous run")
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=0.1,
+        help="relative slowdown reported as a regression",
+    )
+    args = parser.parse_args()
+
+    repeat, min_time = (3, 0.05) if args.quick else (args.repeat, args.min_time)
+    corpora = [c for c in CORPORA if not args.quick or c[0] in QUICK_CORPORA]
+    configs = {
+        config.dataset_type: config for config in EmojiDataLoader.DEFAULT_DATASETS
+    }
+
+    run = Runner(repeat, min_time, args.filter)
+
+    def collect() -> Iterator[Result]:
+        yield from bench_import(run)
+        for dataset in args.dataset:
+            config = configs[dataset]
+            manager = PymojisManager(dataset_configs=[config])
+            try:
+                manager.warmup()
+            except Exception as error:
+                print(f"Skipping {dataset} dataset: {error}", file=sys.stderr)
+                continue
+            yield from bench_startup(run, config)
+            yield from bench_manager(run, manager, dataset, corpora)
+
+    results = []
+    for result in collect():
+        print(format_result(result), flush=True)
+        results.append(result)
+
+    if args.output:
+        args.output.write_text(
+            json.dumps(
+                {
+                    "metadata": metadata(),
+                    "results": [
+                        {"key": result.key, **asdict(result)} for result in results
+                    ],
+                },
+                indent=2,
+            )
+        )
+        print(f"\nWrote {args.output}")
+
+    if args.compare:
+        return 1 if compare(results, args.compare, args.threshold) else 0
+    return 0
+
+
+def metadata() -> dict[str, Any]:
+    try:
+        commit = subprocess.run(  # nosec B603 B607
+            ["git", "rev-parse", "HEAD"],
+            cwd=ROOT,
+            capture_output=True,
+            check=True,
+            text=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        commit = None
+    with (ROOT / "pyproject.toml").open("rb") as pyproject:
+        version = tomllib.load(pyproject)["project"]["version"]
+
+    return {
+        "version": version,
+        "commit": commit,
+        "python": platform.python_version(),
+        "implementation": platform.python_implementation(),
+        "platform": platform.platform(),
+        "machine": platform.machine(),
+        "date": datetime.now(UTC).isoformat(timespec="seconds"),
+        "seed": SEED,
+    }
+
+
+if __name__ == "__main__":
+    sys.exit(main())
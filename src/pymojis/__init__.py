@@ -1,3 +1,30 @@
-from .application.pymojis_manager import PymojisManager
+from typing import TYPE_CHECKING, Any
 
-__all__ = ["PymojisManager"]
+if TYPE_CHECKING:
+    from .application.async_pymojis_manager import AsyncPymojisManager
+    from .application.pymojis_manager import PymojisManager
+    from .infrastructure.metrics import PymojisMetrics
+    from .infrastructure.result_cache import ResultCache
+
+__all__ = ["AsyncPymojisManager", "PymojisManager", "PymojisMetrics", "ResultCache"]
+
+
+def __getattr__(name: str) -> Any:
+    # Managers pull in the whole stack, so they are imported on first access
+    if name == "PymojisManager":
+        from .application.pymojis_manager import PymojisManager
+
+        return PymojisManager
+    if name == "AsyncPymojisManager":
+        from .application.async_pymojis_manager import AsyncPymojisManager
+
+        return AsyncPymojisManager
+    if name == "PymojisMetrics":
+        from .infrastructure.metrics import PymojisMetrics
+
+        return PymojisMetrics
+    if name == "ResultCache":
+        from .infrastructure.result_cache import ResultCache
+
+        return ResultCache
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,117 @@
+import asyncio
+from collections.abc import Callable, Iterable
+from concurrent.futures import Executor
+from functools import partial
+from typing import Any, Literal, TypeVar, cast
+
+from pymojis.domain.entities.emojis import EmojiMatch
+from pymojis.infrastructure.data_loader.emojis_loader import DatasetConfig
+
+from .pymojis_manager import PymojisManager
+
+T = TypeVar("T")
+
+
+class AsyncPymojisManager:
+    """
+    asyncio front end of PymojisManager.
+
+    Loading the dataset and processing large texts are CPU-bound, so they run
+    in an executor instead of blocking the event loop. Once the manager is
+    created, single lookups such as get_by_code are cheap and can be called
+    synchronously through ``manager``.
+    """
+
+    def __init__(
+        self, manager: PymojisManager | None = None, executor: Executor | None = None
+    ):
+        self.manager = manager or PymojisManager()
+        # None selects the default executor of the event loop
+        self._executor = executor
+
+    @classmethod
+    async def create(
+        cls,
+        dataset_configs: list[DatasetConfig] | None = None,
+        executor: Executor | None = None,
+    ) -> "AsyncPymojisManager":
+        """
+        Create a manager with its dataset loaded and indexed off the event loop.
+
+        Args:
+            dataset_configs (Optional[list[DatasetConfig]]): Dataset configurations, as for PymojisManager.
+            executor (Optional[Executor]): Executor running the blocking work. Defaults to the default executor of the event loop.
+
+        Returns:
+            AsyncPymojisManager: A manager ready to serve requests.
+
+        Raises:
+            DatasetNotFoundError: If no dataset can be loaded.
+
+        Example:
+            >>> manager = await AsyncPymojisManager.create()
+            >>> manager.manager.get_by_code("1F604")
+            '😄'
+        """
+        async_manager = cls(PymojisManager(dataset_configs=dataset_configs), executor)
+        await async_manager._run(async_manager.manager.warmup)
+        return async_manager
+
+    async def _run(self, function: Callable[..., T], *args: Any) -> T:
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, partial(function, *args))
+
+    async def reload(self) -> None:
+        """
+        Reload the emoji dataset from its source, off the event loop. See PymojisManager.reload.
+        """
+        await self._run(self.manager.reload)
+        await self._run(self.manager.warmup)
+
+    async def emojifie(
+        self, text: str, match: Literal["word", "prefix", "substring"] = "substring"
+    ) -> str:
+        """
+        Replace words with matching emojis, off the event loop. See PymojisManager.emojifie.
+        """
+        return await self._run(self.manager.emojifie, text, match)
+
+    async def emojifie_many(
+        self,
+        texts: Iterable[str],
+        match: Literal["word", "prefix", "substring"] = "substring",
+    ) -> list[str]:
+        """
+        Replace words with matching emojis in many texts, off the event loop. See PymojisManager.emojifie_many.
+        """
+        results = await self._run(self.manager.emojifie_many, texts, match)
+        return cast(list[str], results)
+
+    async def find_emojis(self, text: str) -> list[EmojiMatch]:
+        """
+        Find every emoji in a text, off the event loop. See PymojisManager.find_emojis.
+        """
+        return await self._run(self.manager.find_emojis, text)
+
+    async def contains_emojis_many(self, texts: Iterable[str]) -> list[bool]:
+        """
+        Check many texts for emojis, off the event loop. See PymojisManager.contains_emojis_many.
+        """
+        results = await self._run(self.manager.contains_emojis_many, texts)
+        return cast(list[bool], results)
+
+    async def process_many(
+        self,
+        texts: Iterable[str],
+        op: Literal["emojifie", "contains_emojis", "find_emojis", "is_emoji"],
+        workers: int | None = None,
+        chunksize: int = 1000,
+        match: Literal["word", "prefix", "substring"] = "substring",
+    ) -> list[Any]:
+        """
+        Apply a text method to many texts over worker processes, waiting for them off the event loop. See PymojisManager.process_many.
+        """
+        results = await self._run(
+            self.manager.process_many, texts, op, workers, chunksize, match
+        )
+        return cast(list[Any], results)
@@ -1,15 +1,84 @@
-from typing import Literal
+from collections.abc import Callable, Iterable, Iterator, Mapping
+from functools import partial
+from random import Random
+from typing import TYPE_CHECKING, Any, Literal, TextIO, TypeVar
 
-from pymojis.domain.entities.emojis import Categories, Emoji
+from pymojis.domain.entities.emojis import Categories, Emoji, EmojiMatch
+from pymojis.infrastructure.data_loader.emojis_loader import DatasetConfig
 from pymojis.infrastructure.exceptions import DatasetNotFoundError
 from pymojis.infrastructure.pymojis_repository import PymojisRepositoryImpl
 
+if TYPE_CHECKING:
+    from pymojis.infrastructure.emoji_counter import EmojiCounter
+    from pymojis.infrastructure.metrics import PymojisMetrics
+    from pymojis.infrastructure.result_cache import ResultCache
+
+T = TypeVar("T")
+
 
 class PymojisManager:
-    def __init__(self):
-        self.repository = PymojisRepositoryImpl()
+    def __init__(
+        self,
+        dataset_configs: list[DatasetConfig] | None = None,
+        lazy: bool = True,
+        rng: Random | None = None,
+        cache: "ResultCache | None" = None,
+        metrics: "PymojisMetrics | None" = None,
+    ):
+        # Metrics record the loading pipeline and every repository call
+        self.repository = PymojisRepositoryImpl(
+            dataset_configs=dataset_configs, rng=rng, metrics=metrics
+        )
+        # Caches get_by_code, get_by_name, is_emoji, emojifie and to_html
+        self.cache = cache
+        # Part of every cache key, so that managers sharing a cache never
+        # serve each other's results, even over different datasets
+        self._cache_scope = object()
+        if cache is not None:
+            self.repository.add_dataset_listener(cache.clear)
+        if not lazy:
+            self.warmup()
+
+    def _cached(self, method: str, function: Callable[..., T], *args: Any) -> T:
+        # Invalid arguments bypass the cache, so that the repository warns
+        # about them on every call
+        if self.cache is None or not all(isinstance(arg, str) for arg in args):
+            return function(*args)
+        return self.cache.get_or_compute(
+            (self._cache_scope, method, *args), partial(function, *args)
+        )
+
+    def warmup(self) -> None:
+        """
+        Load the emoji dataset and build its lookup indexes now.
+
+        By default, the dataset is loaded by the first method needing it and each lookup index is built on first use, so short-lived programs only pay for what they use. This method pays the whole cost up front, for instance when a server starts, and reports a missing dataset immediately. Creating the manager with lazy=False calls it for you.
+
+        Example:
+            >>> manager = PymojisManager()
+            >>> manager.warmup()
+        """
         try:
-            self.repository.load_emojis()
+            self.repository.warmup()
+        except DatasetNotFoundError:
+            raise
+        except Exception as dataset_error:
+            raise DatasetNotFoundError(
+                f"No dataset found: {dataset_error}"
+            ) from dataset_error
+
+    def reload(self) -> None:
+        """
+        Reload the emoji dataset from its source.
+
+        Datasets are shared by every manager of the process and loaded only once. This method loads the dataset again, for instance after the data file changed, and makes it the shared one for managers created afterwards.
+
+        Example:
+            >>> manager = PymojisManager()
+            >>> manager.reload()
+        """
+        try:
+            self.repository.load_emojis(reload=True)
         except Exception as dataset_error:
             raise DatasetNotFoundError(
                 f"No dataset found: {dataset_error}"
@@ -20,6 +89,7 @@ class PymojisManager:
         categories: list[Categories] | None = None,
         length: int = 1,
         exclude: Literal["complex"] | list[Categories] | None = None,
+        weights: Mapping[str, float] | None = None,
     ) -> list[Emoji]:
         """
         Retrieve a list of random emojis.
@@ -33,26 +103,62 @@ class PymojisManager:
                 - If set to "complex", all complex emojis will be excluded.
                 - If a list of categories is provided, emojis from those categories will be excluded.
                 Defaults to None (no exclusions).
+            weights (Optional[Mapping[str, float]]): Relative weight of each category. When set, a category is drawn with a probability proportional to its weight, then an emoji is drawn uniformly inside it. Draws are made with replacement, so exactly `length` emojis are returned and they may repeat. Categories without a weight are never drawn. Defaults to None (uniform draw without replacement).
         ⚠️ The categories parameter takes precedence on exclude. If you ask for a specific category and also exclude it, get_random will still generate emojis from this category.
 
+        Draws use the random generator given to the manager, so passing a seeded `random.Random` makes them reproducible.
 
         Returns:
             List[Emoji]: A list of randomly selected emoji objects.
 
         Example:
-            >>> manager = PymojisManager()
+            >>> manager = PymojisManager(rng=random.Random(42))
             >>> manager.get_random(length=3)
             [Emoji(emoji='😊', name='smiling face with smiling eyes', code='1F604',category='Smiley & Emotions'), ...]
+            >>> manager.get_random(length=2, weights={"Animals & Nature": 3, "Food & Drink": 1})
+            [Emoji(emoji='🐶', name='dog face', code='1F436', category='Animals & Nature'), ...]
         """
-        return self.repository.get_random_emojis(categories, length, exclude)
+        return self.repository.get_random_emojis(categories, length, exclude, weights)
+
+    def iter_random(
+        self,
+        categories: list[Categories] | None = None,
+        exclude: Literal["complex"] | list[Categories] | None = None,
+        window: int = 0,
+    ) -> Iterator[Emoji]:
+        """
+        Yield random emojis endlessly.
+
+        This method returns a generator drawing one emoji at a time, with the same filters as get_random. The filtered pool is built once, so each draw costs the same whatever the dataset size. Use itertools.islice or break out of the loop to stop it.
+
+        Args:
+            categories (Optional[List[str]]): A list of category names to filter emojis by. Defaults to all categories.
+            exclude (Optional[Literal["complex"] | list[Categories]]):
+                - If set to "complex", all complex emojis will be excluded.
+                - If a list of categories is provided, emojis from those categories will be excluded.
+                Defaults to None (no exclusions).
+            window (Optional[int]): Number of consecutive emojis that are always distinct. Capped to the number of emojis matching the filters. Defaults to 0 (emojis may repeat at any time).
+        ⚠️ The categories parameter takes precedence on exclude, as in get_random.
+
+        Returns:
+            Iterator[Emoji]: An endless generator of randomly selected emoji objects. It stops immediately if no emoji matches the filters.
+
+        Example:
+            >>> manager = PymojisManager()
+            >>> stream = manager.iter_random(exclude="complex", window=50)
+            >>> next(stream)
+            Emoji(emoji='🦊', name='fox', code='1F98A', category='Animals & Nature')
+        """
+        return self.repository.iter_random_emojis(categories, exclude, window)
 
     def get_all_emojis(
         self, exclude: Literal["complex"] | list[Categories] | None = None
-    ) -> list[Emoji]:
+    ) -> tuple[Emoji, ...]:
         """
         Retrieve all available emojis.
 
-        Returns a list of all emojis in the dataset. You can optionally exclude emojis based on category or complexity. Complex emojis are composed of multiple Unicode code points (e.g., skin tone modifiers, gender variants) and may not be supported on all platforms.
+        Returns a tuple of all emojis in the dataset. You can optionally exclude emojis based on category or complexity. Complex emojis are composed of multiple Unicode code points (e.g., skin tone modifiers, gender variants) and may not be supported on all platforms.
+        Results are computed once per filter then shared, so repeated calls are cheap; convert the tuple with list() to modify it.
 
         Args:
             exclude (Optional[Literal["complex"] | list[Categories]]):
@@ -61,12 +167,12 @@ class PymojisManager:
                 Defaults to None (no exclusions).
 
         Returns:
-            list[Emoji]: A list of emoji objects.
+            tuple[Emoji, ...]: The emoji objects, in dataset order.
 
         Example:
             >>> manager = PymojisManager()
             >>> manager.get_all_emojis()
-            [Emoji(emoji='😊', name='smiling face with smiling eyes', code='1F604', category='Smileys & Emotion'), ...]
+            (Emoji(emoji='😊', name='smiling face with smiling eyes', code='1F604', category='Smileys & Emotion'), ...)
         """
         return self.repository.get_all(exclude)
 
@@ -87,7 +193,7 @@ class PymojisManager:
             >>> manager.get_by_code("1F604")
             '😄'
         """
-        return self.repository.get_by_code(code)
+        return self._cached("get_by_code", self.repository.get_by_code, code)
 
     def get_by_name(self, name: str) -> str | None:
         """
@@ -106,7 +212,73 @@ class PymojisManager:
             >>> manager.get_by_name("smiling face with smiling eyes")
             '😄'
         """
-        return self.repository.get_by_name(name)
+        return self._cached("get_by_name", self.repository.get_by_name, name)
+
+    def search(self, query: str, limit: int | None = 10) -> list[Emoji]:
+        """
+        Search emojis by name and subcategory, best matches first.
+
+        Meant for type-ahead: the query is matched case-insensitively against a prebuilt index, with exact names first, then names starting with the query, then emojis whose name or subcategory words start with every word of the query, and finally names within a small edit distance of the query words, so that typos still match.
+
+        Args:
+            query (str): Text to search for (e.g., "grin", "red hert").
+            limit (int | None): Maximum number of results, all of them if None. Defaults to 10.
+
+        Returns:
+            list[Emoji]: The matching emojis, best first; empty if nothing matches.
+
+        Example:
+            >>> manager = PymojisManager()
+            >>> [emoji.emoji for emoji in manager.search("grinning face", limit=3)]
+            ['😀', '😅', '😃']
+        """
+        return self.repository.search(query, limit)
+
+    def get_by_codes(
+        self, codes: Iterable[str], lazy: bool = False
+    ) -> list[str | None] | Iterator[str | None]:
+        """
+        Retrieve emojis for many Unicode codepoints at once.
+
+        Batch version of get_by_code. Invalid items produce None and a single warning is emitted for the whole batch.
+
+        Args:
+            codes (Iterable[str]): The Unicode codepoints to look up (e.g., ["1F604", "1F600"]).
+            lazy (bool): If True, return a generator producing results as the input is consumed. Defaults to False.
+
+        Returns:
+            list[str | None] | Iterator[str | None]: The emoji for each code, or None when not found, in input order.
+
+        Example:
+            >>> manager = PymojisManager()
+            >>> manager.get_by_codes(["1F604", "unknown"])
+            ['😄', None]
+        """
+        results = self.repository.get_by_codes(codes)
+        return results if lazy else list(results)
+
+    def get_by_names(
+        self, names: Iterable[str], lazy: bool = False
+    ) -> list[str | None] | Iterator[str | None]:
+        """
+        Retrieve emojis for many names at once.
+
+        Batch version of get_by_name. Invalid items produce None and a single warning is emitted for the whole batch.
+
+        Args:
+            names (Iterable[str]): The emoji names to look up.
+            lazy (bool): If True, return a generator producing results as the input is consumed. Defaults to False.
+
+        Returns:
+            list[str | None] | Iterator[str | None]: The emoji for each name, or None when not found, in input order.
+
+        Example:
+            >>> manager = PymojisManager()
+            >>> manager.get_by_names(["grinning face", "sleepy face"])
+            ['😀', '😪']
+        """
+        results = self.repository.get_by_names(names)
+        return results if lazy else list(results)
 
     def get_by_category(self, category: Categories) -> list[str]:
         """
@@ -165,6 +337,109 @@ class PymojisManager:
         """
         return self.repository.contains_emojis(text)
 
+    def contains_emojis_many(
+        self, texts: Iterable[str], lazy: bool = False
+    ) -> list[bool] | Iterator[bool]:
+        """
+        Determine for many strings whether they contain any emoji.
+
+        Batch version of contains_emojis.
+
+        Args:
+            texts (Iterable[str]): The texts to validate.
+            lazy (bool): If True, return a generator producing results as the input is consumed. Defaults to False.
+
+        Returns:
+            list[bool] | Iterator[bool]: One boolean per text, in input order.
+
+        Example:
+            >>> manager = PymojisManager()
+            >>> manager.contains_emojis_many(["Hello 😄", "Hello"])
+            [True, False]
+        """
+        results = self.repository.contains_emojis_many(texts)
+        return results if lazy else list(results)
+
+    def find_emojis(self, text: str) -> list[EmojiMatch]:
+        """
+        Find every emoji occurrence in a string.
+
+        The text is scanned once and each emoji is reported with its position. Sequences such as ZWJ compositions, skin tones and flags are returned as a single match rather than as their individual code points.
+
+        Args:
+            text (str): The text to scan.
+
+        Returns:
+            list[EmojiMatch]: The matches in order of appearance, each holding the start and end offsets of the emoji in the text and the corresponding Emoji object.
+
+        Example:
+            >>> manager = PymojisManager()
+            >>> manager.find_emojis("Hello 😄!")
+            [EmojiMatch(start=6, end=7, emoji=Emoji(name='grinning face with smiling eyes', ...))]
+        """
+        return self.repository.find_emojis(text)
+
+    def iter_emojis(self, text: str) -> Iterator[EmojiMatch]:
+        """
+        Lazily iterate over the emoji occurrences in a string.
+
+        Same as find_emojis, but matches are produced one at a time so scanning can stop early.
+
+        Args:
+            text (str): The text to scan.
+
+        Returns:
+            Iterator[EmojiMatch]: The matches in order of appearance.
+
+        Example:
+            >>> manager = PymojisManager()
+            >>> next(manager.iter_emojis("Hello 😄!")).emoji.name
+            'grinning face with smiling eyes'
+        """
+        return self.repository.iter_emojis(text)
+
+    def iter_emojis_stream(
+        self, source: Iterable[str] | TextIO
+    ) -> Iterator[EmojiMatch]:
+        """
+        Find every emoji in a text read piece by piece.
+
+        Streaming version of iter_emojis, for texts too large to hold in memory. The source is either an open text file, read in fixed-size chunks, or any iterable of strings such as lines or network reads. An emoji split across two pieces is still reported once, and only a few characters are kept between pieces.
+
+        Args:
+            source (Iterable[str] | TextIO): The text to scan, as consecutive pieces.
+
+        Returns:
+            Iterator[EmojiMatch]: A generator of matches. Offsets count characters from the start of the whole text.
+
+        Example:
+            >>> manager = PymojisManager()
+            >>> with open("chat.log", encoding="utf-8") as log:
+            ...     for match in manager.iter_emojis_stream(log):
+            ...         print(match.start, match.emoji.emoji)
+            42 😪
+        """
+        return self.repository.iter_emojis_stream(source)
+
+    def contains_emojis_stream(self, source: Iterable[str] | TextIO) -> bool:
+        """
+        Check if a text read piece by piece contains emojis.
+
+        Streaming version of contains_emojis. Reading stops at the first emoji found.
+
+        Args:
+            source (Iterable[str] | TextIO): The text to check, as an open text file or consecutive pieces.
+
+        Returns:
+            bool: True if the text contains an emoji, else False.
+
+        Example:
+            >>> manager = PymojisManager()
+            >>> manager.contains_emojis_stream(["I'm sleepy 😪", " good night"])
+            True
+        """
+        return self.repository.contains_emojis_stream(source)
+
     def is_emoji(self, text: str) -> bool:
         """
         Determine is a string is an emoji.
@@ -182,17 +457,24 @@ class PymojisManager:
             >>> manager.is_emoji("😄")
             True
         """
-        return self.repository.is_emoji(text)
+        return self._cached("is_emoji", self.repository.is_emoji, text)
 
-    def emojifie(self, text: str) -> str:
+    def emojifie(
+        self, text: str, match: Literal["word", "prefix", "substring"] = "substring"
+    ) -> str:
         """
         Replace words in the text with matching emojis based on their names.
 
         This method scans the input text and replaces tokens that match or partially match
-        an emoji's name with the corresponding emoji character.
+        an emoji's name with the corresponding emoji character. When several emojis match a token, the first one of the dataset is used.
 
         Args:
             text (str): The input text to transform.
+            match (Literal["word", "prefix", "substring"]): How a token must match an emoji name.
+                - "word": the token is one of the words of the name.
+                - "prefix": the token is the beginning of one of the words of the name.
+                - "substring": the token appears anywhere in the name.
+                Defaults to "substring".
 
         Returns:
             str: The text with relevant words replaced by emojis.
@@ -202,7 +484,123 @@ class PymojisManager:
             >>> manager.emojifie("I'm sleepy")
             "I'm 😪"
         """
-        return self.repository.emojifie(text)
+        return self._cached("emojifie", self.repository.emojifie, text, match)
+
+    def emojifie_many(
+        self,
+        texts: Iterable[str],
+        match: Literal["word", "prefix", "substring"] = "substring",
+        lazy: bool = False,
+    ) -> list[str] | Iterator[str]:
+        """
+        Replace words with matching emojis in many texts.
+
+        Batch version of emojifie. Token lookups are shared across the batch, so repeated words are only resolved once.
+
+        Args:
+            texts (Iterable[str]): The input texts to transform.
+            match (Literal["word", "prefix", "substring"]): How a token must match an emoji name. See emojifie. Defaults to "substring".
+            lazy (bool): If True, return a generator producing results as the input is consumed. Defaults to False.
+
+        Returns:
+            list[str] | Iterator[str]: The transformed texts, in input order.
+
+        Example:
+            >>> manager = PymojisManager()
+            >>> manager.emojifie_many(["I'm sleepy", "so sleepy"])
+            ["I'm 😪", '🧑 😪']
+        """
+        results = self.repository.emojifie_many(texts, match)
+        return results if lazy else list(results)
+
+    def emojifie_stream(
+        self,
+        lines: Iterable[str] | TextIO,
+        match: Literal["word", "prefix", "substring"] = "substring",
+    ) -> Iterator[str]:
+        """
+        Replace words with matching emojis, line by line.
+
+        Streaming version of emojifie for large files: each line is transformed as it is read and line breaks are kept, so the output can be written straight to another file. Token lookups are shared across lines, within a bounded memory.
+
+        Args:
+            lines (Iterable[str] | TextIO): The lines to transform, such as an open text file.
+            match (Literal["word", "prefix", "substring"]): How a token must match an emoji name. See emojifie. Defaults to "substring".
+
+        Returns:
+            Iterator[str]: A generator of transformed lines, in input order.
+
+        Example:
+            >>> manager = PymojisManager()
+            >>> with open("in.txt") as source, open("out.txt", "w") as target:
+            ...     target.writelines(manager.emojifie_stream(source))
+        """
+        return self.repository.emojifie_stream(lines, match)
+
+    def process_many(
+        self,
+        texts: Iterable[str],
+        op: Literal["emojifie", "contains_emojis", "find_emojis", "is_emoji"],
+        workers: int | None = None,
+        chunksize: int = 1000,
+        match: Literal["word", "prefix", "substring"] = "substring",
+        lazy: bool = False,
+    ) -> list[Any] | Iterator[Any]:
+        """
+        Apply a text method to many texts using several CPU cores.
+
+        Texts are split into chunks processed by a pool of worker processes. Each worker receives the dataset once, when it starts, instead of with every chunk; a memory-mapped dataset is not even copied, as workers map the same file. Only a few chunks per worker are in flight, so large or endless inputs are processed within a bounded memory. Worth it for large batches: for a few thousand texts, the batch methods are faster.
+
+        Args:
+            texts (Iterable[str]): The input texts.
+            op (Literal["emojifie", "contains_emojis", "find_emojis", "is_emoji"]): The manager method applied to each text.
+            workers (Optional[int]): Number of worker processes. Defaults to the number of CPUs. With 1, texts are processed in the current process.
+            chunksize (int): Number of texts sent to a worker at once. Defaults to 1000.
+            match (Literal["word", "prefix", "substring"]): Match policy of "emojifie". Defaults to "substring".
+            lazy (bool): If True, return a generator producing results as the input is consumed. Defaults to False.
+
+        Returns:
+            list[Any] | Iterator[Any]: The result of the method for each text, in input order.
+
+        Raises:
+            ValueError: If op is not a supported method or chunksize is not positive.
+
+        Example:
+            >>> manager = PymojisManager()
+            >>> manager.process_many(["I'm sleepy", "so sleepy"], "emojifie", workers=4)
+            ["I'm 😪", '🧑 😪']
+
+        ⚠️ On platforms starting processes with "spawn" (Windows, macOS), call it from under an `if __name__ == "__main__":` guard.
+        """
+        results = self.repository.process_many(texts, op, workers, chunksize, match)
+        return results if lazy else list(results)
+
+    def count_emojis(
+        self, texts: Iterable[str], workers: int | None = 1, chunksize: int = 1000
+    ) -> "EmojiCounter":
+        """
+        Count the emojis found in many texts.
+
+        This method scans every text once and accumulates the occurrences of each emoji in a compact array indexed by emoji, without creating an object per occurrence.
+        The returned EmojiCounter gives the top-k emojis and the totals per category and subcategory, and can merge the counters of other calls, such as partial counts from parallel workers.
+
+        Args:
+            texts (Iterable[str]): The texts to scan. A single string is scanned as one text.
+            workers (Optional[int]): Number of worker processes, all CPUs if None. Defaults to 1, which counts in the current process.
+            chunksize (int): Number of texts sent to a worker at once. Defaults to 1000.
+
+        Returns:
+            EmojiCounter: The occurrences of each emoji.
+
+        Example:
+            >>> manager = PymojisManager()
+            >>> counter = manager.count_emojis(["good night 😪", "😪😄"])
+            >>> counter.most_common(1)
+            [(Emoji(name='sleepy face', emoji='😪', ...), 2)]
+            >>> counter.by_category()
+            {'Smileys & Emotion': 3}
+        """
+        return self.repository.count_emojis(texts, workers, chunksize)
 
     def to_html(self, emoji: str) -> str:
         """
@@ -225,4 +623,215 @@ class PymojisManager:
             >>> manager.to_html("😵‍💫")  # This emoji is a composition of multiple Unicode characters
             "&#x1F635;&#x200D;&#x1F4AB;"
         """
-        return self.repository.to_html(emoji)
+        return self._cached("to_html", self.repository.to_html, emoji)
+
+    def to_html_many(
+        self, emojis: Iterable[str], lazy: bool = False
+    ) -> list[str] | Iterator[str]:
+        """
+        Convert many emoji characters to their HTML Unicode representation.
+
+        Batch version of to_html. Emojis of the dataset are read from the entities precomputed with it, others are converted one by one.
+
+        Args:
+            emojis (Iterable[str]): The emoji characters to convert.
+            lazy (bool): If True, return a generator producing results as the input is consumed. Defaults to False.
+
+        Returns:
+            list[str] | Iterator[str]: The HTML representations, in input order.
+
+        Example:
+            >>> manager = PymojisManager()
+            >>> manager.to_html_many(["😪", "😄"])
+            ['&#x1F62A;', '&#x1F604;']
+        """
+        results = self.repository.to_html_many(emojis)
+        return results if lazy else list(results)
+
+    def text_to_html(self, text: str, escape: bool = False) -> str:
+        """
+        Convert the emojis of a text to their HTML Unicode representation.
+
+        This method scans the text once and replaces every emoji it contains with its HTML entities, as to_html would, leaving the rest of the text untouched.
+        It is meant for rendering whole messages, such as chat transcripts, to HTML with a single call.
+
+        Args:
+            text (str): The text to convert.
+            escape (bool): If True, also escape the HTML special characters of the rest of the text. Defaults to False.
+
+        Returns:
+            str: The text with its emojis converted to HTML entities.
+
+        Example:
+            >>> manager = PymojisManager()
+            >>> manager.text_to_html("I'm 😪 <3")
+            "I'm &#x1F62A; <3"
+
+            >>> manager.text_to_html("I'm 😪 <3", escape=True)
+            "I&#x27;m &#x1F62A; &lt;3"
+        """
+        return self.repository.text_to_html(text, escape)
+
+    def strip_emojis(self, text: str) -> str:
+        """
+        Remove every emoji from a text.
+
+        This method scans the text once and drops every emoji of the dataset it contains, including complex emojis composed of multiple Unicode code points.
+        It is meant for cleaning text before indexing or tokenising it.
+
+        Args:
+            text (str): The text to clean.
+
+        Returns:
+            str: The text without its emojis.
+
+        Example:
+            >>> manager = PymojisManager()
+            >>> manager.strip_emojis("good night 😪😵‍💫")
+            'good night '
+        """
+        return self.repository.strip_emojis(text)
+
+    def strip_emojis_stream(self, lines: Iterable[str] | TextIO) -> Iterator[str]:
+        """
+        Remove every emoji, line by line.
+
+        Streaming version of strip_emojis for large files: each line is cleaned as it is read and line breaks are kept.
+
+        Args:
+            lines (Iterable[str] | TextIO): The lines to clean, such as an open text file.
+
+        Returns:
+            Iterator[str]: A generator of cleaned lines, in input order.
+
+        Example:
+            >>> manager = PymojisManager()
+            >>> list(manager.strip_emojis_stream(["hi 😄\\n", "bye 😪"]))
+            ['hi \\n', 'bye ']
+        """
+        return self.repository.strip_emojis_stream(lines)
+
+    def replace_emojis(
+        self, text: str, replacement: str | Callable[[Emoji], str]
+    ) -> str:
+        """
+        Replace every emoji of a text.
+
+        This method scans the text once and replaces every emoji of the dataset it contains, either with a fixed string or with the result of a function called with the matching Emoji.
+
+        Args:
+            text (str): The text to transform.
+            replacement (str | Callable[[Emoji], str]): The replacement string, or a function returning the replacement of an emoji.
+
+        Returns:
+            str: The text with its emojis replaced.
+
+        Example:
+            >>> manager = PymojisManager()
+            >>> manager.replace_emojis("good night 😪", "<emoji>")
+            'good night <emoji>'
+
+            >>> manager.replace_emojis("good night 😪", lambda emoji: emoji.category)
+            'good night Smileys & Emotion'
+        """
+        return self.repository.replace_emojis(text, replacement)
+
+    def replace_emojis_stream(
+        self, lines: Iterable[str] | TextIO, replacement: str | Callable[[Emoji], str]
+    ) -> Iterator[str]:
+        """
+        Replace every emoji, line by line.
+
+        Streaming version of replace_emojis for large files: each line is transformed as it is read and line breaks are kept.
+
+        Args:
+            lines (Iterable[str] | TextIO): The lines to transform, such as an open text file.
+            replacement (str | Callable[[Emoji], str]): The replacement string, or a function returning the replacement of an emoji.
+
+        Returns:
+            Iterator[str]: A generator of transformed lines, in input order.
+
+        Example:
+            >>> manager = PymojisManager()
+            >>> with open("in.txt") as source, open("out.txt", "w") as target:
+            ...     target.writelines(manager.replace_emojis_stream(source, "<emoji>"))
+        """
+        return self.repository.replace_emojis_stream(lines, replacement)
+
+    def demojize(self, text: str) -> str:
+        """
+        Replace every emoji of a text with its short name.
+
+        This method scans the text once and replaces every emoji of the dataset with its name between colons, where spaces become underscores and colons are removed. Emojis sharing a name, such as skin tone variants, are told apart by their skin tones or code points.
+        emojize converts the short names back to emojis.
+
+        Args:
+            text (str): The text to transform.
+
+        Returns:
+            str: The text with its emojis replaced by their short names.
+
+        Example:
+            >>> manager = PymojisManager()
+            >>> manager.demojize("I'm 😪")
+            "I'm :sleepy_face:"
+        """
+        return self.repository.demojize(text)
+
+    def demojize_stream(self, lines: Iterable[str] | TextIO) -> Iterator[str]:
+        """
+        Replace every emoji with its short name, line by line.
+
+        Streaming version of demojize for large files: each line is transformed as it is read and line breaks are kept.
+
+        Args:
+            lines (Iterable[str] | TextIO): The lines to transform, such as an open text file.
+
+        Returns:
+            Iterator[str]: A generator of transformed lines, in input order.
+
+        Example:
+            >>> manager = PymojisManager()
+            >>> with open("in.txt") as source, open("out.txt", "w") as target:
+            ...     target.writelines(manager.demojize_stream(source))
+        """
+        return self.repository.demojize_stream(lines)
+
+    def emojize(self, text: str) -> str:
+        """
+        Replace the short names of a text with their emojis.
+
+        This method is the inverse of demojize: it scans the text once and replaces every short name, such as :sleepy_face:, with its emoji.
+        Short names are matched case-insensitively and unknown ones are left untouched.
+
+        Args:
+            text (str): The text to transform.
+
+        Returns:
+            str: The text with its short names replaced by emojis.
+
+        Example:
+            >>> manager = PymojisManager()
+            >>> manager.emojize("I'm :sleepy_face: :not_an_emoji:")
+            "I'm 😪 :not_an_emoji:"
+        """
+        return self.repository.emojize(text)
+
+    def emojize_stream(self, lines: Iterable[str] | TextIO) -> Iterator[str]:
+        """
+        Replace the short names with their emojis, line by line.
+
+        Streaming version of emojize for large files: each line is transformed as it is read and line breaks are kept.
+
+        Args:
+            lines (Iterable[str] | TextIO): The lines to transform, such as an open text file.
+
+        Returns:
+            Iterator[str]: A generator of transformed lines, in input order.
+
+        Example:
+            >>> manager = PymojisManager()
+            >>> with open("in.txt") as source, open("out.txt", "w") as target:
+            ...     target.writelines(manager.emojize_stream(source))
+        """
+        return self.repository.emojize_stream(lines)
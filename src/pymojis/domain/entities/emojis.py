@@ -1,5 +1,6 @@
-from typing import Literal, get_args
-from uuid import uuid4
+import sys
+from collections.abc import Sequence
+from typing import Any, Literal, NamedTuple, get_args
 
 Categories = Literal[
     "Smileys & Emotion",
@@ -14,25 +15,42 @@ Categories = Literal[
     "Component",
 ]
 
+VALID_CATEGORIES: frozenset[str] = frozenset(get_args(Categories))
+
 
 class Emoji:
+    """
+    Immutable emoji record.
+
+    Codes are stored as a tuple and the category, sub category and code strings
+    are interned, so they are shared by every emoji and every loaded dataset.
+    The id is derived from the code sequence (e.g. "1F635-200D-1F4AB"), which
+    makes it stable across datasets and processes.
+    """
+
+    __slots__ = ("category", "sub_category", "code", "name", "emoji")
+
+    category: str
+    sub_category: str
+    code: tuple[str, ...]
+    name: str
+    emoji: str
+
     def __new__(
         cls,
         category: Categories,
         sub_category: str,
-        code: list[str],
+        code: Sequence[str],
         name: str,
         emoji: str,
     ):
-        valid_categories = get_args(Categories)
-
-        if not isinstance(category, str) or category not in valid_categories:
-            valid_cats = ", ".join(f"'{cat}'" for cat in sorted(valid_categories))
+        if not isinstance(category, str) or category not in VALID_CATEGORIES:
+            valid_cats = ", ".join(f"'{cat}'" for cat in sorted(VALID_CATEGORIES))
             raise ValueError(f"category must be one of: {valid_cats}, got {category!r}")
         if not isinstance(sub_category, str) or not sub_category.strip():
             raise ValueError("Sub category should be a valid non-empty string")
         if (
-            not isinstance(code, list)
+            not isinstance(code, list | tuple)
             or not code
             or not all(isinstance(c, str) and c.strip() for c in code)
         ):
@@ -45,22 +63,82 @@ class Emoji:
         return super().__new__(cls)
 
     def __init__(
-        self, category: str, sub_category: str, code: list[str], name: str, emoji: str
+        self,
+        category: str,
+        sub_category: str,
+        code: Sequence[str],
+        name: str,
+        emoji: str,
     ) -> None:
-        self.id = str(uuid4())
-        self.category = category
-        self.sub_category = sub_category
-        self.code = code
-        self.name = name
-        self.emoji = emoji
+        self._set_fields(category, sub_category, code, name, emoji)
+
+    @classmethod
+    def from_trusted(
+        cls,
+        category: str,
+        sub_category: str,
+        code: Sequence[str],
+        name: str,
+        emoji: str,
+    ) -> "Emoji":
+        """
+        Build an emoji without validating its fields.
+
+        Only meant for data that has already been validated as a whole, such as
+        the packaged datasets. User-supplied data must go through the regular
+        constructor.
+        """
+        instance = object.__new__(cls)
+        instance._set_fields(category, sub_category, code, name, emoji)
+        return instance
+
+    def _set_fields(
+        self,
+        category: str,
+        sub_category: str,
+        code: Sequence[str],
+        name: str,
+        emoji: str,
+    ) -> None:
+        codes = tuple(map(sys.intern, code))
+        object.__setattr__(self, "category", sys.intern(category))
+        object.__setattr__(self, "sub_category", sys.intern(sub_category))
+        object.__setattr__(self, "code", codes)
+        object.__setattr__(self, "name", name)
+        object.__setattr__(self, "emoji", emoji)
+
+    @property
+    def id(self) -> str:
+        return "-".join(self.code).upper()
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        raise AttributeError(f"Emoji is immutable, cannot set {name!r}")
+
+    def __delattr__(self, name: str) -> None:
+        raise AttributeError(f"Emoji is immutable, cannot delete {name!r}")
+
+    def __reduce__(self) -> tuple[Any, tuple[Any, ...]]:
+        # Pickled emojis were validated when first built
+        return (
+            Emoji.from_trusted,
+            (self.category, self.sub_category, self.code, self.name, self.emoji),
+        )
 
     def __eq__(self, other) -> bool:
         if not isinstance(other, Emoji):
             return False
-        return self.id == other.id
+        return self.code == other.code
 
     def __hash__(self) -> int:
-        return hash(self.id)
+        return hash(self.code)
 
     def __repr__(self) -> str:
         return f"Emoji(name={self.name!r}, emoji={self.emoji!r}, code={self.code!r}, category={self.category!r}, sub_category={self.sub_category!r})"
+
+
+class EmojiMatch(NamedTuple):
+    """An emoji occurrence in a text, spanning ``text[start:end]``."""
+
+    start: int
+    end: int
+    emoji: Emoji
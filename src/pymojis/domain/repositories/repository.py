@@ -1,14 +1,31 @@
 from abc import ABC, abstractmethod
-from typing import Literal
+from collections.abc import Callable, Iterable, Iterator, Mapping
+from typing import Literal, Protocol, TextIO
 
-from pymojis.domain.entities.emojis import Categories, Emoji
+from pymojis.domain.entities.emojis import Categories, Emoji, EmojiMatch
+
+
+class EmojiCounts(Protocol):
+    # Occurrences of the emojis of a corpus, as returned by count_emojis
+
+    def __getitem__(self, emoji: str) -> int: ...
+
+    def total(self) -> int: ...
+
+    def items(self) -> Iterator[tuple[Emoji, int]]: ...
+
+    def most_common(self, k: int | None = None) -> list[tuple[Emoji, int]]: ...
+
+    def by_category(self) -> dict[str, int]: ...
+
+    def by_subcategory(self) -> dict[str, int]: ...
 
 
 class PymojisRepository(ABC):
     @abstractmethod
     def get_all(
         self, exclude: Literal["complex"] | list[Categories] | None = None
-    ) -> list[Emoji]:
+    ) -> tuple[Emoji, ...]:
         pass
 
     @abstractmethod
@@ -17,9 +34,19 @@ class PymojisRepository(ABC):
         categories: list[Categories] | None = None,
         length: int = 1,
         exclude: Literal["complex"] | list[Categories] | None = None,
+        weights: Mapping[str, float] | None = None,
     ) -> list[Emoji]:
         pass
 
+    @abstractmethod
+    def iter_random_emojis(
+        self,
+        categories: list[Categories] | None = None,
+        exclude: Literal["complex"] | list[Categories] | None = None,
+        window: int = 0,
+    ) -> Iterator[Emoji]:
+        pass
+
     @abstractmethod
     def get_by_code(self, code: str) -> str | None:
         pass
@@ -28,6 +55,18 @@ class PymojisRepository(ABC):
     def get_by_name(self, name: str) -> str | None:
         pass
 
+    @abstractmethod
+    def get_by_codes(self, codes: Iterable[str]) -> Iterator[str | None]:
+        pass
+
+    @abstractmethod
+    def get_by_names(self, names: Iterable[str]) -> Iterator[str | None]:
+        pass
+
+    @abstractmethod
+    def search(self, query: str, limit: int | None = 10) -> list[Emoji]:
+        pass
+
     @abstractmethod
     def get_by_category(self, category: Categories) -> list[str]:
         pass
@@ -40,14 +79,102 @@ class PymojisRepository(ABC):
     def contains_emojis(self, text: str) -> bool:
         pass
 
+    @abstractmethod
+    def contains_emojis_many(self, texts: Iterable[str]) -> Iterator[bool]:
+        pass
+
+    @abstractmethod
+    def find_emojis(self, text: str) -> list[EmojiMatch]:
+        pass
+
+    @abstractmethod
+    def iter_emojis(self, text: str) -> Iterator[EmojiMatch]:
+        pass
+
+    @abstractmethod
+    def iter_emojis_stream(
+        self, source: Iterable[str] | TextIO
+    ) -> Iterator[EmojiMatch]:
+        pass
+
+    @abstractmethod
+    def contains_emojis_stream(self, source: Iterable[str] | TextIO) -> bool:
+        pass
+
     @abstractmethod
     def is_emoji(self, text: str) -> bool:
         pass
 
     @abstractmethod
-    def emojifie(self, text: str) -> str:
+    def emojifie(
+        self, text: str, match: Literal["word", "prefix", "substring"] = "substring"
+    ) -> str:
+        pass
+
+    @abstractmethod
+    def emojifie_many(
+        self,
+        texts: Iterable[str],
+        match: Literal["word", "prefix", "substring"] = "substring",
+    ) -> Iterator[str]:
+        pass
+
+    @abstractmethod
+    def emojifie_stream(
+        self,
+        lines: Iterable[str] | TextIO,
+        match: Literal["word", "prefix", "substring"] = "substring",
+    ) -> Iterator[str]:
+        pass
+
+    @abstractmethod
+    def count_emojis(self, texts: Iterable[str]) -> EmojiCounts:
         pass
 
     @abstractmethod
     def to_html(self, emoji: str) -> str:
         pass
+
+    @abstractmethod
+    def to_html_many(self, emojis: Iterable[str]) -> Iterator[str]:
+        pass
+
+    @abstractmethod
+    def text_to_html(self, text: str, escape: bool = False) -> str:
+        pass
+
+    @abstractmethod
+    def strip_emojis(self, text: str) -> str:
+        pass
+
+    @abstractmethod
+    def strip_emojis_stream(self, lines: Iterable[str] | TextIO) -> Iterator[str]:
+        pass
+
+    @abstractmethod
+    def replace_emojis(
+        self, text: str, replacement: str | Callable[[Emoji], str]
+    ) -> str:
+        pass
+
+    @abstractmethod
+    def replace_emojis_stream(
+        self, lines: Iterable[str] | TextIO, replacement: str | Callable[[Emoji], str]
+    ) -> Iterator[str]:
+        pass
+
+    @abstractmethod
+    def demojize(self, text: str) -> str:
+        pass
+
+    @abstractmethod
+    def demojize_stream(self, lines: Iterable[str] | TextIO) -> Iterator[str]:
+        pass
+
+    @abstractmethod
+    def emojize(self, text: str) -> str:
+        pass
+
+    @abstractmethod
+    def emojize_stream(self, lines: Iterable[str] | TextIO) -> Iterator[str]:
+        pass
@@ -0,0 +1,25 @@
+"""
+Build the binary snapshots of the packaged emoji datasets.
+
+Run from a source checkout before building the distributions:
+
+    python -m pymojis.infrastructure.data_loader.build_snapshots
+"""
+
+import logging
+
+from .emojis_loader import EmojiDataLoader
+from .file_loader import FileLoader
+
+
+def main() -> None:
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+    logger = logging.getLogger(__name__)
+
+    loader = EmojiDataLoader(file_loader=FileLoader())
+    for path in loader.build_snapshots():
+        logger.info(f"Wrote {path}")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,8 +1,11 @@
 import logging
-from dataclasses import dataclass
-from typing import Any
+from collections.abc import Hashable
+from dataclasses import astuple, dataclass
+from pathlib import Path
+from typing import Any, Literal
 
-from ..exceptions import DatasetNotFoundError
+from ..emoji_dataset import EmojiDataset
+from ..exceptions import DatasetNotFoundError, FileLoadingError
 from .file_loader import FileLoader
 
 
@@ -11,13 +14,29 @@ class DatasetConfig:
     module: str
     filename: str
     dataset_type: str
+    # Prebuilt binary snapshot stored next to the JSON dataset, if any
+    snapshot: str | None = None
+    # "mmap" shares the dataset between processes through a mapped file, built
+    # on first use at mapped_file or in the cache directory of the user
+    storage: Literal["memory", "mmap"] = "memory"
+    mapped_file: str | None = None
 
 
 class EmojiDataLoader:
     # Default dataset configurations in order of preference
     DEFAULT_DATASETS = [
-        DatasetConfig("pymojis.infrastructure.data", "emoji_data.json", "light"),
-        DatasetConfig("pymojis_fulldata.data", "full_emoji_data.json", "full"),
+        DatasetConfig(
+            "pymojis.infrastructure.data",
+            "emoji_data.json",
+            "light",
+            "emoji_data.snapshot",
+        ),
+        DatasetConfig(
+            "pymojis_fulldata.data",
+            "full_emoji_data.json",
+            "full",
+            "full_emoji_data.snapshot",
+        ),
     ]
 
     def __init__(
@@ -41,6 +60,46 @@ class EmojiDataLoader:
         """
         return self.file_loader.load_json_file(path)
 
+    def load_dataset_from_path(self, path: str) -> EmojiDataset:
+        """
+        Load a parsed emoji dataset from custom file path.
+
+        Custom files are not trusted, so every emoji is validated.
+
+        Args:
+            path: File path to emoji data
+
+        Returns:
+            Parsed emoji dataset
+        """
+        return EmojiDataset.from_raw(self.load_from_path(path))
+
+    def path_key(self, path: str) -> Hashable:
+        """
+        Identify the current version of a custom dataset file.
+
+        Args:
+            path: File path to emoji data
+
+        Returns:
+            Key changing whenever the file is modified
+        """
+        validated_path = self.file_loader.validate_path(path)
+        try:
+            stat = validated_path.stat()
+        except OSError as file_error:
+            raise FileLoadingError(f"File not found: {validated_path}") from file_error
+        return ("path", str(validated_path), stat.st_mtime_ns, stat.st_size)
+
+    def default_sources_key(self) -> Hashable:
+        """
+        Identify the default sources, as configured for this loader.
+
+        Returns:
+            Key shared by every loader with the same dataset configurations
+        """
+        return ("default", tuple(astuple(config) for config in self.dataset_configs))
+
     def load_from_default_sources(self) -> dict[str, Any]:
         """
         Load emoji data from default sources with fallback.
@@ -69,3 +128,133 @@ class EmojiDataLoader:
         raise DatasetNotFoundError(
             f"No emoji dataset could be loaded. Last error: {last_error}"
         )
+
+    def load_dataset_from_default_sources(self) -> EmojiDataset:
+        """
+        Load a parsed emoji dataset from default sources with fallback.
+
+        For each dataset, a valid snapshot is preferred over the JSON file.
+
+        Returns:
+            Parsed emoji dataset
+
+        Raises:
+            DatasetNotFoundError: If no dataset can be loaded
+        """
+        last_error = None
+
+        for config in self.dataset_configs:
+            try:
+                source = self.file_loader.read_package_bytes(
+                    config.module, config.filename
+                )
+                if config.storage == "mmap":
+                    return self._load_mapped(config, source)
+                return self._load_in_memory(config, source)
+
+            except Exception as e:
+                self.logger.debug(f"Failed to load {config.dataset_type} dataset: {e}")
+                last_error = e
+                continue
+
+        raise DatasetNotFoundError(
+            f"No emoji dataset could be loaded. Last error: {last_error}"
+        )
+
+    def _load_in_memory(self, config: DatasetConfig, source: bytes) -> EmojiDataset:
+        dataset = self._load_snapshot(config, source)
+        if dataset is None:
+            data = self.file_loader.parse_json_resource(
+                source, config.module, config.filename
+            )
+            dataset = EmojiDataset.from_raw(data, trusted=True)
+            self.logger.info(f"Loaded {config.dataset_type} emoji dataset")
+        return dataset
+
+    def _load_mapped(self, config: DatasetConfig, source: bytes) -> EmojiDataset:
+        # Imported on demand to keep the import of pymojis cheap
+        from ..mapped_dataset import (
+            MappedEmojiDataset,
+            default_mapped_path,
+            write_mapped_dataset,
+        )
+
+        path = (
+            Path(config.mapped_file)
+            if config.mapped_file
+            else default_mapped_path(config.dataset_type, source)
+        )
+        try:
+            dataset: EmojiDataset = MappedEmojiDataset(path, source)
+        except Exception as e:
+            self.logger.info(f"Building mapped {config.dataset_type} dataset: {e}")
+            dataset = self._load_in_memory(config, source)
+            try:
+                write_mapped_dataset(dataset, source, path)
+                dataset = MappedEmojiDataset(path, source)
+            except Exception as mapping_error:
+                # Still the requested dataset, only without sharing it
+                self.logger.warning(
+                    f"Cannot map {config.dataset_type} dataset at {path}, "
+                    f"keeping it in memory: {mapping_error}"
+                )
+                return dataset
+
+        self.logger.info(f"Mapped {config.dataset_type} emoji dataset from {path}")
+        return dataset
+
+    def _load_snapshot(
+        self, config: DatasetConfig, source: bytes
+    ) -> EmojiDataset | None:
+        if not config.snapshot:
+            return None
+
+        from ..metrics import timed
+        from .snapshot import loads_snapshot
+
+        try:
+            snapshot = self.file_loader.read_package_bytes(
+                config.module, config.snapshot
+            )
+            with timed("snapshot_load", source=f"{config.module}/{config.snapshot}"):
+                dataset = loads_snapshot(snapshot, source)
+        except Exception as e:
+            self.logger.debug(f"Ignoring {config.dataset_type} snapshot: {e}")
+            return None
+
+        self.logger.info(f"Loaded {config.dataset_type} emoji dataset from snapshot")
+        return dataset
+
+    def build_snapshots(self) -> list[Path]:
+        """
+        Write a snapshot next to each available dataset that declares one.
+
+        Returns:
+            Paths of the written snapshots
+        """
+        from importlib.resources import files
+
+        from .snapshot import dumps_snapshot
+
+        written = []
+
+        for config in self.dataset_configs:
+            if not config.snapshot:
+                continue
+            try:
+                source = self.file_loader.read_package_bytes(
+                    config.module, config.filename
+                )
+            except Exception as e:
+                self.logger.info(f"Skipping {config.dataset_type} dataset: {e}")
+                continue
+
+            data = self.file_loader.parse_json_resource(
+                source, config.module, config.filename
+            )
+            dataset = EmojiDataset.from_raw(data, trusted=True)
+            path = Path(str(files(config.module).joinpath(config.snapshot)))
+            path.write_bytes(dumps_snapshot(dataset, source))
+            written.append(path)
+
+        return written
@@ -36,13 +36,20 @@ class FileLoader:
             ) from file_error
 
     def load_json_file(self, file_path: str) -> dict[str, Any]:
+        # Metrics are imported on demand, like every module only needed once
+        # a dataset loads, to keep the import of pymojis cheap
+        from ..metrics import timed
+
         validated_path = self.validate_path(file_path)
 
         try:
-            with validated_path.open("r", encoding="utf-8") as f:
-                data = json.load(f)
-                self.logger.info(f"Loaded JSON from: {validated_path}")
-                return data
+            source = str(validated_path)
+            with timed("file_read", source=source):
+                text = validated_path.read_text(encoding="utf-8")
+            with timed("json_decode", source=source):
+                data = json.loads(text)
+            self.logger.info(f"Loaded JSON from: {validated_path}")
+            return data
 
         except FileNotFoundError as file_error:
             raise FileLoadingError(f"File not found: {validated_path}") from file_error
@@ -56,23 +63,38 @@ class FileLoader:
             ) from file_error
 
     def load_json_from_package(self, module: str, filename: str) -> dict[str, Any]:
+        source = self.read_package_bytes(module, filename)
+        data = self.parse_json_resource(source, module, filename)
+        self.logger.info(f"Loaded JSON resource: {module}/{filename}")
+        return data
+
+    def parse_json_resource(
+        self, source: bytes, module: str, filename: str
+    ) -> dict[str, Any]:
+        from ..metrics import timed
+
+        try:
+            with timed("json_decode", source=f"{module}/{filename}"):
+                return json.loads(source)
+
+        except (json.JSONDecodeError, UnicodeDecodeError) as invalid_json:
+            raise FileLoadingError(
+                f"Invalid JSON in resource {module}/{filename}: {invalid_json}"
+            ) from invalid_json
+
+    def read_package_bytes(self, module: str, filename: str) -> bytes:
         try:
             from importlib.resources import files
 
-            resource_path = files(module).joinpath(filename)
-            with resource_path.open("r", encoding="utf-8") as f:
-                data = json.load(f)
-                self.logger.info(f"Loaded JSON resource: {module}/{filename}")
-                return data
+            from ..metrics import timed
+
+            with timed("file_read", source=f"{module}/{filename}"):
+                return files(module).joinpath(filename).read_bytes()
 
         except (ModuleNotFoundError, FileNotFoundError) as file_error:
             raise FileLoadingError(
                 f"Resource not found {module}/{filename}: {file_error}"
             ) from file_error
-        except json.JSONDecodeError as invalid_json:
-            raise FileLoadingError(
-                f"Invalid JSON in resource {module}/{filename}: {invalid_json}"
-            ) from invalid_json
         except Exception as file_error:
             raise FileLoadingError(
                 f"Failed to load resource {module}/{filename}: {file_error}"
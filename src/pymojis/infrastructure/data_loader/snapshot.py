@@ -0,0 +1,138 @@
+"""
+Binary snapshots of parsed emoji datasets.
+
+A snapshot stores the columns of an EmojiDataset, as built-in values in the
+marshal format of the running interpreter, behind a fixed header:
+
+- an 8 bytes magic marker
+- the snapshot format version, bumped whenever the stored values change
+- the SHA-256 digest of the JSON dataset the snapshot was built from
+- the SHA-256 digest of the interpreter version and of the code restoring
+  the columns
+
+Loading a snapshot skips JSON decoding and emoji construction. Lookup
+structures are left out: unpickling them costs more than building the few a
+process needs on first use. A snapshot whose header does not match the
+current format, code or JSON source is rejected, so stale files fall back to
+the JSON dataset.
+
+Snapshots are only read from the package resources they are built into, never
+from user-supplied paths. Build them with:
+
+    python -m pymojis.infrastructure.data_loader.build_snapshots
+"""
+
+import hashlib
+import marshal
+import struct
+import sys
+from array import array
+from functools import cache
+from pathlib import Path
+
+from .. import emoji_columns
+from ..emoji_columns import EmojiColumns, PackedStrings
+from ..emoji_dataset import EmojiDataset
+from ..exceptions import SnapshotError
+
+SNAPSHOT_MAGIC = b"PYMOJIS\x00"
+SNAPSHOT_FORMAT_VERSION = 3
+
+_HEADER = struct.Struct(">8sH32s32s")
+
+
+@cache
+def _code_digest() -> bytes:
+    # Any change to the code restoring the columns, or to the marshal format,
+    # invalidates the snapshots built before it, even without a format bump
+    digest = hashlib.sha256(sys.version.encode())
+    for module_file in (emoji_columns.__file__, __file__):
+        digest.update(Path(module_file).read_bytes())
+    return digest.digest()
+
+
+def dumps_snapshot(dataset: EmojiDataset, source: bytes) -> bytes:
+    columns = dataset.columns
+    header = _HEADER.pack(
+        SNAPSHOT_MAGIC,
+        SNAPSHOT_FORMAT_VERSION,
+        hashlib.sha256(source).digest(),
+        _code_digest(),
+    )
+    values = (
+        tuple(columns.names),
+        tuple(columns.glyphs),
+        tuple(columns.codes),
+        bytes(array("B", columns.categories)),
+        array("H", columns.sub_categories).tobytes(),
+        tuple(columns.category_names),
+        tuple(columns.sub_category_names),
+        bytes(columns.complex_flags),
+    )
+    return header + marshal.dumps(values)
+
+
+def loads_snapshot(snapshot: bytes, source: bytes) -> EmojiDataset:
+    """
+    Restore a dataset from a snapshot built from ``source``.
+
+    Raises:
+        SnapshotError: If the header does not match the format, the code or
+            the source
+    """
+    if len(snapshot) < _HEADER.size:
+        raise SnapshotError("Snapshot is truncated")
+
+    magic, version, digest, code_digest = _HEADER.unpack_from(snapshot)
+    if magic != SNAPSHOT_MAGIC:
+        raise SnapshotError("Not a pymojis dataset snapshot")
+    if version != SNAPSHOT_FORMAT_VERSION:
+        raise SnapshotError(
+            f"Snapshot format {version} is not supported, "
+            f"expected {SNAPSHOT_FORMAT_VERSION}"
+        )
+    if code_digest != _code_digest():
+        raise SnapshotError("Snapshot was built by another version of pymojis")
+    if digest != hashlib.sha256(source).digest():
+        raise SnapshotError("Snapshot was built from a different dataset")
+
+    try:
+        values = marshal.loads(snapshot[_HEADER.size :])
+        (
+            names,
+            glyphs,
+            codes,
+            categories,
+            sub_categories,
+            category_names,
+            sub_category_names,
+            complex_flags,
+        ) = values
+        sub_category_ids = array("H")
+        sub_category_ids.frombytes(sub_categories)
+    except (EOFError, TypeError, ValueError) as invalid_values:
+        raise SnapshotError(
+            "Snapshot does not contain emoji columns"
+        ) from invalid_values
+    if (
+        not len(names)
+        == len(glyphs)
+        == len(codes)
+        == len(categories)
+        == len(sub_category_ids)
+        == len(complex_flags)
+    ):
+        raise SnapshotError("Snapshot columns differ in length")
+
+    return EmojiDataset.from_columns(
+        EmojiColumns(
+            names,
+            glyphs,
+            PackedStrings(codes),
+            categories,
+            sub_category_ids,
+            category_names,
+            sub_category_names,
+            complex_flags,
+        )
+    )
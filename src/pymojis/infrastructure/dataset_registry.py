@@ -0,0 +1,92 @@
+import logging
+import threading
+from collections.abc import Callable, Hashable
+
+from .emoji_dataset import EmojiDataset
+
+
+class DatasetRegistry:
+    """
+    Thread-safe cache of loaded datasets, keyed by their source.
+
+    Datasets are immutable once built, so every repository asking for the same
+    source shares one instance instead of parsing the data again. Loads of
+    different sources run concurrently, while concurrent loads of the same
+    source are collapsed into one.
+    """
+
+    def __init__(self) -> None:
+        self.logger = logging.getLogger(__name__)
+        self._datasets: dict[Hashable, EmojiDataset] = {}
+        self._loading: dict[Hashable, threading.Lock] = {}
+        self._lock = threading.Lock()
+
+    def get_or_load(
+        self, key: Hashable, load: Callable[[], EmojiDataset]
+    ) -> EmojiDataset:
+        """
+        Return the dataset registered for ``key``, loading it on first use.
+
+        Args:
+            key: Identifier of the dataset source
+            load: Called to build the dataset when it is not registered yet
+
+        Returns:
+            The shared dataset
+        """
+        with self._lock:
+            dataset = self._datasets.get(key)
+            if dataset is not None:
+                return dataset
+            key_lock = self._loading.setdefault(key, threading.Lock())
+
+        with key_lock:
+            with self._lock:
+                dataset = self._datasets.get(key)
+            if dataset is not None:
+                return dataset
+            try:
+                dataset = load()
+                with self._lock:
+                    self._datasets[key] = dataset
+            finally:
+                with self._lock:
+                    self._loading.pop(key, None)
+
+        self.logger.info(f"Registered dataset {key!r}")
+        return dataset
+
+    def reload(self, key: Hashable, load: Callable[[], EmojiDataset]) -> EmojiDataset:
+        """
+        Load the dataset for ``key`` again and register it in place of the
+        previous one. Repositories already holding the previous dataset keep it
+        until they reload.
+        """
+        dataset = load()
+        with self._lock:
+            self._datasets[key] = dataset
+        self.logger.info(f"Reloaded dataset {key!r}")
+        return dataset
+
+    def invalidate(self, key: Hashable | None = None) -> None:
+        """
+        Forget the dataset registered for ``key``, or every dataset if no key
+        is given, so that the next request loads it from its source.
+        """
+        with self._lock:
+            if key is None:
+                self._datasets.clear()
+            else:
+                self._datasets.pop(key, None)
+
+    def __contains__(self, key: Hashable) -> bool:
+        with self._lock:
+            return key in self._datasets
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._datasets)
+
+
+# Registry shared by every repository of the process unless told otherwise
+default_registry = DatasetRegistry()
@@ -0,0 +1,292 @@
+"""
+Column-oriented storage of the emojis of a dataset.
+
+Each emoji is identified by its dense ordinal. Code sequences are packed into
+a single string, categories and sub categories are small integer codes, and
+whether an emoji is complex is a byte flag. The memory-mapped dataset also
+packs names and glyphs, into its file. Filters are
+computed as masks holding one byte per ordinal, combined as big integers, so a
+filter over the whole dataset costs a few C-level operations instead of a
+Python loop over Emoji objects, which are only built when asked for.
+"""
+
+from array import array
+from collections.abc import Hashable, Iterable, Iterator, Sequence
+from functools import cached_property
+from itertools import compress
+from typing import Any, overload
+
+from pymojis.domain.entities.emojis import Emoji
+
+from .exceptions import InfrastructureError
+
+# Separates the code points of a sequence in the codes column
+CODE_SEPARATOR = " "
+
+
+class PackedStrings(Sequence[str]):
+    """Strings stored back to back in a single string, sliced on access."""
+
+    def __init__(self, values: Iterable[str]):
+        parts: list[str] = []
+        offsets = array("I", [0])
+        end = 0
+        for value in values:
+            parts.append(value)
+            end += len(value)
+            offsets.append(end)
+        self._blob = "".join(parts)
+        self._offsets = offsets
+
+    def __len__(self) -> int:
+        return len(self._offsets) - 1
+
+    @overload
+    def __getitem__(self, index: int) -> str: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> list[str]: ...
+
+    def __getitem__(self, index: int | slice) -> str | list[str]:
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+        if index < 0:
+            index += len(self)
+        offsets = self._offsets
+        if not 0 <= index < len(offsets) - 1:
+            raise IndexError("PackedStrings index out of range")
+        return self._blob[offsets[index] : offsets[index + 1]]
+
+    def __iter__(self) -> Iterator[str]:
+        offsets = self._offsets
+        return map(self._blob.__getitem__, map(slice, offsets, offsets[1:]))
+
+
+class LazyEmojis(Sequence[Emoji]):
+    """Emojis of a columnar dataset, built on first access then cached."""
+
+    def __init__(self, columns: "EmojiColumns"):
+        self._columns = columns
+        self._cache: list[Emoji | None] = [None] * len(columns)
+
+    def __len__(self) -> int:
+        return len(self._cache)
+
+    @overload
+    def __getitem__(self, index: int) -> Emoji: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> list[Emoji]: ...
+
+    def __getitem__(self, index: int | slice) -> Emoji | list[Emoji]:
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+        emoji = self._cache[index]
+        if emoji is None:
+            emoji = self._columns.build_emoji(index % len(self._cache))
+            self._cache[index] = emoji
+        return emoji
+
+    def __eq__(self, other: object) -> bool:
+        # Equal to any sequence of the same emojis, such as the tuple of a
+        # dataset built from Emoji objects
+        if not isinstance(other, Sequence) or isinstance(other, str):
+            return NotImplemented
+        return len(self) == len(other) and all(
+            mine == theirs for mine, theirs in zip(self, other, strict=True)
+        )
+
+
+class EmojiColumns:
+    """
+    Emojis of a dataset stored as columns indexed by ordinal.
+
+    Columns are plain sequences, so the same class serves in-memory datasets
+    and the memory-mapped one, whose columns are views over its file.
+    """
+
+    def __init__(
+        self,
+        names: Sequence[str],
+        glyphs: Sequence[str],
+        codes: Sequence[str],
+        categories: Sequence[int],
+        sub_categories: Sequence[int],
+        category_names: Sequence[str],
+        sub_category_names: Sequence[str],
+        complex_flags: bytes,
+    ):
+        self.names = names
+        self.glyphs = glyphs
+        # Code points of each emoji, joined with CODE_SEPARATOR
+        self.codes = codes
+        self.categories = categories
+        self.sub_categories = sub_categories
+        self.category_names = category_names
+        self.sub_category_names = sub_category_names
+        # 1 for emojis made of several code points
+        self.complex_flags = complex_flags
+
+    @classmethod
+    def from_records(
+        cls, records: Iterable[tuple[str, str, Sequence[str], str, str]]
+    ) -> "EmojiColumns":
+        """
+        Build columns from ``(category, sub_category, code, name, emoji)``
+        records, in ordinal order.
+        """
+        names: list[str] = []
+        glyphs: list[str] = []
+        codes: list[str] = []
+        categories = array("B")
+        sub_categories = array("H")
+        category_ids: dict[str, int] = {}
+        sub_category_ids: dict[str, int] = {}
+        complex_flags = bytearray()
+
+        for category, sub_category, code, name, emoji in records:
+            names.append(name)
+            glyphs.append(emoji)
+            codes.append(CODE_SEPARATOR.join(code))
+            categories.append(category_ids.setdefault(category, len(category_ids)))
+            sub_categories.append(
+                sub_category_ids.setdefault(sub_category, len(sub_category_ids))
+            )
+            complex_flags.append(len(code) > 1)
+
+        # Names and glyphs stay separate strings, shared with the indexes
+        # keyed on them instead of copied out of a packed table
+        return cls(
+            tuple(names),
+            tuple(glyphs),
+            PackedStrings(codes),
+            categories,
+            sub_categories,
+            tuple(category_ids),
+            tuple(sub_category_ids),
+            bytes(complex_flags),
+        )
+
+    @classmethod
+    def from_emojis(cls, emojis: Iterable[Emoji]) -> "EmojiColumns":
+        return cls.from_records(
+            (emoji.category, emoji.sub_category, emoji.code, emoji.name, emoji.emoji)
+            for emoji in emojis
+        )
+
+    def __len__(self) -> int:
+        return len(self.complex_flags)
+
+    def category(self, ordinal: int) -> str:
+        return self.category_names[self.categories[ordinal]]
+
+    def build_emoji(self, ordinal: int) -> Emoji:
+        return Emoji.from_trusted(
+            self.category(ordinal),
+            self.sub_category_names[self.sub_categories[ordinal]],
+            self.codes[ordinal].split(CODE_SEPARATOR),
+            self.names[ordinal],
+            self.glyphs[ordinal],
+        )
+
+    # Masks are handled as integers holding one byte per ordinal, 0 or 1, so
+    # that they combine with integer bitwise operators
+
+    @cached_property
+    def _all_bits(self) -> int:
+        return int.from_bytes(b"\x01" * len(self))
+
+    @cached_property
+    def _complex_bits(self) -> int:
+        return int.from_bytes(self.complex_flags)
+
+    @cached_property
+    def _category_bits(self) -> dict[str, int]:
+        masks: dict[int, bytearray] = {}
+        for ordinal, category in enumerate(self.categories):
+            masks.setdefault(category, bytearray(len(self)))[ordinal] = 1
+        return {
+            self.category_names[category].casefold(): int.from_bytes(mask)
+            for category, mask in masks.items()
+        }
+
+    def _categories_bits(self, names: Iterable[str]) -> int:
+        bits = 0
+        for name in names:
+            bits |= self._category_bits.get(name.casefold(), 0)
+        return bits
+
+    def filter_key(
+        self,
+        categories: Iterable[str] | None = None,
+        exclude: Iterable[str] | str | None = None,
+    ) -> Hashable:
+        """
+        Return a normalised form of the filters of mask: filters with equal
+        keys select the same emojis.
+        """
+        known = self._category_bits
+
+        def names(values: Iterable[str]) -> frozenset[str]:
+            return frozenset(name.casefold() for name in values).intersection(known)
+
+        if exclude == "complex":
+            excluded: Hashable = "complex"
+        elif exclude and not isinstance(exclude, str):
+            excluded = names(exclude)
+        else:
+            excluded = frozenset()
+        return (None if categories is None else names(categories), excluded)
+
+    def mask(
+        self,
+        categories: Iterable[str] | None = None,
+        exclude: Iterable[str] | str | None = None,
+    ) -> bytes:
+        """
+        Return one byte per ordinal, 1 for the emojis passing the filters.
+
+        Args:
+            categories: Keep emojis of these categories only, all if None
+            exclude: "complex" to drop emojis made of several code points, or
+                categories to drop
+
+        Category names are compared case-insensitively, unknown ones are
+        ignored.
+        """
+        bits = self._all_bits
+        if categories is not None:
+            bits &= self._categories_bits(categories)
+        if exclude == "complex":
+            bits &= self._all_bits ^ self._complex_bits
+        elif exclude and not isinstance(exclude, str):
+            bits &= self._all_bits ^ self._categories_bits(exclude)
+        return bits.to_bytes(len(self))
+
+    def ordinals(
+        self,
+        categories: Iterable[str] | None = None,
+        exclude: Iterable[str] | str | None = None,
+    ) -> Iterator[int]:
+        """Yield the ordinals passing the filters of mask, in order."""
+        return compress(range(len(self)), self.mask(categories, exclude))
+
+    def numpy_mask(
+        self,
+        categories: Iterable[str] | None = None,
+        exclude: Iterable[str] | str | None = None,
+    ) -> Any:
+        """
+        Return the mask of the filters as a read-only NumPy boolean array.
+
+        Raises:
+            InfrastructureError: If NumPy is not installed
+        """
+        # NumPy is optional, only callers of this method need it
+        try:
+            import numpy
+        except ImportError as missing:
+            raise InfrastructureError(
+                "NumPy masks require NumPy, install it with: pip install pymojis[numpy]"
+            ) from missing
+        return numpy.frombuffer(self.mask(categories, exclude), dtype=numpy.bool_)
@@ -0,0 +1,98 @@
+import heapq
+from array import array
+from collections.abc import Iterable, Iterator, Sequence
+
+from pymojis.domain.entities.emojis import Emoji
+
+from .emoji_dataset import EmojiDataset
+
+
+class EmojiCounter:
+    """
+    Occurrences of the emojis of a dataset, counted by ordinal.
+
+    Counts are kept in a single array holding one unsigned 64-bit integer per
+    emoji of the dataset, so counting creates no object per occurrence and
+    rollups only visit the emojis seen. Partial counts, such as those of worker
+    processes, are exchanged as their ``counts`` array, which pickles to a few
+    kilobytes, and combined with merge.
+    """
+
+    def __init__(self, dataset: EmojiDataset, counts: Sequence[int] | None = None):
+        self.dataset = dataset
+        self.counts = array("Q", bytes(8 * len(dataset)))
+        if counts is not None:
+            self.merge(counts)
+
+    def update(self, texts: Iterable[str]) -> None:
+        """Count the emojis found in ``texts``."""
+        counts = self.counts
+        iter_matches = self.dataset.scanner.iter_matches
+        for text in texts:
+            for _, _, ordinal in iter_matches(text):
+                counts[ordinal] += 1
+
+    def merge(self, other: "EmojiCounter | Sequence[int]") -> None:
+        """
+        Add the counts of another counter, or a counts array, built over the
+        same dataset.
+        """
+        counts = other.counts if isinstance(other, EmojiCounter) else other
+        if len(counts) != len(self.counts):
+            raise ValueError(
+                f"Cannot merge counts of {len(counts)} emojis into a counter "
+                f"of {len(self.counts)} emojis"
+            )
+        mine = self.counts
+        for ordinal, count in enumerate(counts):
+            if count:
+                mine[ordinal] += count
+
+    def __getitem__(self, emoji: str) -> int:
+        # Any spelling the scanner recognises, with or without U+FE0F
+        match = self.dataset.scanner.match_at(emoji, 0) if emoji else None
+        if match is None or match[0] != len(emoji):
+            return 0
+        return self.counts[match[1]]
+
+    def total(self) -> int:
+        return sum(self.counts)
+
+    def items(self) -> Iterator[tuple[Emoji, int]]:
+        """Yield ``(emoji, count)`` for every emoji seen, in dataset order."""
+        emojis = self.dataset.emojis
+        for ordinal, count in enumerate(self.counts):
+            if count:
+                yield emojis[ordinal], count
+
+    def most_common(self, k: int | None = None) -> list[tuple[Emoji, int]]:
+        """
+        Return the ``k`` most frequent emojis with their counts, or every
+        emoji seen if ``k`` is None. Ties keep the dataset order.
+        """
+        seen = [(ordinal, count) for ordinal, count in enumerate(self.counts) if count]
+        if k is None:
+            seen.sort(key=lambda item: item[1], reverse=True)
+        else:
+            seen = heapq.nlargest(k, seen, key=lambda item: item[1])
+        emojis = self.dataset.emojis
+        return [(emojis[ordinal], count) for ordinal, count in seen]
+
+    def by_category(self) -> dict[str, int]:
+        """Return the number of occurrences per category, for categories seen."""
+        columns = self.dataset.columns
+        return self._rollup(columns.categories, columns.category_names)
+
+    def by_subcategory(self) -> dict[str, int]:
+        """Return the number of occurrences per subcategory, for subcategories seen."""
+        columns = self.dataset.columns
+        return self._rollup(columns.sub_categories, columns.sub_category_names)
+
+    def _rollup(self, ids: Sequence[int], names: Sequence[str]) -> dict[str, int]:
+        # Summed by column id and named last, so no emoji is materialised
+        totals: dict[int, int] = {}
+        for ordinal, count in enumerate(self.counts):
+            if count:
+                group = ids[ordinal]
+                totals[group] = totals.get(group, 0) + count
+        return {names[group]: count for group, count in totals.items()}
@@ -0,0 +1,343 @@
+import logging
+import time
+from collections.abc import Hashable, Iterable, Iterator, Mapping, Sequence
+from contextlib import contextmanager
+from functools import cached_property
+from typing import TYPE_CHECKING, Any, cast
+
+from pymojis.domain.entities.emojis import Categories, Emoji
+
+from .emoji_columns import EmojiColumns, LazyEmojis
+from .exceptions import InfrastructureError
+from .utils import html_entities, is_valid_dataset
+
+if TYPE_CHECKING:
+    from .emoji_scanner import EmojiScanner
+    from .name_index import EmojiNameIndex
+    from .random_pools import Exclude, RandomPools
+    from .search_index import EmojiSearchIndex
+
+logger = logging.getLogger(__name__)
+
+_INDEXES = (
+    "code_index",
+    "name_index",
+    "glyph_index",
+    "category_index",
+    "scanner",
+    "word_index",
+    "random_pools",
+    "html_index",
+    "aliases",
+    "alias_index",
+    "search_index",
+)
+
+# Bounds the memoised selections, one per combination of excluded categories
+_MAX_SELECTIONS = 64
+# Names of the skin tone modifiers, as they end the names of the emojis
+_SKIN_TONES = {
+    "\U0001f3fb": "light skin tone",
+    "\U0001f3fc": "medium-light skin tone",
+    "\U0001f3fd": "medium skin tone",
+    "\U0001f3fe": "medium-dark skin tone",
+    "\U0001f3ff": "dark skin tone",
+}
+
+
+def _alias(name: str) -> str:
+    return f":{name.replace(':', '').replace(' ', '_')}:"
+
+
+@contextmanager
+def _timed(index: str, dataset: "EmojiDataset") -> Iterator[None]:
+    from .metrics import emit
+
+    start = time.perf_counter()
+    yield
+    elapsed = time.perf_counter() - start
+    emit("timing", "index_build", elapsed, index=index.replace(" ", "_"))
+    logger.info(f"Built {index} for {len(dataset)} emojis in {elapsed * 1000:.2f} ms")
+
+
+class EmojiDataset:
+    """
+    Parsed emojis together with the lookup structures built from them.
+
+    A dataset is never modified once built, so a single instance can back
+    several repositories and be pickled for worker processes. Emojis are
+    stored as columns, from which every lookup structure is built on first
+    use; those already built are kept when pickling, while snapshots only
+    store the columns. Datasets built from columns only create Emoji objects
+    when they are accessed.
+    """
+
+    def __init__(self, emojis: Iterable[Emoji]):
+        self.emojis: Sequence[Emoji] = tuple(emojis)
+
+    @classmethod
+    def from_columns(cls, columns: EmojiColumns) -> "EmojiDataset":
+        dataset = cls.__new__(cls)
+        dataset.emojis = LazyEmojis(columns)
+        dataset.columns = columns
+        return dataset
+
+    def __len__(self) -> int:
+        return len(self.emojis)
+
+    @cached_property
+    def columns(self) -> EmojiColumns:
+        with _timed("columns", self):
+            return EmojiColumns.from_emojis(self.emojis)
+
+    # Each lookup structure is built on first use, so callers only pay for the
+    # ones they need, and the modules of the larger ones are only imported
+    # then. First occurrence wins, matching the order of the former linear
+    # scans.
+
+    @cached_property
+    def code_index(self) -> Mapping[str, str]:
+        columns = self.columns
+        with _timed("code index", self):
+            index: dict[str, str] = {}
+            for code, glyph, is_complex in zip(
+                columns.codes, columns.glyphs, columns.complex_flags, strict=True
+            ):
+                if not is_complex:
+                    index.setdefault(code.casefold(), glyph)
+            return index
+
+    @cached_property
+    def name_index(self) -> Mapping[str, str]:
+        columns = self.columns
+        with _timed("name index", self):
+            index: dict[str, str] = {}
+            for name, glyph in zip(columns.names, columns.glyphs, strict=True):
+                index.setdefault(name.casefold(), glyph)
+            return index
+
+    @cached_property
+    def glyph_index(self) -> Mapping[str, int]:
+        glyphs = self.columns.glyphs
+        with _timed("glyph index", self):
+            index: dict[str, int] = {}
+            for ordinal, glyph in enumerate(glyphs):
+                index.setdefault(glyph, ordinal)
+            return index
+
+    @cached_property
+    def category_index(self) -> Mapping[str, tuple[str, ...]]:
+        columns = self.columns
+        with _timed("category index", self):
+            groups: dict[int, list[str]] = {}
+            for category, glyph in zip(columns.categories, columns.glyphs, strict=True):
+                groups.setdefault(category, []).append(glyph)
+            return {
+                columns.category_names[category].casefold(): tuple(glyphs)
+                for category, glyphs in groups.items()
+            }
+
+    @cached_property
+    def scanner(self) -> "EmojiScanner":
+        from .emoji_scanner import EmojiScanner
+
+        glyphs = self.columns.glyphs
+        with _timed("scanner", self):
+            return EmojiScanner(glyphs)
+
+    @cached_property
+    def word_index(self) -> "EmojiNameIndex":
+        from .name_index import EmojiNameIndex
+
+        names = self.columns.names
+        with _timed("word index", self):
+            return EmojiNameIndex(names)
+
+    @cached_property
+    def random_pools(self) -> "RandomPools":
+        from .random_pools import RandomPools
+
+        columns = self.columns
+        with _timed("random pools", self):
+            return RandomPools(
+                map(columns.category, range(len(columns))), columns.complex_flags
+            )
+
+    @cached_property
+    def html_index(self) -> Mapping[str, str]:
+        glyphs = self.columns.glyphs
+        with _timed("html index", self):
+            return {glyph: html_entities(glyph) for glyph in glyphs}
+
+    @cached_property
+    def aliases(self) -> Sequence[str]:
+        # Short name of each emoji, such as :grinning_face:, by ordinal. Names
+        # shared by several emojis, such as skin tone variants, are completed
+        # for all but the first one with their skin tones, else their code
+        # points, so that every alias emojizes back to its own emoji
+        columns = self.columns
+        with _timed("aliases", self):
+            aliases: list[str] = []
+            taken: set[str] = set()
+            for name, glyph in zip(columns.names, columns.glyphs, strict=True):
+                alias = _alias(name)
+                if alias.casefold() in taken:
+                    tones = [_SKIN_TONES[char] for char in glyph if char in _SKIN_TONES]
+                    alias = _alias(f"{name}: {', '.join(tones)}")
+                if alias.casefold() in taken:
+                    codes = " ".join(f"{ord(char):X}" for char in glyph)
+                    alias = _alias(f"{name} {codes}")
+                taken.add(alias.casefold())
+                aliases.append(alias)
+            return tuple(aliases)
+
+    @cached_property
+    def alias_index(self) -> Mapping[str, str]:
+        columns = self.columns
+        aliases = self.aliases
+        with _timed("alias index", self):
+            index: dict[str, str] = {}
+            for alias, glyph in zip(aliases, columns.glyphs, strict=True):
+                index.setdefault(alias.casefold(), glyph)
+            return index
+
+    @cached_property
+    def search_index(self) -> "EmojiSearchIndex":
+        from .search_index import EmojiSearchIndex
+
+        columns = self.columns
+        with _timed("search index", self):
+            return EmojiSearchIndex(
+                columns.names,
+                (columns.sub_category_names[code] for code in columns.sub_categories),
+            )
+
+    @cached_property
+    def _selections(self) -> dict[Hashable, tuple[Emoji, ...]]:
+        return {}
+
+    def select(self, exclude: "Exclude" = None) -> tuple[Emoji, ...]:
+        """
+        Return the emojis passing an exclude filter of get_all.
+
+        Results are memoised per normalised filter, so repeated listings
+        return the same tuple without scanning or copying.
+        """
+        columns = self.columns
+        key = columns.filter_key(exclude=exclude)
+        selection = self._selections.get(key)
+        if selection is None:
+            emojis = self.emojis
+            selection = tuple(
+                emojis[ordinal] for ordinal in columns.ordinals(exclude=exclude)
+            )
+            if len(self._selections) >= _MAX_SELECTIONS:
+                self._selections.clear()
+            self._selections[key] = selection
+        return selection
+
+    def warmup(self, indexes: Iterable[str] = _INDEXES) -> None:
+        """
+        Build lookup structures now instead of on first use, all of them by
+        default.
+        """
+        for name in indexes:
+            getattr(self, name)
+
+    @classmethod
+    def from_raw(cls, data: dict[str, Any], trusted: bool = False) -> "EmojiDataset":
+        """
+        Build a dataset from raw emoji data.
+
+        Args:
+            data: Raw emoji data dictionary, as stored in the JSON datasets
+            trusted: Whether the data comes from a packaged dataset. Trusted data
+                is validated once as a whole instead of emoji by emoji.
+
+        Returns:
+            The parsed dataset
+        """
+        from .metrics import emit, timed
+
+        emojis_data = data.get("emojis", {})
+        if not isinstance(emojis_data, dict):
+            raise InfrastructureError(
+                "Invalid data structure: 'emojis' must be a dictionary"
+            )
+
+        with timed("entity_parse"):
+            if trusted and is_valid_dataset(emojis_data):
+                # Valid data goes straight to columns, emojis are built on access
+                dataset = cls.from_columns(_create_trusted_columns(emojis_data))
+            else:
+                if trusted:
+                    emit("count", "validation_fallbacks", 1)
+                    logger.warning(
+                        "Dataset failed validation, validating emojis one by one"
+                    )
+                dataset = cls(_create_validated_emojis(emojis_data))
+
+        logger.debug(f"Parsed {len(dataset)} emojis successfully")
+        return dataset
+
+
+def _create_trusted_columns(emojis_data: dict[str, Any]) -> EmojiColumns:
+    return EmojiColumns.from_records(
+        (
+            category,
+            subcategory,
+            emoji_data["code"],
+            emoji_data["name"],
+            emoji_data["emoji"],
+        )
+        for category, subcategories in emojis_data.items()
+        for subcategory, emojis_list in subcategories.items()
+        for emoji_data in emojis_list
+    )
+
+
+def _create_validated_emojis(emojis_data: dict[str, Any]) -> list[Emoji]:
+    from .metrics import emit
+
+    parsed_emojis = []
+
+    for category, subcategories in emojis_data.items():
+        if not isinstance(subcategories, dict):
+            logger.warning(f"Skipping invalid category '{category}'")
+            emit("count", "skipped_records", 1, record="category")
+            continue
+
+        for subcategory, emojis_list in subcategories.items():
+            if not isinstance(emojis_list, list):
+                logger.warning(f"Skipping invalid subcategory '{subcategory}'")
+                emit("count", "skipped_records", 1, record="subcategory")
+                continue
+
+            for emoji_data in emojis_list:
+                try:
+                    # Emoji rejects unknown categories, skipping their emojis
+                    emoji = _create_emoji_from_data(
+                        cast(Categories, category), subcategory, emoji_data
+                    )
+                    parsed_emojis.append(emoji)
+                except Exception as invalid_emoji:
+                    logger.warning(f"Skipping invalid emoji: {invalid_emoji}")
+                    emit("count", "skipped_records", 1, record="emoji")
+                    continue
+
+    return parsed_emojis
+
+
+def _create_emoji_from_data(
+    category: Categories, subcategory: str, emoji_data: dict[str, Any]
+) -> Emoji:
+    if not isinstance(emoji_data, dict):
+        raise ValueError("Emoji data must be a dictionary")
+
+    return Emoji(
+        category=category,
+        sub_category=subcategory,
+        name=emoji_data.get("name", ""),
+        code=emoji_data.get("code", ""),
+        emoji=emoji_data.get("emoji", ""),
+    )
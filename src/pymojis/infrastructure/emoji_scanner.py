@@ -0,0 +1,170 @@
+import re
+from collections.abc import Iterable, Iterator
+from typing import Any
+
+VARIATION_SELECTOR_16 = "\ufe0f"
+
+# Key marking a trie node that completes a glyph. Text characters are never
+# empty strings, so it cannot collide with a child node.
+_TERMINAL = ""
+
+
+class EmojiScanner:
+    """
+    Codepoint trie compiled once from the emoji glyphs of a dataset.
+
+    Each glyph is identified by its position (ordinal) in the iterable used to
+    build the scanner. Text is scanned in a single pass: a precompiled character
+    class skips quickly to candidate positions, then the trie resolves the
+    longest glyph starting there, so ZWJ sequences, skin tones and flags are
+    reported as one match instead of their components.
+
+    The emoji presentation selector (U+FE0F) is treated as optional: text that
+    carries or omits it still matches the dataset glyph, and a trailing selector
+    is included in the match span.
+    """
+
+    def __init__(self, glyphs: Iterable[str]):
+        self._root: dict[str, Any] = {}
+        self.max_length = 0
+
+        for ordinal, glyph in enumerate(glyphs):
+            self._insert(glyph, ordinal)
+            stripped = glyph.replace(VARIATION_SELECTOR_16, "")
+            if stripped and stripped != glyph:
+                self._insert(stripped, ordinal)
+
+        # The regex engine tests characters outside the BMP against a class
+        # one by one, which is slow for the hundreds of emoji starts. Every
+        # supplementary character is a candidate instead: they are rare in
+        # text besides emojis, and the trie rejects the others.
+        first_chars = "".join(
+            re.escape(char) for char in self._root if ord(char) <= 0xFFFF
+        )
+        if any(ord(char) > 0xFFFF for char in self._root):
+            first_chars += "\U00010000-\U0010ffff"
+        self._first_char_pattern = re.compile(
+            f"[{first_chars}]" if first_chars else "(?!)"
+        )
+
+    def _insert(self, glyph: str, ordinal: int) -> None:
+        node = self._root
+        for char in glyph:
+            node = node.setdefault(char, {})
+        # Keep the first glyph registered for a key, like the lookup indexes
+        node.setdefault(_TERMINAL, ordinal)
+        self.max_length = max(self.max_length, len(glyph))
+
+    def match_at(self, text: str, start: int) -> tuple[int, int] | None:
+        """
+        Return ``(end, ordinal)`` for the longest glyph starting at ``start``.
+        """
+        return self._walk(text, start)[0]
+
+    def _walk(self, text: str, start: int) -> tuple[tuple[int, int] | None, bool]:
+        # Also tells whether the walk reached the end of the text, in which
+        # case more text could still extend the match
+        node = self._root.get(text[start])
+        if node is None:
+            return None, False
+
+        index = start + 1
+        length = len(text)
+        best: tuple[int, int] | None = None
+        while True:
+            ordinal = node.get(_TERMINAL)
+            if ordinal is not None:
+                best = (index, ordinal)
+            if index >= length:
+                return best, True
+            char = text[index]
+            child = node.get(char)
+            if child is None:
+                if char == VARIATION_SELECTOR_16:
+                    index += 1
+                    continue
+                return best, False
+            node = child
+            index += 1
+
+    def iter_matches(self, text: str) -> Iterator[tuple[int, int, int]]:
+        """
+        Yield ``(start, end, ordinal)`` for every glyph found in ``text``.
+        """
+        search = self._first_char_pattern.search
+        position = 0
+        while True:
+            candidate = search(text, position)
+            if candidate is None:
+                return
+            start = candidate.start()
+            match = self.match_at(text, start)
+            if match is None:
+                position = start + 1
+                continue
+            end, ordinal = match
+            yield start, end, ordinal
+            position = end
+
+    def iter_matches_stream(
+        self, chunks: Iterable[str]
+    ) -> Iterator[tuple[int, int, int]]:
+        """
+        Yield ``(start, end, ordinal)`` for every glyph found in a text given
+        as consecutive chunks, with offsets relative to the whole text.
+
+        Matches are the same as for the joined text: a glyph straddling two
+        chunks is reported once. Only the tail of a chunk that could start an
+        unfinished glyph is carried over to the next one, so memory stays
+        bounded by the chunk size.
+        """
+        search = self._first_char_pattern.search
+        # A run of presentation selectors could keep a walk going forever, so
+        # a tail that long is resolved with the text at hand
+        carry_limit = 4 * self.max_length
+        carry = ""
+        offset = 0
+        for chunk in chunks:
+            if not chunk:
+                continue
+            text = carry + chunk
+            position = 0
+            while True:
+                candidate = search(text, position)
+                if candidate is None:
+                    position = len(text)
+                    break
+                start = candidate.start()
+                match, exhausted = self._walk(text, start)
+                if exhausted and len(text) - start <= carry_limit:
+                    position = start
+                    break
+                if match is None:
+                    position = start + 1
+                    continue
+                end, ordinal = match
+                yield offset + start, offset + end, ordinal
+                position = end
+            carry = text[position:]
+            offset += position
+
+        for start, end, ordinal in self.iter_matches(carry):
+            yield offset + start, offset + end, ordinal
+
+    def contains(self, text: str) -> bool:
+        return next(self.iter_matches(text), None) is not None
+
+    def fullmatch(self, text: str) -> bool:
+        """
+        Return True if ``text`` is made only of glyphs known to the scanner.
+        """
+        if not text:
+            return False
+        position = 0
+        length = len(text)
+        while position < length:
+            match = self.match_at(text, position)
+            if match is None:
+                return False
+            position = match[0]
+        return True
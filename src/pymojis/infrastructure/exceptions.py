@@ -39,3 +39,10 @@ class DatasetNotFoundError(InfrastructureError):
             full_message = message
         super().__init__(full_message)
         self.dataset_name = dataset_name
+
+
+class SnapshotError(InfrastructureError):
+    """Raised when a dataset snapshot is invalid or out of date."""
+
+    def __init__(self, message: str = "Invalid dataset snapshot"):
+        super().__init__(message)
@@ -0,0 +1,412 @@
+"""
+Emoji dataset stored in a flat file shared by every process through mmap.
+
+The file holds the dataset as columns plus prebuilt lookup tables, so opening
+it costs a header check and each process only pays for the pages it reads.
+Workers mapping the same file share a single physical copy of it.
+
+Layout, little-endian, every section aligned on 4 bytes:
+
+- header: magic, format version, emoji count, SHA-256 digest of the JSON
+  source and the offset and length of each section
+- ``meta``: JSON list of category and sub category names
+- ``strings``: UTF-8 blob holding every name, glyph and code sequence
+- ``name_offsets``, ``glyph_offsets``, ``code_offsets``: ``uint32`` offsets
+  into ``strings``, one per emoji plus a final end offset
+- ``categories`` and ``sub_categories``: ``uint16`` ids into ``meta``
+- ``name_table``, ``code_table``, ``glyph_table``: open addressing hash tables
+  of ``ordinal + 1`` (0 marks an empty slot), hashed with CRC-32 so that
+  every process probes the same slots
+"""
+
+import hashlib
+import json
+import mmap
+import operator
+import os
+import stat
+import struct
+import tempfile
+import zlib
+from array import array
+from collections.abc import Callable, Iterator, Mapping, Sequence
+from pathlib import Path
+from typing import Any, TypeVar, overload
+
+from .emoji_columns import CODE_SEPARATOR, EmojiColumns, LazyEmojis
+from .emoji_dataset import EmojiDataset
+from .exceptions import InfrastructureError
+
+MAPPED_MAGIC = b"PYMOJMAP"
+MAPPED_FORMAT_VERSION = 1
+
+_SECTIONS = (
+    "meta",
+    "strings",
+    "name_offsets",
+    "glyph_offsets",
+    "code_offsets",
+    "categories",
+    "sub_categories",
+    "name_table",
+    "code_table",
+    "glyph_table",
+)
+_HEADER = struct.Struct(f"<8sHxxI32s{2 * len(_SECTIONS)}I")
+
+V = TypeVar("V")
+
+
+def _hash_key(key: str) -> int:
+    return zlib.crc32(key.encode("utf-8", "surrogatepass"))
+
+
+def _build_table(keys: Sequence[str | None]) -> array:
+    size = 8
+    while size < 2 * len(keys):
+        size *= 2
+    mask = size - 1
+    table = array("I", bytes(4 * size))
+    seen: set[str] = set()
+
+    for ordinal, key in enumerate(keys):
+        # First occurrence wins, like the in-memory indexes
+        if key is None or key in seen:
+            continue
+        seen.add(key)
+        slot = _hash_key(key) & mask
+        while table[slot]:
+            slot = (slot + 1) & mask
+        table[slot] = ordinal + 1
+    return table
+
+
+def _string_column(values: Sequence[str], blob: bytearray) -> array:
+    offsets = array("I", [len(blob)])
+    for value in values:
+        blob += value.encode("utf-8", "surrogatepass")
+        offsets.append(len(blob))
+    return offsets
+
+
+def write_mapped_dataset(
+    dataset: EmojiDataset, source: bytes, path: str | Path
+) -> None:
+    """
+    Write ``dataset`` to ``path`` in the mapped format.
+
+    The file is written next to its destination then moved into place, so
+    processes racing to build it never map a partial file.
+    """
+    emojis = dataset.emojis
+    categories = list(dict.fromkeys(emoji.category for emoji in emojis))
+    sub_categories = list(dict.fromkeys(emoji.sub_category for emoji in emojis))
+    category_ids = {category: index for index, category in enumerate(categories)}
+    sub_category_ids = {name: index for index, name in enumerate(sub_categories)}
+
+    blob = bytearray()
+    sections: dict[str, bytes] = {
+        "meta": json.dumps(
+            {"categories": categories, "sub_categories": sub_categories}
+        ).encode("utf-8"),
+        "name_offsets": _string_column([e.name for e in emojis], blob).tobytes(),
+        "glyph_offsets": _string_column([e.emoji for e in emojis], blob).tobytes(),
+        "code_offsets": _string_column(
+            [CODE_SEPARATOR.join(e.code) for e in emojis], blob
+        ).tobytes(),
+        "categories": array("H", [category_ids[e.category] for e in emojis]).tobytes(),
+        "sub_categories": array(
+            "H", [sub_category_ids[e.sub_category] for e in emojis]
+        ).tobytes(),
+        "name_table": _build_table([e.name.casefold() for e in emojis]).tobytes(),
+        "code_table": _build_table(
+            [e.code[0].casefold() if len(e.code) == 1 else None for e in emojis]
+        ).tobytes(),
+        "glyph_table": _build_table([e.emoji for e in emojis]).tobytes(),
+    }
+    sections["strings"] = bytes(blob)
+
+    body = bytearray()
+    layout: list[int] = []
+    for name in _SECTIONS:
+        body += bytes(-len(body) % 4)
+        layout += [_HEADER.size + len(body), len(sections[name])]
+        body += sections[name]
+
+    header = _HEADER.pack(
+        MAPPED_MAGIC,
+        MAPPED_FORMAT_VERSION,
+        len(emojis),
+        hashlib.sha256(source).digest(),
+        *layout,
+    )
+
+    path = Path(path)
+    path.parent.mkdir(mode=0o700, parents=True, exist_ok=True)
+    descriptor, temporary = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+    try:
+        with os.fdopen(descriptor, "wb") as temporary_file:
+            temporary_file.write(header)
+            temporary_file.write(body)
+        os.replace(temporary, path)
+    except BaseException:
+        os.unlink(temporary)
+        raise
+
+
+class _MappedStrings(Sequence[str]):
+    """String column of a mapped dataset, decoded on access."""
+
+    def __init__(self, strings: memoryview, offsets: memoryview):
+        self._strings = strings
+        self._offsets = offsets
+
+    def __len__(self) -> int:
+        return len(self._offsets) - 1
+
+    @overload
+    def __getitem__(self, index: int) -> str: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> list[str]: ...
+
+    def __getitem__(self, index: int | slice) -> str | list[str]:
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+        if index < 0:
+            index += len(self)
+        offsets = self._offsets
+        if not 0 <= index < len(offsets) - 1:
+            raise IndexError("mapped string index out of range")
+        return str(
+            self._strings[offsets[index] : offsets[index + 1]], "utf-8", "surrogatepass"
+        )
+
+    def __iter__(self) -> Iterator[str]:
+        strings = self._strings
+        offsets = self._offsets
+        for index in range(len(offsets) - 1):
+            yield str(
+                strings[offsets[index] : offsets[index + 1]], "utf-8", "surrogatepass"
+            )
+
+
+class _MappedIndex(Mapping[str, V]):
+    """Read-only mapping probing one of the hash tables of a mapped dataset."""
+
+    def __init__(
+        self,
+        table: memoryview,
+        key_of: Callable[[int], str],
+        value_of: Callable[[int], V],
+    ):
+        self._table = table
+        self._mask = len(table) - 1
+        self._key_of = key_of
+        self._value_of = value_of
+
+    def find(self, key: str) -> int | None:
+        table, mask, key_of = self._table, self._mask, self._key_of
+        slot = _hash_key(key) & mask
+        # Bounded, so that a full or corrupted table cannot loop forever
+        for _ in range(len(table)):
+            entry = table[slot]
+            if not entry:
+                return None
+            if key_of(entry - 1) == key:
+                return entry - 1
+            slot = (slot + 1) & mask
+        return None
+
+    def __getitem__(self, key: str) -> V:
+        ordinal = self.find(key) if isinstance(key, str) else None
+        if ordinal is None:
+            raise KeyError(key)
+        return self._value_of(ordinal)
+
+    def __contains__(self, key: object) -> bool:
+        return isinstance(key, str) and self.find(key) is not None
+
+    def __iter__(self) -> Iterator[str]:
+        return (self._key_of(entry - 1) for entry in self._table if entry)
+
+    def __len__(self) -> int:
+        return sum(1 for entry in self._table if entry)
+
+
+def _check_trusted(path: Path, status: os.stat_result) -> None:
+    # Only files of the current user, writable by no one else, are mapped,
+    # so that no other local user can plant one
+    if not hasattr(os, "getuid"):
+        return
+    if status.st_uid != os.getuid():
+        raise InfrastructureError(f"Mapped dataset owned by another user: {path}")
+    if status.st_mode & (stat.S_IWGRP | stat.S_IWOTH):
+        raise InfrastructureError(f"Mapped dataset writable by other users: {path}")
+
+
+def _validated_columns(
+    sections: Mapping[str, memoryview], count: int, meta: Any
+) -> dict[str, memoryview]:
+    """
+    Cast the column and table sections of a mapped file, checking every
+    offset, id and ordinal they hold against the file before any is used.
+
+    Raises:
+        ValueError: If a section is inconsistent with the others
+    """
+    if not (
+        isinstance(meta, dict)
+        and all(
+            isinstance(meta.get(key), list)
+            and all(isinstance(name, str) for name in meta[key])
+            for key in ("categories", "sub_categories")
+        )
+    ):
+        raise ValueError("invalid meta section")
+
+    columns: dict[str, memoryview] = {}
+    for name in ("name_offsets", "glyph_offsets", "code_offsets"):
+        if len(sections[name]) != 4 * (count + 1):
+            raise ValueError(f"invalid {name} section")
+        offsets = sections[name].cast("I")
+        if offsets[-1] > len(sections["strings"]) or not all(
+            map(operator.le, offsets, offsets[1:])
+        ):
+            raise ValueError(f"invalid {name} section")
+        columns[name] = offsets
+    for name, names in (
+        ("categories", meta["categories"]),
+        ("sub_categories", meta["sub_categories"]),
+    ):
+        if len(sections[name]) != 2 * count:
+            raise ValueError(f"invalid {name} section")
+        ids = sections[name].cast("H")
+        if count and max(ids) >= len(names):
+            raise ValueError(f"invalid {name} section")
+        columns[name] = ids
+    for name in ("name_table", "code_table", "glyph_table"):
+        size = len(sections[name]) // 4
+        # Probing masks slots, so tables hold a power of two of them
+        if len(sections[name]) % 4 or size < 1 or size & (size - 1):
+            raise ValueError(f"invalid {name} section")
+        table = sections[name].cast("I")
+        if max(table) > count:
+            raise ValueError(f"invalid {name} section")
+        columns[name] = table
+    return columns
+
+
+class MappedEmojiDataset(EmojiDataset):
+    """
+    Dataset backed by a read-only memory mapping of a file built with
+    write_mapped_dataset.
+
+    Its columns are views over the file, and lookups by code, name and glyph
+    probe the shared hash tables directly. Emoji objects and the other lookup
+    structures are built per process, on first use. Pickling a mapped dataset
+    only carries its path, so that worker processes map the same file.
+    """
+
+    def __init__(self, path: str | Path, source: bytes):
+        self._open(Path(path), hashlib.sha256(source).digest())
+
+    def _open(self, path: Path, source_digest: bytes) -> None:
+        self.path = path
+        self._source_digest = source_digest
+        with self.path.open("rb") as mapped_file:
+            _check_trusted(path, os.fstat(mapped_file.fileno()))
+            self._mmap = mmap.mmap(mapped_file.fileno(), 0, access=mmap.ACCESS_READ)
+
+        try:
+            fields = _HEADER.unpack_from(self._mmap)
+        except struct.error as truncated:
+            raise InfrastructureError(
+                f"Truncated mapped dataset: {path}"
+            ) from truncated
+        count: int
+        magic, version, count, digest, *layout = fields
+        if magic != MAPPED_MAGIC or version != MAPPED_FORMAT_VERSION:
+            raise InfrastructureError(f"Unsupported mapped dataset: {path}")
+        if digest != source_digest:
+            raise InfrastructureError(f"Mapped dataset is out of date: {path}")
+
+        self.count = count
+        view = memoryview(self._mmap)
+        sections: dict[str, memoryview] = {}
+        for index, name in enumerate(_SECTIONS):
+            start, length = layout[2 * index], layout[2 * index + 1]
+            if start < _HEADER.size or start % 4 or start + length > len(view):
+                raise InfrastructureError(f"Corrupted mapped dataset: {path}")
+            sections[name] = view[start : start + length]
+        try:
+            meta = json.loads(bytes(sections["meta"]))
+            columns = _validated_columns(sections, count, meta)
+        except (ValueError, TypeError, KeyError) as corrupted:
+            raise InfrastructureError(
+                f"Corrupted mapped dataset: {path}"
+            ) from corrupted
+        strings = sections["strings"]
+        codes = _MappedStrings(strings, columns["code_offsets"])
+
+        self.columns = EmojiColumns(
+            names=_MappedStrings(strings, columns["name_offsets"]),
+            glyphs=_MappedStrings(strings, columns["glyph_offsets"]),
+            codes=codes,
+            categories=columns["categories"],
+            sub_categories=columns["sub_categories"],
+            category_names=meta["categories"],
+            sub_category_names=meta["sub_categories"],
+            complex_flags=bytes(CODE_SEPARATOR in code for code in codes),
+        )
+        self.emojis = LazyEmojis(self.columns)
+        self.name_index = _MappedIndex(
+            columns["name_table"],
+            lambda ordinal: self.name(ordinal).casefold(),
+            self.glyph,
+        )
+        self.code_index = _MappedIndex(
+            columns["code_table"],
+            lambda ordinal: codes[ordinal].casefold(),
+            self.glyph,
+        )
+        self.glyph_index = _MappedIndex(
+            columns["glyph_table"], self.glyph, lambda ordinal: ordinal
+        )
+
+    def __len__(self) -> int:
+        return self.count
+
+    def __reduce__(self) -> tuple[Any, ...]:
+        # Only the path travels, other processes map the same file
+        return _reopen_mapped_dataset, (str(self.path), self._source_digest)
+
+    def name(self, ordinal: int) -> str:
+        return self.columns.names[ordinal]
+
+    def glyph(self, ordinal: int) -> str:
+        return self.columns.glyphs[ordinal]
+
+
+def _reopen_mapped_dataset(path: str, source_digest: bytes) -> MappedEmojiDataset:
+    dataset = MappedEmojiDataset.__new__(MappedEmojiDataset)
+    dataset._open(Path(path), source_digest)
+    return dataset
+
+
+def _cache_directory() -> Path:
+    # Per user, unlike the temporary directory shared by every local user
+    if os.name == "nt":
+        base = os.environ.get("LOCALAPPDATA") or Path.home() / "AppData" / "Local"
+    else:
+        base = os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache"
+    return Path(base) / "pymojis"
+
+
+def default_mapped_path(dataset_type: str, source: bytes) -> Path:
+    """
+    Path shared by every process of the current user mapping the same
+    dataset source, in their cache directory.
+    """
+    digest = hashlib.sha256(source).hexdigest()[:16]
+    return _cache_directory() / f"{dataset_type}-{digest}.map"
@@ -0,0 +1,197 @@
+"""
+Instrumentation of the loading pipeline and of the repository methods.
+
+Instrumented code emits MetricEvent values to the hooks registered with
+add_hook. Without hooks, emitting costs a single check, so instrumentation is
+always in place. Events of the loading pipeline are:
+
+- timings ``file_read``, ``json_decode`` and ``snapshot_load``, labelled
+  with the source read
+- timing ``entity_parse``, for building the emojis of a dataset
+- timing ``index_build``, labelled with the index built
+- counter ``skipped_records``, labelled with the kind of invalid record
+- counter ``validation_fallbacks``, for trusted datasets failing validation
+
+PymojisMetrics is a ready-made hook aggregating those events, together with
+the per-method call counts and latencies of the repositories it is given to,
+for export to a monitoring system. It receives the events emitted during the
+calls of those repositories only, without being registered with add_hook.
+"""
+
+import threading
+import time
+from collections.abc import Callable, Iterator, Mapping
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass
+from functools import wraps
+from types import GeneratorType
+from typing import Any, Literal, NamedTuple
+
+
+class MetricEvent(NamedTuple):
+    kind: Literal["timing", "count"]
+    name: str
+    # Seconds for timings, increment for counters
+    value: float
+    labels: Mapping[str, str]
+
+
+MetricHook = Callable[[MetricEvent], None]
+
+_hooks: list[MetricHook] = []
+_hooks_lock = threading.Lock()
+# Metrics of the tracked repository call in progress, which also receive the
+# events it emits
+_current_metrics: ContextVar["PymojisMetrics | None"] = ContextVar(
+    "pymojis_current_metrics", default=None
+)
+
+
+def add_hook(hook: MetricHook) -> None:
+    """Register ``hook`` to receive every metric event of the process."""
+    with _hooks_lock:
+        if hook not in _hooks:
+            _hooks.append(hook)
+
+
+def remove_hook(hook: MetricHook) -> None:
+    with _hooks_lock:
+        if hook in _hooks:
+            _hooks.remove(hook)
+
+
+def emit(
+    kind: Literal["timing", "count"], name: str, value: float, **labels: str
+) -> None:
+    current = _current_metrics.get()
+    if not _hooks and current is None:
+        return
+    event = MetricEvent(kind, name, value, labels)
+    hooks = tuple(_hooks)
+    for hook in hooks:
+        hook(event)
+    if current is not None and current not in hooks:
+        current(event)
+
+
+@contextmanager
+def timed(name: str, **labels: str) -> Iterator[None]:
+    """Emit the duration of the block as a timing event, unless it raises."""
+    start = time.perf_counter()
+    yield
+    emit("timing", name, time.perf_counter() - start, **labels)
+
+
+def tracked(
+    method: str, function: Callable[..., Any], metrics: "PymojisMetrics"
+) -> Callable[..., Any]:
+    """
+    Wrap ``function`` to record its calls in ``metrics``. Time spent consuming
+    a returned generator counts as part of the call.
+
+    While the call runs, ``metrics`` receives the events it emits, and the
+    tracked methods it calls in turn are not recorded again.
+    """
+
+    @wraps(function)
+    def wrapper(*args: Any, **kwargs: Any) -> Any:
+        if _current_metrics.get() is metrics:
+            return function(*args, **kwargs)
+        start = time.perf_counter()
+        token = _current_metrics.set(metrics)
+        try:
+            result = function(*args, **kwargs)
+        finally:
+            _current_metrics.reset(token)
+            elapsed = time.perf_counter() - start
+        if isinstance(result, GeneratorType):
+            return _tracked_generator(method, result, metrics, elapsed)
+        metrics.record_call(method, elapsed)
+        return result
+
+    return wrapper
+
+
+def _tracked_generator(
+    method: str, generator: Iterator[Any], metrics: "PymojisMetrics", elapsed: float
+) -> Iterator[Any]:
+    try:
+        while True:
+            start = time.perf_counter()
+            token = _current_metrics.set(metrics)
+            try:
+                item = next(generator)
+            except StopIteration:
+                return
+            finally:
+                _current_metrics.reset(token)
+                elapsed += time.perf_counter() - start
+            yield item
+    finally:
+        metrics.record_call(method, elapsed)
+
+
+@dataclass
+class TimingStats:
+    count: int = 0
+    total: float = 0.0
+    max: float = 0.0
+
+    def add(self, seconds: float) -> None:
+        self.count += 1
+        self.total += seconds
+        self.max = max(self.max, seconds)
+
+
+def _series(name: str, labels: Mapping[str, str]) -> str:
+    # Prometheus-like series name, such as index_build{index="scanner"}
+    if not labels:
+        return name
+    rendered = ",".join(f'{key}="{value}"' for key, value in sorted(labels.items()))
+    return f"{name}{{{rendered}}}"
+
+
+class PymojisMetrics:
+    """
+    Thread-safe aggregate of metric events and repository method calls.
+
+    Pass it to PymojisManager (or PymojisRepositoryImpl) to record the calls
+    of its repository methods, together with the loading pipeline events they
+    emit. Datasets are shared, so a dataset loaded or indexed by another
+    repository reports its events there. Register it with add_hook to receive
+    every event of the process instead.
+    """
+
+    def __init__(self) -> None:
+        self.timings: dict[str, TimingStats] = {}
+        self.counters: dict[str, float] = {}
+        self.calls: dict[str, TimingStats] = {}
+        self._lock = threading.Lock()
+
+    def __call__(self, event: MetricEvent) -> None:
+        series = _series(event.name, event.labels)
+        with self._lock:
+            if event.kind == "timing":
+                self.timings.setdefault(series, TimingStats()).add(event.value)
+            else:
+                self.counters[series] = self.counters.get(series, 0) + event.value
+
+    def record_call(self, method: str, seconds: float) -> None:
+        with self._lock:
+            self.calls.setdefault(method, TimingStats()).add(seconds)
+
+    def snapshot(self) -> dict[str, Any]:
+        """Return a copy of every aggregate, as plain dictionaries."""
+        with self._lock:
+            return {
+                "timings": {name: vars(s).copy() for name, s in self.timings.items()},
+                "counters": dict(self.counters),
+                "calls": {name: vars(s).copy() for name, s in self.calls.items()},
+            }
+
+    def reset(self) -> None:
+        with self._lock:
+            self.timings.clear()
+            self.counters.clear()
+            self.calls.clear()
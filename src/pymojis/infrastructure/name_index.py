@@ -0,0 +1,108 @@
+import re
+from collections.abc import Iterable
+from typing import Literal
+
+MatchPolicy = Literal["word", "prefix", "substring"]
+
+_WORD_PATTERN = re.compile(r"\w+")
+_NGRAM_SIZE = 3
+# Bounds the memoised matches of tokens shorter than an n-gram
+_MAX_SHORT_SUBSTRINGS = 4096
+
+
+def _first_ordinals(keys_by_ordinal: list[tuple[int, Iterable[str]]]) -> dict[str, int]:
+    # Walking backwards lets lower ordinals overwrite higher ones in bulk
+    index: dict[str, int] = {}
+    for ordinal, keys in reversed(keys_by_ordinal):
+        index.update(dict.fromkeys(keys, ordinal))
+    return index
+
+
+class EmojiNameIndex:
+    """
+    Inverted index from emoji names to the ordinal of the first matching emoji.
+
+    Names are lower-cased once at build time, like the tokens looked up. Three match policies are supported:
+
+    - ``"word"``: the token equals one of the words of the name.
+    - ``"prefix"``: the token starts one of the words of the name.
+    - ``"substring"``: the token appears anywhere in the name.
+
+    Whatever the policy, the emoji with the lowest ordinal wins, which keeps
+    results identical to scanning the names in dataset order.
+    """
+
+    def __init__(self, names: Iterable[str]):
+        self._names: list[str] = [name.lower() for name in names]
+
+        words = _first_ordinals(
+            [
+                (ordinal, _WORD_PATTERN.findall(name))
+                for ordinal, name in enumerate(self._names)
+            ]
+        )
+        self._words = words
+        self._prefixes = _first_ordinals(
+            sorted(
+                (
+                    (ordinal, [word[:end] for end in range(1, len(word) + 1)])
+                    for word, ordinal in words.items()
+                ),
+                key=lambda item: item[0],
+            )
+        )
+        # Substrings shorter than an n-gram cannot use the postings below, so
+        # they are resolved on demand by a scan and memoised
+        self._short_substrings: dict[str, int | None] = {}
+        self._ngrams: dict[str, list[int]] = {}
+        for ordinal, name in enumerate(self._names):
+            for ngram in {
+                name[start : start + _NGRAM_SIZE]
+                for start in range(len(name) - _NGRAM_SIZE + 1)
+            }:
+                self._ngrams.setdefault(ngram, []).append(ordinal)
+
+    def find(self, token: str, policy: MatchPolicy = "substring") -> int | None:
+        """
+        Return the ordinal of the first emoji whose name matches ``token``.
+        """
+        token = token.lower()
+        if policy == "word":
+            return self._words.get(token)
+        if policy == "prefix":
+            return self._prefixes.get(token)
+        if policy == "substring":
+            return self._find_substring(token)
+        raise ValueError(
+            f"policy must be one of: 'word', 'prefix', 'substring', got {policy!r}"
+        )
+
+    def _find_substring(self, token: str) -> int | None:
+        if len(token) < _NGRAM_SIZE:
+            if token not in self._short_substrings:
+                if len(self._short_substrings) >= _MAX_SHORT_SUBSTRINGS:
+                    self._short_substrings.clear()
+                self._short_substrings[token] = next(
+                    (
+                        ordinal
+                        for ordinal, name in enumerate(self._names)
+                        if token in name
+                    ),
+                    None,
+                )
+            return self._short_substrings[token]
+
+        # Any name containing the token contains all of its n-grams, so walking
+        # the rarest posting list in ordinal order finds the first match.
+        rarest: list[int] | None = None
+        for start in range(len(token) - _NGRAM_SIZE + 1):
+            postings = self._ngrams.get(token[start : start + _NGRAM_SIZE])
+            if postings is None:
+                return None
+            if rarest is None or len(postings) < len(rarest):
+                rarest = postings
+
+        names = self._names
+        return next(
+            (ordinal for ordinal in rarest or () if token in names[ordinal]), None
+        )
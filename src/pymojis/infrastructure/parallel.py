@@ -0,0 +1,187 @@
+"""
+Text operations run over a pool of worker processes.
+
+The dataset is pickled once and handed to each worker when it starts, so tasks
+only carry chunks of texts and their results. A mapped dataset pickles to the
+path of its file, which every worker maps instead of holding its own copy.
+"""
+
+import os
+import pickle  # nosec B403
+from collections import deque
+from collections.abc import Callable, Iterable, Iterator
+from concurrent.futures import Future, ProcessPoolExecutor
+from itertools import islice
+from typing import Any, Literal
+
+from .emoji_counter import EmojiCounter
+from .emoji_dataset import EmojiDataset
+from .name_index import MatchPolicy
+from .pymojis_repository import PymojisRepositoryImpl
+
+Operation = Literal["emojifie", "contains_emojis", "find_emojis", "is_emoji"]
+
+_OPERATIONS: dict[str, Callable[[PymojisRepositoryImpl, list[str], Any], list[Any]]] = {
+    "emojifie": lambda repository, texts, match: list(
+        repository.emojifie_many(texts, match)
+    ),
+    "contains_emojis": lambda repository, texts, match: list(
+        repository.contains_emojis_many(texts)
+    ),
+    "find_emojis": lambda repository, texts, match: [
+        repository.find_emojis(text) for text in texts
+    ],
+    "is_emoji": lambda repository, texts, match: [
+        repository.is_emoji(text) for text in texts
+    ],
+}
+
+# Operations run on whole chunks, on top of the public ones
+_CHUNK_OPERATIONS: dict[str, Callable[[PymojisRepositoryImpl, list[str], Any], Any]] = {
+    **_OPERATIONS,
+    "count_emojis": lambda repository, texts, match: (
+        repository.count_emojis(texts).counts
+    ),
+}
+
+# Lookup structures each operation uses, prebuilt before the dataset is sent
+# to the workers
+_OPERATION_INDEXES: dict[str, tuple[str, ...]] = {
+    "emojifie": ("word_index",),
+    "contains_emojis": ("scanner",),
+    "find_emojis": ("scanner",),
+    "is_emoji": ("glyph_index", "scanner"),
+    "count_emojis": ("scanner",),
+}
+
+# Repository of the current worker process, set up by _init_worker
+_worker_repository: PymojisRepositoryImpl | None = None
+
+
+def _init_worker(payload: bytes) -> None:
+    global _worker_repository
+    # The payload is built by process_many in the parent process
+    dataset = pickle.loads(payload)  # nosec B301
+    _worker_repository = PymojisRepositoryImpl(dataset=dataset)
+
+
+def _run_chunk(op: str, texts: list[str], match: MatchPolicy) -> Any:
+    if _worker_repository is None:
+        raise RuntimeError("Worker process was not initialised")
+    return _CHUNK_OPERATIONS[op](_worker_repository, texts, match)
+
+
+def process_many(
+    dataset: EmojiDataset,
+    texts: Iterable[str],
+    op: Operation,
+    workers: int | None = None,
+    chunksize: int = 1000,
+    match: MatchPolicy = "substring",
+) -> Iterator[Any]:
+    """
+    Apply a text operation to every text, spread over worker processes.
+
+    Texts are sent to the workers in chunks of ``chunksize``. At most two
+    chunks per worker are in flight, so the input is consumed as results are
+    produced and memory stays bounded. Results are yielded in input order.
+
+    Args:
+        dataset: Dataset the workers operate on
+        texts: Texts to process
+        op: Name of the operation, applied as the repository method of the
+            same name
+        workers: Number of worker processes, the number of CPUs by default.
+            With a single worker, texts are processed in the current process.
+        chunksize: Number of texts sent to a worker at once
+        match: Match policy of the "emojifie" operation
+
+    Raises:
+        ValueError: If the operation or the chunk size is invalid
+    """
+    if op not in _OPERATIONS:
+        raise ValueError(
+            f"op must be one of: {', '.join(map(repr, _OPERATIONS))}, got {op!r}"
+        )
+    if chunksize < 1:
+        raise ValueError(f"chunksize must be a positive integer, got {chunksize}")
+
+    # Arguments are checked now, texts are processed once iteration starts
+    return _process(dataset, texts, op, workers, chunksize, match)
+
+
+def _process(
+    dataset: EmojiDataset,
+    texts: Iterable[str],
+    op: Operation,
+    workers: int | None,
+    chunksize: int,
+    match: MatchPolicy,
+) -> Iterator[Any]:
+    for results in _map_chunks(dataset, texts, op, workers, chunksize, match):
+        yield from results
+
+
+def count_many(
+    dataset: EmojiDataset,
+    texts: Iterable[str],
+    workers: int | None = None,
+    chunksize: int = 1000,
+) -> EmojiCounter:
+    """
+    Count the emojis of every text, spread over worker processes.
+
+    Each worker counts whole chunks and sends back their counts array only,
+    which are merged as they arrive. Arguments are the same as for
+    process_many.
+    """
+    if chunksize < 1:
+        raise ValueError(f"chunksize must be a positive integer, got {chunksize}")
+
+    counter = EmojiCounter(dataset)
+    for counts in _map_chunks(
+        dataset, texts, "count_emojis", workers, chunksize, "substring"
+    ):
+        counter.merge(counts)
+    return counter
+
+
+def _map_chunks(
+    dataset: EmojiDataset,
+    texts: Iterable[str],
+    op: str,
+    workers: int | None,
+    chunksize: int,
+    match: MatchPolicy,
+) -> Iterator[Any]:
+    # Yields the result of each chunk, in input order
+    workers = workers or os.cpu_count() or 1
+    iterator = iter(texts)
+    chunks = iter(lambda: list(islice(iterator, chunksize)), [])
+
+    if workers == 1:
+        repository = PymojisRepositoryImpl(dataset=dataset)
+        for chunk in chunks:
+            yield _CHUNK_OPERATIONS[op](repository, chunk, match)
+        return
+
+    # Workers get the indexes of the operation prebuilt instead of each
+    # building its own, and no other index is shipped to them
+    dataset.warmup(_OPERATION_INDEXES[op])
+    payload = pickle.dumps(dataset, protocol=pickle.HIGHEST_PROTOCOL)
+
+    pending: deque[Future[Any]] = deque()
+    with ProcessPoolExecutor(
+        max_workers=workers, initializer=_init_worker, initargs=(payload,)
+    ) as executor:
+        try:
+            for chunk in chunks:
+                pending.append(executor.submit(_run_chunk, op, chunk, match))
+                if len(pending) >= 2 * workers:
+                    yield pending.popleft().result()
+            while pending:
+                yield pending.popleft().result()
+        finally:
+            # Chunks not started yet are dropped when the caller stops early
+            for future in pending:
+                future.cancel()
@@ -1,35 +1,101 @@
 import logging
 import re
-from random import sample
-from typing import Any, Literal
+from collections.abc import Callable, Iterable, Iterator, Mapping
+from functools import partial
+from random import Random
+from typing import TYPE_CHECKING, Any, Literal, TextIO, cast
 
-from pymojis.domain.entities.emojis import Categories, Emoji
+from pymojis.domain.entities.emojis import Categories, Emoji, EmojiMatch
 from pymojis.domain.repositories.repository import PymojisRepository
-from pymojis.infrastructure.data_loader.emojis_loader import EmojiDataLoader
+from pymojis.infrastructure.data_loader.emojis_loader import (
+    DatasetConfig,
+    EmojiDataLoader,
+)
 from pymojis.infrastructure.data_loader.file_loader import FileLoader
 
-from .exceptions import InfrastructureError
-from .utils import check_type, should_exclude
+from .dataset_registry import DatasetRegistry, default_registry
+from .emoji_dataset import EmojiDataset
+from .exceptions import DatasetNotFoundError, InfrastructureError
+from .name_index import MatchPolicy
+from .utils import (
+    check_type,
+    checked_items,
+    html_entities,
+    iter_text_chunks,
+)
+
+if TYPE_CHECKING:
+    from .emoji_counter import EmojiCounter
+    from .metrics import PymojisMetrics
+
+# Repository methods whose calls are recorded when metrics are given
+_TRACKED_METHODS = PymojisRepository.__abstractmethods__ | {
+    "load_emojis",
+    "warmup",
+    "process_many",
+}
+
+# Short name of an emoji, as written by demojize
+_ALIAS = re.compile(r":[^\s:]+:")
+
+# Bounds the token replacements memoised while emojifying a batch or a stream
+_MAX_REPLACEMENTS = 100_000
 
 
 class PymojisRepositoryImpl(PymojisRepository):
-    def __init__(self, data_file_path: str | None = None):
+    def __init__(
+        self,
+        data_file_path: str | None = None,
+        dataset_configs: list[DatasetConfig] | None = None,
+        registry: DatasetRegistry | None = None,
+        rng: Random | None = None,
+        dataset: EmojiDataset | None = None,
+        metrics: "PymojisMetrics | None" = None,
+    ):
         self.data_file_path: str | None = data_file_path
         self.logger = logging.getLogger(__name__)
-        self._emojis: list[Emoji] = []
-        self._data_loader: EmojiDataLoader = EmojiDataLoader(file_loader=FileLoader())
+        # A dataset given here is used as is instead of being loaded
+        self._loaded_dataset: EmojiDataset | None = dataset
+        self._data_loader: EmojiDataLoader = EmojiDataLoader(
+            file_loader=FileLoader(), dataset_configs=dataset_configs
+        )
+        # Datasets are shared process-wide unless a dedicated registry is given
+        self._registry: DatasetRegistry = (
+            default_registry if registry is None else registry
+        )
+        # Pass a seeded Random for reproducible draws
+        self._rng: Random = rng or Random()
+        self._dataset_listeners: list[Callable[[], None]] = []
+        self.metrics = metrics
+        if metrics is not None:
+            from .metrics import tracked
 
-    def load_emojis(self, data_file_path: str | None = None) -> None:
+            for method in sorted(_TRACKED_METHODS):
+                setattr(self, method, tracked(method, getattr(self, method), metrics))
+
+    def load_emojis(
+        self, data_file_path: str | None = None, reload: bool = False
+    ) -> None:
         try:
+            load: Callable[[], EmojiDataset]
             if data_file_path:
                 self.logger.info(f"Loading emojis from custom path: {data_file_path}")
-                raw_data = self._data_loader.load_from_path(data_file_path)
+                key = self._data_loader.path_key(data_file_path)
+                load = partial(self._data_loader.load_dataset_from_path, data_file_path)
             else:
                 self.logger.info("Loading emojis from default sources")
-                raw_data = self._data_loader.load_from_default_sources()
+                key = self._data_loader.default_sources_key()
+                load = self._data_loader.load_dataset_from_default_sources
 
-            self._parse_emojis(raw_data)
-            self.logger.info(f"Successfully loaded {len(self._emojis)} emojis")
+            if reload:
+                dataset = self._registry.reload(key, load)
+            else:
+                dataset = self._registry.get_or_load(key, load)
+            previous, self._loaded_dataset = self._loaded_dataset, dataset
+            self.logger.info(f"Successfully loaded {len(dataset)} emojis")
+            if previous is not None and dataset is not previous:
+                for listener in self._dataset_listeners:
+                    listener()
 
         except Exception as infra_error:
             self.logger.error(f"Failed to load emojis: {infra_error}")
@@ -37,187 +103,329 @@ class PymojisRepositoryImpl(PymojisRepository):
                 f"Emoji loading failed: {infra_error}"
             ) from infra_error
 
-    def _parse_emojis(self, data: dict[str, Any]) -> None:
-        try:
-            emojis_data = data.get("emojis", {})
-            if not isinstance(emojis_data, dict):
-                raise InfrastructureError(
-                    "Invalid data structure: 'emojis' must be a dictionary"
-                )
+    def add_dataset_listener(self, listener: Callable[[], None]) -> None:
+        """
+        Register a callback run whenever a reload replaces the dataset, for
+        instance to drop results computed from the previous one.
+        """
+        self._dataset_listeners.append(listener)
 
-            parsed_emojis = []
-
-            for category, subcategories in emojis_data.items():
-                if not isinstance(subcategories, dict):
-                    self.logger.warning(f"Skipping invalid category '{category}'")
-                    continue
-
-                for subcategory, emojis_list in subcategories.items():
-                    if not isinstance(emojis_list, list):
-                        self.logger.warning(
-                            f"Skipping invalid subcategory '{subcategory}'"
-                        )
-                        continue
-
-                    for emoji_data in emojis_list:
-                        try:
-                            emoji = self._create_emoji_from_data(
-                                category, subcategory, emoji_data
-                            )
-                            parsed_emojis.append(emoji)
-                        except Exception as invalid_emoji:
-                            self.logger.warning(
-                                f"Skipping invalid emoji: {invalid_emoji}"
-                            )
-                            continue
-
-            self._emojis = parsed_emojis
-            self.logger.debug(f"Parsed {len(self._emojis)} emojis successfully")
+    @property
+    def _dataset(self) -> EmojiDataset:
+        # The dataset is loaded by the first method needing it
+        dataset = self._loaded_dataset
+        if dataset is None:
+            # Whichever method loads it reports a missing dataset the same way
+            try:
+                self.load_emojis(self.data_file_path)
+            except InfrastructureError as dataset_error:
+                raise DatasetNotFoundError(
+                    f"No dataset found: {dataset_error}"
+                ) from dataset_error
+            dataset = cast(EmojiDataset, self._loaded_dataset)
+        return dataset
 
-        except Exception as infra_error:
-            raise InfrastructureError(
-                f"Failed to parse emoji data: {infra_error}"
-            ) from infra_error
-
-    def _create_emoji_from_data(
-        self, category: Categories, subcategory: str, emoji_data: dict[str, Any]
-    ) -> Emoji:
-        if not isinstance(emoji_data, dict):
-            raise ValueError("Emoji data must be a dictionary")
-
-        return Emoji(
-            category=category,
-            sub_category=subcategory,
-            name=emoji_data.get("name", ""),
-            code=emoji_data.get("code", ""),
-            emoji=emoji_data.get("emoji", ""),
-        )
+    def warmup(self) -> None:
+        self._dataset.warmup()
 
     def get_all(
         self, exclude: Literal["complex"] | list[Categories] | None = None
-    ) -> list[Emoji]:
-        all_emojis: list[Emoji] = []
-        if not exclude:
-            all_emojis = self._emojis.copy()
-        else:
-            for emoji in self._emojis:
-                if should_exclude(emoji, exclude):
-                    continue
-                all_emojis.append(emoji)
-        return all_emojis
+    ) -> tuple[Emoji, ...]:
+        return self._dataset.select(exclude)
 
     def get_by_category(self, category: Categories) -> list[str]:
         if not check_type(category, str):
             return []
-        return [
-            emoji.emoji
-            for emoji in self._emojis
-            if category.lower() == emoji.category.lower()
-        ]
+        return list(self._dataset.category_index.get(category.casefold(), ()))
 
     def get_by_code(self, code: str) -> str | None:
         if not check_type(code, str):
             return None
-        return next(
-            (
-                emoji.emoji
-                for emoji in self._emojis
-                if code.lower() in (emoji_code.lower() for emoji_code in emoji.code)
-                and len(emoji.code) == 1
-            ),
-            None,
-        )
+        return self._dataset.code_index.get(code.casefold())
 
     def get_by_name(self, name: str) -> str | None:
         if not check_type(name, str):
             return None
-        return next(
-            (
-                emoji.emoji
-                for emoji in self._emojis
-                if emoji.name.lower() == name.lower()
-            ),
-            None,
-        )
+        return self._dataset.name_index.get(name.casefold())
+
+    def get_by_codes(self, codes: Iterable[str]) -> Iterator[str | None]:
+        index = self._dataset.code_index
+        for code in checked_items(codes, str):
+            yield None if code is None else index.get(code.casefold())
+
+    def get_by_names(self, names: Iterable[str]) -> Iterator[str | None]:
+        index = self._dataset.name_index
+        for name in checked_items(names, str):
+            yield None if name is None else index.get(name.casefold())
+
+    def search(self, query: str, limit: int | None = 10) -> list[Emoji]:
+        if not check_type(query, str) or (
+            limit is not None and not check_type(limit, int)
+        ):
+            return []
+        dataset = self._dataset
+        emojis = dataset.emojis
+        return [emojis[o] for o in dataset.search_index.search(query, limit)]
 
     def get_random_emojis(
         self,
         categories: list[Categories] | None = None,
         length: int = 1,
         exclude: Literal["complex"] | list[Categories] | None = None,
+        weights: Mapping[str, float] | None = None,
     ) -> list[Emoji]:
-        if categories:
-            category_set = {cat.lower() for cat in categories}
-            filtered = [
-                emoji
-                for emoji in self._emojis
-                if emoji.category.lower() in category_set
-            ]
+        dataset = self._dataset
+        pools = dataset.random_pools
+        if weights:
+            ordinals = pools.choices(self._rng, length, weights, categories, exclude)
         else:
-            filtered = (
-                [emoji for emoji in self._emojis if not should_exclude(emoji, exclude)]
-                if exclude
-                else self._emojis.copy()
-            )
+            ordinals = pools.sample(self._rng, length, categories, exclude)
+        emojis = dataset.emojis
+        return [emojis[ordinal] for ordinal in ordinals]
 
-        return sample(filtered, min(length, len(filtered)))
+    def iter_random_emojis(
+        self,
+        categories: list[Categories] | None = None,
+        exclude: Literal["complex"] | list[Categories] | None = None,
+        window: int = 0,
+    ) -> Iterator[Emoji]:
+        dataset = self._dataset
+        emojis = dataset.emojis
+        for ordinal in dataset.random_pools.iter_sample(
+            self._rng, categories, exclude, window
+        ):
+            yield emojis[ordinal]
 
     def get_by_emoji(self, emoji: str) -> Emoji | None:
-        found_emoji = None
-        for current_emoji in self._emojis:
-            if current_emoji.emoji == emoji:
-                found_emoji = current_emoji
-                break
-
-        return found_emoji
+        if not check_type(emoji, str):
+            return None
+        dataset = self._dataset
+        ordinal = dataset.glyph_index.get(emoji)
+        return None if ordinal is None else dataset.emojis[ordinal]
 
     def contains_emojis(self, text: str) -> bool:
-        for emoji in self._emojis:
-            if emoji.emoji in text:
-                return True
-        return False
+        return self._dataset.scanner.contains(text)
+
+    def contains_emojis_many(self, texts: Iterable[str]) -> Iterator[bool]:
+        contains = self._dataset.scanner.contains
+        for text in texts:
+            yield contains(text)
+
+    def find_emojis(self, text: str) -> list[EmojiMatch]:
+        return list(self.iter_emojis(text))
+
+    def iter_emojis(self, text: str) -> Iterator[EmojiMatch]:
+        dataset = self._dataset
+        emojis = dataset.emojis
+        for start, end, ordinal in dataset.scanner.iter_matches(text):
+            yield EmojiMatch(start, end, emojis[ordinal])
+
+    def iter_emojis_stream(
+        self, source: Iterable[str] | TextIO
+    ) -> Iterator[EmojiMatch]:
+        dataset = self._dataset
+        emojis = dataset.emojis
+        chunks = iter_text_chunks(source)
+        for start, end, ordinal in dataset.scanner.iter_matches_stream(chunks):
+            yield EmojiMatch(start, end, emojis[ordinal])
+
+    def contains_emojis_stream(self, source: Iterable[str] | TextIO) -> bool:
+        return next(self.iter_emojis_stream(source), None) is not None
 
     def is_emoji(self, text: str) -> bool:
         if not check_type(text, str):
             return False
         text = text.strip()
-        emoji_pattern = re.compile(
-            "["
-            "\U0001f600-\U0001f64f"  # emoticons
-            "\U0001f300-\U0001f5ff"  # symbols & pictographs
-            "\U0001f680-\U0001f6ff"  # transport & map symbols
-            "\U0001f1e0-\U0001f1ff"  # flags (iOS)
-            "\U00002702-\U000027b0"  # dingbats
-            "\U000024c2-\U0001f251"  # enclosed characters
-            "\U0001f900-\U0001f9ff"  # supplemental symbols and pictographs
-            "\U0001fa70-\U0001faff"  # symbols and pictographs extended-A
-            "\U00002600-\U000026ff"  # miscellaneous symbols
-            "\U00002700-\U000027bf"  # dingbats
-            "\U0001f004"  # mahjong tile red dragon
-            "\U0001f0cf"  # playing card black joker
-            "\U0001f18e"  # negative squared ab
-            "\U0001f191-\U0001f19a"  # squared symbols
-            "\U0001f201-\U0001f202"  # squared katakana
-            "\U0001f21a-\U0001f22f"  # squared cjk ideographs
-            "\U0001f232-\U0001f23a"  # squared cjk ideographs
-            "\U0001f250-\U0001f251"  # circled ideographs
-            "\U0000200d"  # zero width joiner
-            "\U0000fe0f"  # variation selector-16
-            "]+",
-            flags=re.UNICODE,
-        )
+        dataset = self._dataset
+        return text in dataset.glyph_index or dataset.scanner.fullmatch(text)
 
-        return emoji_pattern.fullmatch(text) is not None
+    def emojifie(self, text: str, match: MatchPolicy = "substring") -> str:
+        return self._emojifie(text, match, {})
 
-    def emojifie(self, text: str) -> str:
+    def emojifie_many(
+        self, texts: Iterable[str], match: MatchPolicy = "substring"
+    ) -> Iterator[str]:
+        # Token replacements are shared by the whole batch
+        replacements: dict[str, str] = {}
+        for text in texts:
+            yield self._emojifie(text, match, replacements)
+
+    def emojifie_stream(
+        self, lines: Iterable[str] | TextIO, match: MatchPolicy = "substring"
+    ) -> Iterator[str]:
+        replacements: dict[str, str] = {}
+        return _map_lines(lines, lambda text: self._emojifie(text, match, replacements))
+
+    def _emojifie(
+        self, text: str, match: MatchPolicy, replacements: dict[str, str]
+    ) -> str:
+        find = self._dataset.word_index.find
+        emojis = self._dataset.emojis
         tokens = text.split()
         for index, token in enumerate(tokens):
-            for emoji in self._emojis:
-                if token.lower() in emoji.name.lower():
-                    tokens[index] = emoji.emoji
-                    break
+            if token not in replacements:
+                if len(replacements) >= _MAX_REPLACEMENTS:
+                    replacements.clear()
+                ordinal = find(token, match)
+                replacements[token] = (
+                    token if ordinal is None else emojis[ordinal].emoji
+                )
+            tokens[index] = replacements[token]
         return " ".join(tokens)
 
+    def process_many(
+        self,
+        texts: Iterable[str],
+        op: Literal["emojifie", "contains_emojis", "find_emojis", "is_emoji"],
+        workers: int | None = None,
+        chunksize: int = 1000,
+        match: MatchPolicy = "substring",
+    ) -> Iterator[Any]:
+        # Imported on demand, most programs never start worker processes
+        from .parallel import process_many
+
+        return process_many(self._dataset, texts, op, workers, chunksize, match)
+
+    def count_emojis(
+        self, texts: Iterable[str], workers: int | None = 1, chunksize: int = 1000
+    ) -> "EmojiCounter":
+        if isinstance(texts, str):
+            texts = (texts,)
+        if workers == 1:
+            from .emoji_counter import EmojiCounter
+
+            counter = EmojiCounter(self._dataset)
+            counter.update(texts)
+            return counter
+        # Imported on demand, most programs never start worker processes
+        from .parallel import count_many
+
+        return count_many(self._dataset, texts, workers, chunksize)
+
     def to_html(self, emoji: str) -> str:
-        codepoints = [f"&#x{ord(char):X};" for char in emoji]
-        return "".join(codepoints)
+        return self._to_html(emoji)
+
+    def to_html_many(self, emojis: Iterable[str]) -> Iterator[str]:
+        # The html index of the dataset serves as the memo, other inputs go
+        # through the bounded entity table of html_entities
+        for emoji in emojis:
+            yield self._to_html(emoji)
+
+    def _to_html(self, emoji: str) -> str:
+        # Converting needs no dataset, so none is loaded just for this
+        dataset = self._loaded_dataset
+        if dataset is not None:
+            entities = dataset.html_index.get(emoji)
+            if entities is not None:
+                return entities
+        return html_entities(emoji)
+
+    def text_to_html(self, text: str, escape: bool = False) -> str:
+        from html import escape as escape_html
+
+        # The matched text may differ from the glyph of the dataset by an
+        # optional variation selector, so the index only serves exact matches
+        html_index = self._dataset.html_index
+        return self._replace_matches(
+            text,
+            lambda ordinal, matched: html_index.get(matched) or html_entities(matched),
+            escape_html if escape else str,
+        )
+
+    def strip_emojis(self, text: str) -> str:
+        return self._strip_emojis(text)
+
+    def strip_emojis_stream(self, lines: Iterable[str] | TextIO) -> Iterator[str]:
+        yield from _map_lines(lines, self._strip_emojis)
+
+    def replace_emojis(
+        self, text: str, replacement: str | Callable[[Emoji], str]
+    ) -> str:
+        return self._replace_emojis(text, replacement)
+
+    def replace_emojis_stream(
+        self, lines: Iterable[str] | TextIO, replacement: str | Callable[[Emoji], str]
+    ) -> Iterator[str]:
+        yield from _map_lines(
+            lines, partial(self._replace_emojis, replacement=replacement)
+        )
+
+    def demojize(self, text: str) -> str:
+        return self._demojize(text)
+
+    def demojize_stream(self, lines: Iterable[str] | TextIO) -> Iterator[str]:
+        yield from _map_lines(lines, self._demojize)
+
+    def emojize(self, text: str) -> str:
+        return self._emojize(text)
+
+    def emojize_stream(self, lines: Iterable[str] | TextIO) -> Iterator[str]:
+        yield from _map_lines(lines, self._emojize)
+
+    # The streams call the implementations below directly, so that metrics
+    # count a stream as a single call
+
+    def _strip_emojis(self, text: str) -> str:
+        return self._replace_matches(text, lambda ordinal, matched: "")
+
+    def _replace_emojis(
+        self, text: str, replacement: str | Callable[[Emoji], str]
+    ) -> str:
+        if isinstance(replacement, str):
+            return self._replace_matches(text, lambda ordinal, matched: replacement)
+        emojis = self._dataset.emojis
+        return self._replace_matches(
+            text, lambda ordinal, matched: replacement(emojis[ordinal])
+        )
+
+    def _demojize(self, text: str) -> str:
+        aliases = self._dataset.aliases
+        return self._replace_matches(text, lambda ordinal, matched: aliases[ordinal])
+
+    def _emojize(self, text: str) -> str:
+        alias_index = self._dataset.alias_index
+        parts: list[str] = []
+        position = 0
+        while match := _ALIAS.search(text, position):
+            glyph = alias_index.get(match.group().casefold())
+            if glyph is None:
+                # The closing colon may open the next alias
+                parts.append(text[position : match.end() - 1])
+                position = match.end() - 1
+            else:
+                parts.append(text[position : match.start()])
+                parts.append(glyph)
+                position = match.end()
+        if not parts:
+            return text
+        parts.append(text[position:])
+        return "".join(parts)
+
+    def _replace_matches(
+        self,
+        text: str,
+        replace: Callable[[int, str], str],
+        plain: Callable[[str], str] = str,
+    ) -> str:
+        # Single scan replacing each emoji from its ordinal and matched text,
+        # and the text around the emojis with plain
+        parts: list[str] = []
+        position = 0
+        for start, end, ordinal in self._dataset.scanner.iter_matches(text):
+            if start > position:
+                parts.append(plain(text[position:start]))
+            parts.append(replace(ordinal, text[start:end]))
+            position = end
+        if not parts:
+            return plain(text)
+        parts.append(plain(text[position:]))
+        return "".join(parts)
+
+
+def _map_lines(
+    lines: Iterable[str] | TextIO, transform: Callable[[str], str]
+) -> Iterator[str]:
+    for line in lines:
+        # Line breaks are kept so that the output can be written as is
+        text = line.rstrip("\r\n")
+        yield transform(text) + line[len(text) :]
@@ -0,0 +1,186 @@
+from array import array
+from collections import deque
+from collections.abc import Iterable, Iterator, Mapping, Sequence
+from itertools import accumulate
+from random import Random
+from typing import Literal
+
+from pymojis.domain.entities.emojis import Categories
+
+Exclude = Literal["complex"] | list[Categories] | None
+# Kind of pool and the categories it keeps or drops, if any
+_PoolKey = tuple[str, frozenset[str]]
+
+
+class RandomPools:
+    """
+    Ordinals of the emojis eligible for random selection, grouped by category.
+
+    Each category keeps two pools, one with every emoji and one with simple
+    emojis only (a single code point). Pools matching a categories/exclude
+    filter are assembled from them once, then cached, so drawing ``k`` emojis
+    costs O(k) instead of a pass over the whole dataset.
+
+    Filters follow get_random_emojis: ``categories`` takes precedence over
+    ``exclude``, and category names are compared case-insensitively. Names
+    unknown to the dataset are ignored, which also bounds the cache.
+    ``complex_flags`` holds a truthy value per complex emoji, such as the
+    bytes column of EmojiColumns.
+    """
+
+    def __init__(self, categories: Iterable[str], complex_flags: Iterable[int]):
+        all_pools: dict[str, array] = {}
+        simple_pools: dict[str, array] = {}
+        for ordinal, (category, is_complex) in enumerate(
+            zip(categories, complex_flags, strict=True)
+        ):
+            key = category.lower()
+            all_pools.setdefault(key, array("I")).append(ordinal)
+            simple_pools.setdefault(key, array("I"))
+            if not is_complex:
+                simple_pools[key].append(ordinal)
+
+        self._all = all_pools
+        self._simple = simple_pools
+        self._groups: dict[_PoolKey, tuple[tuple[str, array], ...]] = {}
+        self._pools: dict[_PoolKey, array] = {}
+
+    def _known(self, names: list[Categories]) -> frozenset[str]:
+        return frozenset(name.lower() for name in names).intersection(self._all)
+
+    def _key(self, categories: list[Categories] | None, exclude: Exclude) -> _PoolKey:
+        if categories:
+            return ("categories", self._known(categories))
+        if exclude == "complex":
+            return ("simple", frozenset())
+        if isinstance(exclude, list) and exclude:
+            return ("exclude", self._known(exclude))
+        return ("all", frozenset())
+
+    def groups(
+        self, categories: list[Categories] | None, exclude: Exclude
+    ) -> tuple[tuple[str, array], ...]:
+        """
+        Return the ``(category, ordinals)`` pools matching a filter, in
+        dataset order.
+        """
+        key = self._key(categories, exclude)
+        groups = self._groups.get(key)
+        if groups is None:
+            kind, selection = key
+            source = self._simple if kind == "simple" else self._all
+            if kind == "categories":
+                names = [name for name in source if name in selection]
+            elif kind == "exclude":
+                names = [name for name in source if name not in selection]
+            else:
+                names = list(source)
+            groups = tuple((name, source[name]) for name in names if source[name])
+            self._groups[key] = groups
+        return groups
+
+    def pool(
+        self, categories: list[Categories] | None, exclude: Exclude
+    ) -> Sequence[int]:
+        """
+        Return the ordinals of every emoji matching a filter, in dataset order.
+        """
+        key = self._key(categories, exclude)
+        pool = self._pools.get(key)
+        if pool is None:
+            pool = array("I")
+            for _, ordinals in self.groups(categories, exclude):
+                pool.extend(ordinals)
+            self._pools[key] = pool
+        return pool
+
+    def sample(
+        self,
+        rng: Random,
+        length: int,
+        categories: list[Categories] | None = None,
+        exclude: Exclude = None,
+    ) -> list[int]:
+        """
+        Draw up to ``length`` distinct ordinals matching a filter.
+        """
+        pool = self.pool(categories, exclude)
+        return rng.sample(pool, min(length, len(pool)))
+
+    def choices(
+        self,
+        rng: Random,
+        length: int,
+        weights: Mapping[str, float],
+        categories: list[Categories] | None = None,
+        exclude: Exclude = None,
+    ) -> list[int]:
+        """
+        Draw ``length`` ordinals matching a filter, with replacement.
+
+        A category is picked with a probability proportional to its weight,
+        then an emoji is picked uniformly inside it. Categories missing from
+        ``weights`` are never picked.
+        """
+        groups = self.groups(categories, exclude)
+        lowered = {category.lower(): weight for category, weight in weights.items()}
+        if any(weight < 0 for weight in lowered.values()):
+            raise ValueError("Category weights must not be negative")
+        cum_weights = list(accumulate(lowered.get(name, 0) for name, _ in groups))
+        if length <= 0 or not cum_weights or cum_weights[-1] <= 0:
+            return []
+
+        pools = rng.choices(
+            [ordinals for _, ordinals in groups], cum_weights=cum_weights, k=length
+        )
+        randrange = rng.randrange
+        return [pool[randrange(len(pool))] for pool in pools]
+
+    def iter_sample(
+        self,
+        rng: Random,
+        categories: list[Categories] | None = None,
+        exclude: Exclude = None,
+        window: int = 0,
+    ) -> Iterator[int]:
+        """
+        Yield ordinals matching a filter endlessly, ``window`` consecutive
+        ordinals being always distinct.
+
+        The window is capped to the size of the pool. Each draw costs O(1):
+        ordinals still eligible are kept at the front of a working copy of the
+        pool, and those drawn recently at its back until they leave the window.
+        """
+        pool = self.pool(categories, exclude)
+        if not pool:
+            return
+
+        randrange = rng.randrange
+        held_back = min(window - 1, len(pool) - 1)
+        if held_back <= 0:
+            size = len(pool)
+            while True:
+                yield pool[randrange(size)]
+
+        slots = list(pool)
+        positions = {ordinal: index for index, ordinal in enumerate(slots)}
+        available = len(slots)
+        recent: deque[int] = deque()
+
+        def swap(first: int, second: int) -> None:
+            a, b = slots[first], slots[second]
+            slots[first], slots[second] = b, a
+            positions[a], positions[b] = second, first
+
+        while True:
+            index = randrange(available)
+            ordinal = slots[index]
+            available -= 1
+            swap(index, available)
+            recent.append(ordinal)
+            yield ordinal
+
+            if len(recent) > held_back:
+                # The oldest ordinal leaves the window and is eligible again
+                swap(positions[recent.popleft()], available)
+                available += 1
@@ -0,0 +1,142 @@
+import sys
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Callable, Hashable
+from dataclasses import dataclass
+from typing import Any, TypeVar, cast
+
+T = TypeVar("T")
+
+
+@dataclass(frozen=True)
+class CacheStats:
+    hits: int
+    misses: int
+    evictions: int
+    entries: int
+    size_bytes: int
+
+
+def _size_of(key: Hashable, value: Any) -> int:
+    size = sys.getsizeof(key) + sys.getsizeof(value)
+    if isinstance(key, tuple):
+        size += sum(sys.getsizeof(item) for item in key)
+    return size
+
+
+class ResultCache:
+    """
+    Thread-safe LRU cache of results, bounded by entries and/or bytes.
+
+    Entries can also expire ``ttl`` seconds after being stored. Sizes in bytes
+    are estimated with sys.getsizeof over the key, its items and the value,
+    which is accurate for the strings and flags cached by PymojisManager.
+    Values are computed outside the lock, so a slow computation never blocks
+    other lookups; two threads missing the same key may both compute it.
+    """
+
+    def __init__(
+        self,
+        max_entries: int | None = 1024,
+        max_bytes: int | None = None,
+        ttl: float | None = None,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        for name, bound in (
+            ("max_entries", max_entries),
+            ("max_bytes", max_bytes),
+            ("ttl", ttl),
+        ):
+            if bound is not None and bound <= 0:
+                raise ValueError(f"{name} must be positive or None, got {bound}")
+
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.ttl = ttl
+        self._clock = clock
+        # key -> (value, expiry time or None, size in bytes)
+        self._entries: OrderedDict[Hashable, tuple[Any, float | None, int]] = (
+            OrderedDict()
+        )
+        self._size_bytes = 0
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        # Bumped by clear, so that values computed before are not stored after
+        self._generation = 0
+        self._lock = threading.Lock()
+
+    def get_or_compute(self, key: Hashable, compute: Callable[[], T]) -> T:
+        """
+        Return the value cached for ``key``, computing and storing it on a miss.
+
+        Unhashable keys bypass the cache.
+        """
+        try:
+            hash(key)
+        except TypeError:
+            return compute()
+
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                value, expires, _ = entry
+                if expires is None or expires > self._clock():
+                    self._entries.move_to_end(key)
+                    self._hits += 1
+                    return cast(T, value)
+                self._remove(key)
+            self._misses += 1
+            generation = self._generation
+
+        value = compute()
+        self._store(key, value, generation)
+        return value
+
+    def _store(self, key: Hashable, value: Any, generation: int) -> None:
+        size = _size_of(key, value)
+        if self.max_bytes is not None and size > self.max_bytes:
+            return
+        expires = None if self.ttl is None else self._clock() + self.ttl
+
+        with self._lock:
+            if generation != self._generation:
+                return
+            if key in self._entries:
+                self._remove(key)
+            self._entries[key] = (value, expires, size)
+            self._size_bytes += size
+            while (
+                self.max_entries is not None and len(self._entries) > self.max_entries
+            ) or (self.max_bytes is not None and self._size_bytes > self.max_bytes):
+                self._remove(next(iter(self._entries)))
+                self._evictions += 1
+
+    def _remove(self, key: Hashable) -> None:
+        # Callers hold the lock
+        _, _, size = self._entries.pop(key)
+        self._size_bytes -= size
+
+    def clear(self) -> None:
+        """
+        Drop every entry. Counters are kept.
+        """
+        with self._lock:
+            self._entries.clear()
+            self._size_bytes = 0
+            self._generation += 1
+
+    def stats(self) -> CacheStats:
+        with self._lock:
+            return CacheStats(
+                hits=self._hits,
+                misses=self._misses,
+                evictions=self._evictions,
+                entries=len(self._entries),
+                size_bytes=self._size_bytes,
+            )
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
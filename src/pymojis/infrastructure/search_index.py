@@ -0,0 +1,291 @@
+import re
+from bisect import bisect_left, bisect_right
+from collections.abc import Iterable, Sequence
+from collections.abc import Set as AbstractSet
+from itertools import islice
+
+_WORD_PATTERN = re.compile(r"\w+")
+# Bounds the fuzzy matches memoised per query token
+_MAX_FUZZY_TOKENS = 4096
+# Matches up to this size are sorted by rank, larger ones are filtered in
+# rank order
+_SORT_SIZE = 256
+# Prefixes of more words than this have their matches precomputed
+_WIDE_PREFIX = 32
+# Sorts after any word, see the word pattern
+_LAST_CHAR = "\U0010ffff"
+
+
+def _max_distance(length: int) -> int:
+    # Edits allowed for a query word of this length
+    if length < 3:
+        return 0
+    return 1 if length < 10 else 2
+
+
+def _deletions(word: str, depth: int) -> set[str]:
+    # The word and the strings left by deleting up to depth, at most two, of
+    # its characters
+    variants = {word}
+    if depth:
+        variants.update(word[:first] + word[first + 1 :] for first in range(len(word)))
+    if depth > 1:
+        variants.update(
+            word[:first] + word[first + 1 : second] + word[second + 1 :]
+            for first in range(len(word))
+            for second in range(first + 1, len(word))
+        )
+    return variants
+
+
+def _distance(first: str, second: str, bound: int) -> int:
+    """
+    Optimal string alignment distance (edits and adjacent transpositions)
+    between two words, or ``bound + 1`` as soon as it exceeds ``bound``.
+
+    Only the diagonal band of width ``2 * bound + 1`` of the edit matrix is
+    computed, cells outside of it being over the bound anyway.
+    """
+    over = bound + 1
+    if abs(len(first) - len(second)) > bound:
+        return over
+    before_previous = previous = [
+        column if column <= bound else over for column in range(len(second) + 1)
+    ]
+    for row, first_char in enumerate(first, 1):
+        current = [over] * (len(second) + 1)
+        if row <= bound:
+            current[0] = row
+        low = max(1, row - bound)
+        high = min(len(second), row + bound)
+        for column in range(low, high + 1):
+            second_char = second[column - 1]
+            value = previous[column - 1] + (first_char != second_char)
+            if previous[column] < value:
+                value = previous[column] + 1
+            if current[column - 1] < value:
+                value = current[column - 1] + 1
+            if (
+                row > 1
+                and column > 1
+                and first_char == second[column - 2]
+                and first[row - 2] == second_char
+                and before_previous[column - 2] < value
+            ):
+                value = before_previous[column - 2] + 1
+            current[column] = min(value, over)
+        if min(current[low - 1 : high + 1]) > bound:
+            return over
+        before_previous, previous = previous, current
+    return previous[-1]
+
+
+class EmojiSearchIndex:
+    """
+    Ranked type-ahead search over emoji names and sub categories.
+
+    Results come in four tiers, each ranked by name length then dataset order:
+
+    - exact: the query is the name
+    - prefix: the name starts with the query
+    - token: every query word starts a word of the name or sub category, with
+      emojis matching through their name first
+    - fuzzy: every query word starts a word or, when no word starts with it,
+      is within a small edit distance of a word, ranked by total distance
+
+    Names and queries are compared case-insensitively, as their words.
+
+    The sorted vocabulary serves as a prefix trie: the words starting with a
+    query word form a range of it, and the emojis they match are the union of
+    their postings, precomputed for the prefixes of many words. Matching a
+    query thus takes a few set operations. Fuzzy candidates are looked up in
+    the deletion neighbourhoods of the vocabulary: two words within ``k`` edits
+    share a string left by deleting up to ``k`` characters of each, so only a
+    handful of words are compared with a query word by edit distance. Matches
+    are finally ordered by filtering the emojis in rank order, stopping once
+    enough are found.
+    """
+
+    def __init__(self, names: Iterable[str], sub_categories: Iterable[str]):
+        # Names are compared as their words, so punctuation never matters
+        names = [" ".join(_WORD_PATTERN.findall(name.casefold())) for name in names]
+
+        self._order = sorted(range(len(names)), key=lambda ordinal: len(names[ordinal]))
+        self._rank = [0] * len(names)
+        for rank, ordinal in enumerate(self._order):
+            self._rank[ordinal] = rank
+
+        sorted_names = sorted(zip(names, range(len(names)), strict=True))
+        self._sorted_names = [name for name, _ in sorted_names]
+        self._sorted_ordinals = [ordinal for _, ordinal in sorted_names]
+
+        name_words: dict[str, set[int]] = {}
+        sub_category_words: dict[str, set[int]] = {}
+        for ordinal, (name, sub_category) in enumerate(
+            zip(names, sub_categories, strict=True)
+        ):
+            for word in name.split():
+                name_words.setdefault(word, set()).add(ordinal)
+            for word in _WORD_PATTERN.findall(sub_category.casefold()):
+                sub_category_words.setdefault(word, set()).add(ordinal)
+
+        self._vocabulary = sorted(name_words.keys() | sub_category_words.keys())
+        self._name_postings = [
+            frozenset(name_words.get(word, ())) for word in self._vocabulary
+        ]
+        self._sub_category_postings = [
+            frozenset(sub_category_words.get(word, ())) for word in self._vocabulary
+        ]
+        self._wide_prefixes: dict[str, tuple[frozenset[int], frozenset[int]]] = {}
+        prefixes = {word[:end] for word in self._vocabulary for end in range(len(word))}
+        for prefix in prefixes:
+            words = self._word_range(prefix)
+            if len(words) > _WIDE_PREFIX:
+                self._wide_prefixes[prefix] = self._union(words)
+        self._deletion_words: dict[str, list[int]] = {}
+        for word_id, word in enumerate(self._vocabulary):
+            # Longer query words spend their extra edits on insertions, so the
+            # edits allowed for the length of the word bound its deletions
+            for variant in _deletions(word, _max_distance(len(word))):
+                self._deletion_words.setdefault(variant, []).append(word_id)
+        self._fuzzy_words: dict[str, dict[int, int]] = {}
+
+    def search(self, query: str, limit: int | None = 10) -> list[int]:
+        """
+        Return the ordinals of the emojis matching ``query``, best first.
+        """
+        tokens = _WORD_PATTERN.findall(query.casefold())
+        if not tokens or (limit is not None and limit <= 0):
+            return []
+        query = " ".join(tokens)
+
+        results: list[int] = []
+        seen: set[int] = set()
+
+        def add(ordinals: Iterable[int]) -> bool:
+            # Tells whether the results are complete
+            for ordinal in ordinals:
+                if ordinal not in seen:
+                    seen.add(ordinal)
+                    results.append(ordinal)
+                    if limit is not None and len(results) >= limit:
+                        return True
+            return False
+
+        # Each tier returns up to limit matches, enough to complete the
+        # results whatever the overlap with the previous tiers
+        if (
+            add(self._name_matches(query, query, limit))
+            or add(self._name_matches(query, query + _LAST_CHAR, limit))
+            or add(self._word_matches(tokens, None, limit))
+        ):
+            return results
+        fuzzy_words = [self._fuzzy_word_ids(token) for token in tokens]
+        # Without fuzzy words, the fuzzy tier is the token tier again
+        if any(fuzzy_words):
+            add(self._word_matches(tokens, fuzzy_words, limit))
+        return results
+
+    def _word_range(self, prefix: str) -> range:
+        # Identifiers of the words of the vocabulary starting with prefix
+        vocabulary = self._vocabulary
+        start = bisect_left(vocabulary, prefix)
+        return range(start, bisect_left(vocabulary, prefix + _LAST_CHAR, start))
+
+    def _union(self, words: range) -> tuple[frozenset[int], frozenset[int]]:
+        return (
+            frozenset().union(*self._name_postings[words.start : words.stop]),
+            frozenset().union(*self._sub_category_postings[words.start : words.stop]),
+        )
+
+    def _prefix_postings(self, prefix: str) -> tuple[frozenset[int], frozenset[int]]:
+        # Emojis with a word of the name, and of the sub category, starting
+        # with prefix
+        postings = self._wide_prefixes.get(prefix)
+        return self._union(self._word_range(prefix)) if postings is None else postings
+
+    def _ranked(self, ordinals: AbstractSet[int], limit: int | None) -> list[int]:
+        if limit is None or len(ordinals) <= _SORT_SIZE:
+            return sorted(ordinals, key=self._rank.__getitem__)[:limit]
+        return list(islice(filter(ordinals.__contains__, self._order), limit))
+
+    def _name_matches(self, low: str, high: str, limit: int | None) -> list[int]:
+        # Emojis whose name sorts between low and high, both included
+        names = self._sorted_names
+        start = bisect_left(names, low)
+        end = bisect_right(names, high, start)
+        return self._ranked(set(self._sorted_ordinals[start:end]), limit)
+
+    def _word_matches(
+        self,
+        tokens: Sequence[str],
+        fuzzy_words: Sequence[dict[int, int]] | None,
+        limit: int | None,
+    ) -> list[int]:
+        # For each token, the emojis it matches with each distance: 0 when it
+        # starts a word of the name, one more through the sub category only
+        token_groups: list[list[AbstractSet[int]]] = []
+        candidates: AbstractSet[int] | None = None
+        for index, token in enumerate(tokens):
+            groups: list[AbstractSet[int]] = list(self._prefix_postings(token))
+            if fuzzy_words:
+                for word_id, distance in fuzzy_words[index].items():
+                    while len(groups) < distance + 2:
+                        groups.append(frozenset())
+                    groups[distance] = groups[distance] | self._name_postings[word_id]
+                    groups[distance + 1] = (
+                        groups[distance + 1] | self._sub_category_postings[word_id]
+                    )
+            matched = frozenset().union(*groups)
+            candidates = matched if candidates is None else candidates & matched
+            if not candidates:
+                return []
+            token_groups.append(groups)
+
+        # Candidates grouped by their total distance over the tokens
+        totals: dict[int, AbstractSet[int]] = {0: candidates or frozenset()}
+        for groups in token_groups:
+            next_totals: dict[int, AbstractSet[int]] = {}
+            for total, members in totals.items():
+                for distance, group in enumerate(groups):
+                    hits = members & group
+                    if hits:
+                        key = total + distance
+                        next_totals[key] = next_totals.get(key, frozenset()) | hits
+                        members = members - hits
+                        if not members:
+                            break
+            totals = next_totals
+
+        results: list[int] = []
+        for total in sorted(totals):
+            remaining = None if limit is None else limit - len(results)
+            results += self._ranked(totals[total], remaining)
+            if limit is not None and len(results) >= limit:
+                break
+        return results
+
+    def _fuzzy_word_ids(self, token: str) -> dict[int, int]:
+        # Words of the vocabulary within the edit distance allowed for token,
+        # unless some word starts with it: it is then taken as spelled right
+        if token in self._fuzzy_words:
+            return self._fuzzy_words[token]
+
+        matches: dict[int, int] = {}
+        bound = _max_distance(len(token))
+        if bound and not self._word_range(token):
+            # Each edit, a transposition included, amounts to deleting at
+            # most one character of token and one of the word
+            candidates: set[int] = set()
+            for variant in _deletions(token, bound):
+                candidates.update(self._deletion_words.get(variant, ()))
+            vocabulary = self._vocabulary
+            for word_id in candidates:
+                distance = _distance(token, vocabulary[word_id], bound)
+                if distance <= bound:
+                    matches[word_id] = distance
+
+        if len(self._fuzzy_words) >= _MAX_FUZZY_TOKENS:
+            self._fuzzy_words.clear()
+        self._fuzzy_words[token] = matches
+        return matches
@@ -1,17 +1,58 @@
 import warnings
-from typing import Any, Literal
+from collections.abc import Iterable, Iterator
+from typing import Any, TextIO, cast
 
-from pymojis.domain.entities.emojis import Categories, Emoji
+from pymojis.domain.entities.emojis import VALID_CATEGORIES
 
 
-def should_exclude(emoji: Emoji, exclude: Literal["complex"] | list[Categories] | None):
-    if exclude == "complex" and len(emoji.code) > 1:
-        return True
-    if isinstance(exclude, list) and emoji.category.lower() in (
-        excluded.lower() for excluded in exclude
-    ):
-        return True
-    return False
+def is_valid_dataset(emojis_data: dict[str, Any]) -> bool:
+    """Check in a single pass that every record of a dataset is a valid emoji.
+
+    Applies the same rules as the Emoji constructor, so that a dataset passing
+    this check can be built with Emoji.from_trusted.
+    """
+    for category, subcategories in emojis_data.items():
+        if category not in VALID_CATEGORIES or not isinstance(subcategories, dict):
+            return False
+        for subcategory, emojis_list in subcategories.items():
+            if not subcategory.strip() or not isinstance(emojis_list, list):
+                return False
+            for emoji_data in emojis_list:
+                if not isinstance(emoji_data, dict):
+                    return False
+                name = emoji_data.get("name")
+                code = emoji_data.get("code")
+                emoji = emoji_data.get("emoji")
+                if not (
+                    isinstance(name, str)
+                    and name.strip()
+                    and isinstance(emoji, str)
+                    and emoji
+                    and isinstance(code, list)
+                    and code
+                    and all(isinstance(c, str) and c.strip() for c in code)
+                ):
+                    return False
+    return True
+
+
+class _EntityTable(dict[int, str]):
+    # str.translate table filling in the entity of each code point on first use
+    def __missing__(self, codepoint: int) -> str:
+        entity = f"&#x{codepoint:X};"
+        if len(self) < _MAX_ENTITIES:
+            self[codepoint] = entity
+        return entity
+
+
+# Bounds the entities kept for arbitrary input
+_MAX_ENTITIES = 4096
+_ENTITIES = _EntityTable()
+
+
+def html_entities(text: str) -> str:
+    """Encode every character of ``text`` as a hexadecimal HTML entity."""
+    return text.translate(_ENTITIES)
 
 
 def check_type(value, expected_type: type[Any] | tuple[type[Any], ...]) -> bool:
@@ -21,3 +62,41 @@ def check_type(value, expected_type: type[Any] | tuple[type[Any], ...]) -> bool:
         )
         return False
     return True
+
+
+def checked_items(
+    values: Iterable[Any], expected_type: type[Any] | tuple[type[Any], ...]
+) -> Iterator[Any | None]:
+    """Yield each value, replacing the ones of the wrong type by None.
+
+    Unlike check_type, a single warning is emitted for the whole batch.
+    """
+    warned = False
+    for value in values:
+        if isinstance(value, expected_type):
+            yield value
+            continue
+        if not warned:
+            warnings.warn(
+                f"\n\nExpected items of type {expected_type}, got {type(value)}\n",
+                stacklevel=2,
+            )
+            warned = True
+        yield None
+
+
+def iter_text_chunks(
+    source: Iterable[str] | TextIO, chunk_size: int = 64 * 1024
+) -> Iterator[str]:
+    """Yield the text of ``source`` in pieces of bounded size.
+
+    Text files are read ``chunk_size`` characters at a time, so that a file
+    without line breaks is never loaded whole. Other iterables are passed
+    through as they are.
+    """
+    if hasattr(source, "read"):
+        read = cast(TextIO, source).read
+        while chunk := read(chunk_size):
+            yield chunk
+    else:
+        yield from source
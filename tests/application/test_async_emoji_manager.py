@@ -0,0 +1,39 @@
+import asyncio
+
+import pytest
+
+from pymojis.infrastructure.data_loader.emojis_loader import DatasetConfig
+from pymojis.infrastructure.exceptions import DatasetNotFoundError
+from src.pymojis.application.async_pymojis_manager import AsyncPymojisManager
+
+
+def test_create_loads_dataset():
+    async def scenario():
+        manager = await AsyncPymojisManager.create()
+        assert manager.manager.repository._loaded_dataset is not None
+        return manager.manager.get_by_code("1F604")
+
+    assert asyncio.run(scenario()) == "😄"
+
+
+def test_create_missing_dataset():
+    config = DatasetConfig("pymojis.missing", "emoji_data.json", "missing")
+    with pytest.raises(DatasetNotFoundError):
+        asyncio.run(AsyncPymojisManager.create(dataset_configs=[config]))
+
+
+def test_async_batch_helpers():
+    async def scenario():
+        manager = await AsyncPymojisManager.create()
+        texts = ["I'm sleepy", "dizzy 😵‍💫"]
+        emojified, contained, found = await asyncio.gather(
+            manager.emojifie_many(texts),
+            manager.contains_emojis_many(texts),
+            manager.find_emojis("dizzy 😵‍💫"),
+        )
+        assert emojified == manager.manager.emojifie_many(texts)
+        assert contained == [False, True]
+        assert [match.emoji.emoji for match in found] == ["😵‍💫"]
+        assert await manager.emojifie("I'm sleepy") == "I'm 😪"
+
+    asyncio.run(scenario())
@@ -1,4 +1,18 @@
+import io
+from itertools import islice
+from random import Random
+
+import pytest
+
 from pymojis.domain.entities.emojis import Emoji
+from pymojis.infrastructure import pymojis_repository
+from pymojis.infrastructure.data_loader.emojis_loader import (
+    DatasetConfig,
+    EmojiDataLoader,
+)
+from pymojis.infrastructure.dataset_registry import DatasetRegistry
+from pymojis.infrastructure.exceptions import DatasetNotFoundError
+from pymojis.infrastructure.result_cache import ResultCache
 from src.pymojis.application.pymojis_manager import PymojisManager
 
 
@@ -48,3 +62,241 @@ def test_get_emoji_by_category(manager: PymojisManager):
     emojis = manager.get_by_category("Activities")
     assert len(emojis) > 0
     assert all(isinstance(emoji, str) for emoji in emojis)
+
+
+def test_find_emojis(manager: PymojisManager):
+    matches = manager.find_emojis("Hello 😄!")
+    assert len(matches) == 1
+    assert (matches[0].start, matches[0].end) == (6, 7)
+    assert matches[0].emoji.emoji == "😄"
+
+
+def test_get_by_codes(manager: PymojisManager):
+    assert manager.get_by_codes(["1F604", "1f600", "unknown"]) == ["😄", "😀", None]
+
+
+def test_get_by_names_invalid_items(manager: PymojisManager):
+    with pytest.warns(UserWarning):
+        result = manager.get_by_names(["grinning face", 1234])
+    assert result == ["😀", None]
+
+
+def test_contains_emojis_many_lazy(manager: PymojisManager):
+    result = manager.contains_emojis_many(iter(["Hello 😄", "Hello"]), lazy=True)
+    assert not isinstance(result, list)
+    assert list(result) == [True, False]
+
+
+def test_emojifie_many(manager: PymojisManager):
+    texts = ["I'm sleepy", "very sleepy"]
+    assert manager.emojifie_many(texts) == [manager.emojifie(text) for text in texts]
+
+
+def test_to_html_many(manager: PymojisManager):
+    assert manager.to_html_many(["😪", "😵‍💫", "😪"]) == [
+        "&#x1F62A;",
+        "&#x1F635;&#x200D;&#x1F4AB;",
+        "&#x1F62A;",
+    ]
+
+
+def test_managers_share_dataset(monkeypatch):
+    # A fresh registry, so that reloading leaves the process-wide one alone
+    registry = DatasetRegistry()
+    monkeypatch.setattr(pymojis_repository, "default_registry", registry)
+    first, second = PymojisManager(), PymojisManager()
+    assert first.repository._dataset is second.repository._dataset
+    assert len(registry) == 1
+    second.reload()
+    assert second.get_by_code("1F604") == "😄"
+    assert first.repository._dataset is not second.repository._dataset
+
+
+def test_lazy_manager_loads_on_first_use():
+    manager = PymojisManager()
+    assert manager.repository._loaded_dataset is None
+    assert manager.to_html("😀") == "&#x1F600;"
+    assert manager.repository._loaded_dataset is None
+    assert manager.get_by_code("1F604") == "😄"
+    assert manager.repository._loaded_dataset is not None
+
+
+def test_eager_manager_reports_missing_dataset():
+    config = DatasetConfig("pymojis.missing", "emoji_data.json", "missing")
+    lazy = PymojisManager(dataset_configs=[config])
+    with pytest.raises(DatasetNotFoundError):
+        lazy.warmup()
+    with pytest.raises(DatasetNotFoundError):
+        PymojisManager(dataset_configs=[config]).get_by_name("grinning face")
+    with pytest.raises(DatasetNotFoundError):
+        PymojisManager(dataset_configs=[config], lazy=False)
+
+
+def test_get_random_seeded():
+    first = PymojisManager(rng=Random(42)).get_random(length=5, exclude="complex")
+    second = PymojisManager(rng=Random(42)).get_random(length=5, exclude="complex")
+    assert first == second
+
+
+def test_get_random_weighted(manager: PymojisManager):
+    emojis = manager.get_random(length=20, weights={"Animals & Nature": 1})
+    assert len(emojis) == 20
+    assert all(emoji.category == "Animals & Nature" for emoji in emojis)
+
+
+def test_iter_random(manager: PymojisManager):
+    stream = manager.iter_random(categories=["Flags"], window=20)
+    emojis = list(islice(stream, 200))
+    assert len(emojis) == 200
+    assert all(emoji.category == "Flags" for emoji in emojis)
+    assert all(len(set(emojis[i : i + 20])) == 20 for i in range(180))
+
+
+def test_iter_emojis_stream_file(manager: PymojisManager):
+    text = "good night 😵‍💫 " * 5000
+    matches = list(manager.iter_emojis_stream(io.StringIO(text)))
+    assert len(matches) == 5000
+    assert matches[1].start == len("good night 😵‍💫 ") + 11
+    assert {match.emoji.emoji for match in matches} == {"😵‍💫"}
+    assert manager.contains_emojis_stream(["I'm sleepy 😵", "‍💫"])
+    assert not manager.contains_emojis_stream(io.StringIO("no emoji here"))
+
+
+def test_emojifie_stream_keeps_line_breaks(manager: PymojisManager):
+    lines = ["I'm sleepy\n", "good  night\r\n", "sleepy"]
+    assert list(manager.emojifie_stream(lines)) == [
+        manager.emojifie("I'm sleepy") + "\n",
+        manager.emojifie("good night") + "\r\n",
+        manager.emojifie("sleepy"),
+    ]
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_process_many(manager: PymojisManager, workers: int):
+    texts = ["I'm sleepy", "dizzy 😵‍💫", "", "😪"] * 25
+    assert manager.process_many(texts, "emojifie", workers, chunksize=7) == [
+        manager.emojifie(text) for text in texts
+    ]
+    assert manager.process_many(texts, "find_emojis", workers, chunksize=7) == [
+        manager.find_emojis(text) for text in texts
+    ]
+
+
+def test_process_many_ships_operation_indexes_only(monkeypatch):
+    monkeypatch.setattr(pymojis_repository, "default_registry", DatasetRegistry())
+    manager = PymojisManager()
+    texts = ["dizzy 😵‍💫", "😪"] * 4
+    assert manager.process_many(texts, "contains_emojis", 2, chunksize=2) == [True] * 8
+    built = vars(manager.repository._dataset)
+    assert "scanner" in built
+    assert "search_index" not in built and "word_index" not in built
+
+
+def test_process_many_invalid_op(manager: PymojisManager):
+    with pytest.raises(ValueError):
+        manager.process_many(["text"], "to_html", lazy=True)  # type: ignore[arg-type]
+
+
+def test_result_cache():
+    cache = ResultCache(max_entries=100)
+    manager = PymojisManager(cache=cache)
+    assert manager.get_by_name("grinning face") == "😀"
+    assert manager.get_by_name("grinning face") == "😀"
+    assert manager.emojifie("I'm sleepy") == manager.emojifie("I'm sleepy")
+    assert cache.stats().hits == 2
+
+    manager.reload()
+    assert len(cache) == 0
+    assert manager.get_by_code("1F604") == "😄"
+
+    with pytest.warns(UserWarning):
+        manager.get_by_name(5)  # type: ignore[arg-type]
+    with pytest.warns(UserWarning):
+        manager.get_by_name(5)  # type: ignore[arg-type]
+
+
+def test_result_cache_shared_by_managers():
+    cache = ResultCache(max_entries=100)
+    light = PymojisManager(cache=cache)
+    assert light.get_by_name("grinning face") == "😀"
+    other = PymojisManager(
+        cache=cache, dataset_configs=[DatasetConfig("pymojis.missing", "x", "x")]
+    )
+    # Not served from the entry of the first manager
+    with pytest.raises(DatasetNotFoundError):
+        other.get_by_name("grinning face")
+
+
+def test_text_to_html(manager: PymojisManager):
+    assert manager.text_to_html("I'm 😪 <3") == "I'm &#x1F62A; <3"
+    assert manager.text_to_html("😵‍💫😪") == "&#x1F635;&#x200D;&#x1F4AB;&#x1F62A;"
+    assert manager.text_to_html("a & b 😪", escape=True) == "a &amp; b &#x1F62A;"
+    assert manager.text_to_html("no emojis") == "no emojis"
+
+
+def test_text_to_html_encodes_matched_text(manager: PymojisManager):
+    # Matched with and without the variation selector of the dataset glyph
+    assert manager.text_to_html("\u263a\ufe0f") == "&#x263A;&#xFE0F;"
+    assert manager.text_to_html("\u263a!") == "&#x263A;!"
+    assert manager.to_html("x😪") == "&#x78;&#x1F62A;"
+
+
+def test_strip_and_replace_emojis(manager: PymojisManager):
+    assert manager.strip_emojis("good 😵‍💫night 😪") == "good night "
+    assert manager.strip_emojis("no emojis") == "no emojis"
+    assert manager.replace_emojis("a😪b😄", "_") == "a_b_"
+    assert manager.replace_emojis("a😪", lambda emoji: emoji.name) == "asleepy face"
+    assert list(manager.strip_emojis_stream(["hi 😄\n", "bye 😪"])) == ["hi \n", "bye "]
+    assert list(manager.replace_emojis_stream(["😄\r\n"], "x")) == ["x\r\n"]
+
+
+def test_demojize_and_emojize(manager: PymojisManager):
+    text = "I'm 😪, really 😵‍💫"
+    demojized = manager.demojize(text)
+    assert demojized == "I'm :sleepy_face:, really :face_with_spiral_eyes:"
+    assert manager.emojize(demojized) == text
+    assert manager.emojize(":nope::SLEEPY_FACE: 10:30: :") == ":nope:😪 10:30: :"
+    assert list(manager.demojize_stream(["😪\n"])) == [":sleepy_face:\n"]
+    assert list(manager.emojize_stream([":sleepy_face:\n"])) == ["😪\n"]
+
+    for emoji in manager.get_all_emojis():
+        assert manager.emojize(manager.demojize(emoji.emoji)) == emoji.emoji
+
+
+def test_demojize_round_trip_on_full_dataset():
+    manager = PymojisManager(dataset_configs=[EmojiDataLoader.DEFAULT_DATASETS[1]])
+    emojis = manager.get_all_emojis()
+    aliases = [manager.demojize(emoji.emoji) for emoji in emojis]
+    assert len({alias.casefold() for alias in aliases}) == len(emojis)
+    for emoji, alias in zip(emojis, aliases, strict=True):
+        assert manager.emojize(alias) == emoji.emoji
+
+
+def test_count_emojis(manager: PymojisManager):
+    texts = ["good night 😪", "😪😄", "nothing"] * 5
+    counter = manager.count_emojis(texts)
+    assert counter.total() == 15
+    assert counter.most_common(1)[0][1] == 10
+    assert counter.by_category() == {"Smileys & Emotion": 15}
+    assert manager.count_emojis("😪 😪")["😪"] == 2
+
+    parallel = manager.count_emojis(iter(texts), workers=2, chunksize=4)
+    assert list(parallel.counts) == list(counter.counts)
+
+
+def test_search(manager: PymojisManager):
+    assert [emoji.emoji for emoji in manager.search("grinning face", limit=3)] == [
+        "😀",
+        "😅",
+        "😃",
+    ]
+    assert manager.search("sleepy", limit=1)[0].name == "sleepy face"
+    assert [emoji.name for emoji in manager.search("slepy face", limit=1)] == [
+        "sleepy face"
+    ]
+    assert len(manager.search("face", limit=None)) > 10
+    assert manager.search("xyzzy") == []
+    with pytest.warns(UserWarning):
+        assert manager.search(5) == []  # type: ignore[arg-type]
+    with pytest.warns(UserWarning):
+        assert manager.search("smile", limit="3") == []  # type: ignore[arg-type]
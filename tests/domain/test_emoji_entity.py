@@ -1,3 +1,5 @@
+import pickle
+
 import pytest
 
 from src.pymojis.domain.entities.emojis import Emoji
@@ -11,7 +13,7 @@ def test_create_emoji():
         category="Smileys & Emotion",
         sub_category="faces",
     )
-    assert emoji.code == ["1F600"]
+    assert emoji.code == ("1F600",)
     assert emoji.name == "grinning face"
     assert emoji.category == "Smileys & Emotion"
     assert emoji.sub_category == "faces"
@@ -27,3 +29,59 @@ def test_create_emoji_wrong():
             sub_category=12345,
         )
     assert value_error
+
+
+def _dizzy_face() -> Emoji:
+    return Emoji(
+        emoji="😵‍💫",
+        code=["1F635", "200D", "1F4AB"],
+        name="face with spiral eyes",
+        category="Smileys & Emotion",
+        sub_category="face-unwell",
+    )
+
+
+def test_emoji_id_is_derived_from_code():
+    emoji = _dizzy_face()
+    assert emoji.id == "1F635-200D-1F4AB"
+    assert emoji == _dizzy_face()
+    assert hash(emoji) == hash(_dizzy_face())
+
+
+def test_emoji_is_immutable():
+    emoji = _dizzy_face()
+    with pytest.raises(AttributeError):
+        emoji.name = "other"
+    with pytest.raises(AttributeError):
+        emoji.extra = "value"
+
+
+def test_emoji_shares_category_strings():
+    category = "".join(["Smileys", " & ", "Emotion"])
+    emoji = Emoji(
+        emoji="😀",
+        code=("1F600",),
+        name="grinning face",
+        category=category,
+        sub_category="face-smiling",
+    )
+    assert emoji.category is _dizzy_face().category
+
+
+def test_emoji_pickle_roundtrip():
+    emoji = _dizzy_face()
+    restored = pickle.loads(pickle.dumps(emoji))
+    assert restored == emoji
+    assert restored.name == emoji.name
+
+
+def test_emoji_from_trusted():
+    emoji = Emoji.from_trusted(
+        "Smileys & Emotion",
+        "face-unwell",
+        ["1F635", "200D", "1F4AB"],
+        "face with spiral eyes",
+        "😵‍💫",
+    )
+    assert emoji == _dizzy_face()
+    assert emoji.code == ("1F635", "200D", "1F4AB")
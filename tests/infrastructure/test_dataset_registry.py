@@ -0,0 +1,65 @@
+import threading
+
+from pymojis.infrastructure.dataset_registry import DatasetRegistry
+from pymojis.infrastructure.emoji_dataset import EmojiDataset
+from pymojis.infrastructure.pymojis_repository import PymojisRepositoryImpl
+
+
+def test_registry_loads_once():
+    registry = DatasetRegistry()
+    calls = []
+
+    def load() -> EmojiDataset:
+        calls.append(1)
+        return EmojiDataset(())
+
+    first = registry.get_or_load("key", load)
+    assert registry.get_or_load("key", load) is first
+    assert len(calls) == 1
+
+
+def test_registry_concurrent_loads_are_collapsed():
+    registry = DatasetRegistry()
+    calls = []
+    started = threading.Event()
+
+    def load() -> EmojiDataset:
+        calls.append(1)
+        started.wait(0.1)
+        return EmojiDataset(())
+
+    results = []
+    threads = [
+        threading.Thread(target=lambda: results.append(registry.get_or_load("k", load)))
+        for _ in range(4)
+    ]
+    for thread in threads:
+        thread.start()
+    started.set()
+    for thread in threads:
+        thread.join()
+    assert len(calls) == 1
+    assert all(result is results[0] for result in results)
+
+
+def test_registry_invalidate_and_reload():
+    registry = DatasetRegistry()
+    first = registry.get_or_load("key", lambda: EmojiDataset(()))
+    assert registry.reload("key", lambda: EmojiDataset(())) is not first
+    registry.invalidate("key")
+    assert "key" not in registry
+    registry.get_or_load("key", lambda: EmojiDataset(()))
+    registry.invalidate()
+    assert len(registry) == 0
+
+
+def test_repositories_share_dataset():
+    registry = DatasetRegistry()
+    first = PymojisRepositoryImpl(registry=registry)
+    second = PymojisRepositoryImpl(registry=registry)
+    first.load_emojis()
+    second.load_emojis()
+    assert first._dataset is second._dataset
+    assert len(registry) == 1
+    second.load_emojis(reload=True)
+    assert first._dataset is not second._dataset
@@ -0,0 +1,78 @@
+import pytest
+
+from pymojis.infrastructure.emoji_columns import EmojiColumns, PackedStrings
+from pymojis.infrastructure.emoji_dataset import EmojiDataset
+from pymojis.infrastructure.exceptions import InfrastructureError
+
+RAW = {
+    "emojis": {
+        "Smileys & Emotion": {
+            "face-smiling": [
+                {"code": ["1F600"], "emoji": "😀", "name": "grinning face"},
+                {
+                    "code": ["1F635", "200D", "1F4AB"],
+                    "emoji": "😵‍💫",
+                    "name": "face with spiral eyes",
+                },
+            ]
+        },
+        "Flags": {
+            "country-flag": [
+                {"code": ["1F1EB", "1F1F7"], "emoji": "🇫🇷", "name": "flag: France"}
+            ]
+        },
+        "Symbols": {
+            "heart": [{"code": ["2764", "FE0F"], "emoji": "❤️", "name": "red heart"}]
+        },
+    }
+}
+
+
+@pytest.fixture
+def dataset() -> EmojiDataset:
+    return EmojiDataset.from_raw(RAW, trusted=True)
+
+
+def test_packed_strings():
+    strings = PackedStrings(["ab", "", "😀x"])
+    assert list(strings) == ["ab", "", "😀x"]
+    assert strings[-1] == "😀x"
+    assert strings[1:] == ["", "😀x"]
+    with pytest.raises(IndexError):
+        strings[3]
+
+
+def test_emojis_are_built_on_access(dataset: EmojiDataset):
+    assert dataset.emojis._cache == [None] * 4
+    assert dataset.name_index["flag: france"] == "🇫🇷"
+    assert dataset.emojis._cache == [None] * 4
+    assert dataset.emojis[1].code == ("1F635", "200D", "1F4AB")
+    assert dataset.emojis[1] is dataset.emojis[1]
+    assert dataset.emojis == EmojiDataset.from_raw(RAW).emojis
+
+
+def test_masks(dataset: EmojiDataset):
+    columns = dataset.columns
+    assert columns.mask() == b"\x01\x01\x01\x01"
+    assert columns.mask(exclude="complex") == b"\x01\x00\x00\x00"
+    assert list(columns.ordinals(exclude=["flags", "Symbols"])) == [0, 1]
+    assert list(columns.ordinals(categories=["SYMBOLS", "unknown"])) == [3]
+    assert list(columns.ordinals(categories=["Flags"], exclude="complex")) == []
+
+
+def test_columns_match_emojis(dataset: EmojiDataset):
+    columns = EmojiColumns.from_emojis(EmojiDataset.from_raw(RAW).emojis)
+    assert list(columns.glyphs) == list(dataset.columns.glyphs)
+    assert columns.complex_flags == dataset.columns.complex_flags
+    assert [columns.build_emoji(i) for i in range(4)] == list(dataset.emojis)
+
+
+def test_numpy_mask(dataset: EmojiDataset):
+    try:
+        import numpy  # noqa: F401
+    except ImportError:
+        with pytest.raises(InfrastructureError):
+            dataset.columns.numpy_mask()
+    else:
+        mask = dataset.columns.numpy_mask(exclude="complex")
+        assert mask.tolist() == [True, False, False, False]
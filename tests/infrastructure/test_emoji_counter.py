@@ -0,0 +1,78 @@
+import pickle
+
+import pytest
+
+from pymojis.domain.entities.emojis import Emoji
+from pymojis.infrastructure.emoji_counter import EmojiCounter
+from pymojis.infrastructure.emoji_dataset import EmojiDataset
+
+
+def make_emoji(name: str, glyph: str, category: str, sub_category: str) -> Emoji:
+    return Emoji(
+        name=name,
+        emoji=glyph,
+        code=[f"{ord(glyph[0]):X}"],
+        category=category,
+        sub_category=sub_category,
+    )
+
+
+@pytest.fixture
+def dataset() -> EmojiDataset:
+    return EmojiDataset(
+        [
+            make_emoji("grinning face", "😀", "Smileys & Emotion", "face-smiling"),
+            make_emoji("sleepy face", "😪", "Smileys & Emotion", "face-sleepy"),
+            make_emoji("red heart", "❤️", "Smileys & Emotion", "heart"),
+            make_emoji("dog face", "🐶", "Animals & Nature", "animal-mammal"),
+        ]
+    )
+
+
+def test_counts_and_rollups(dataset):
+    counter = EmojiCounter(dataset)
+    counter.update(["😪 😪 🐶", "no emoji", "❤ and ❤️ 😪"])
+
+    assert counter.total() == 6
+    assert counter["😪"] == 3
+    assert counter["❤"] == counter["❤️"] == 2
+    assert counter["😀"] == counter["x"] == counter[""] == 0
+    assert [(emoji.emoji, count) for emoji, count in counter.most_common(2)] == [
+        ("😪", 3),
+        ("❤️", 2),
+    ]
+    assert len(counter.most_common()) == 3
+    assert counter.by_category() == {"Smileys & Emotion": 5, "Animals & Nature": 1}
+    assert counter.by_subcategory() == {
+        "face-sleepy": 3,
+        "heart": 2,
+        "animal-mammal": 1,
+    }
+
+
+def test_rollups_use_columns(dataset):
+    columnar = EmojiDataset.from_columns(dataset.columns)
+    counter = EmojiCounter(columnar)
+    counter.update(["😪 🐶 🐶"])
+
+    assert counter.by_category() == {"Smileys & Emotion": 1, "Animals & Nature": 2}
+    assert counter.by_subcategory() == {"face-sleepy": 1, "animal-mammal": 2}
+    # Rollups are summed by column id, without materialising any emoji
+    assert columnar.emojis._cache == [None] * len(columnar)
+
+
+def test_merge(dataset):
+    first = EmojiCounter(dataset)
+    first.update(["😀😀"])
+    second = EmojiCounter(dataset)
+    second.update(["😀🐶"])
+
+    # Partial counts travel between processes as their array
+    first.merge(pickle.loads(pickle.dumps(second.counts)))
+    assert [count for _, count in first.items()] == [3, 1]
+    first.merge(second)
+    assert first.total() == 6
+    assert EmojiCounter(dataset, first.counts).total() == 6
+
+    with pytest.raises(ValueError):
+        first.merge([1, 2])
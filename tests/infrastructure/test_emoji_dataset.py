@@ -0,0 +1,32 @@
+from pymojis.infrastructure.emoji_dataset import EmojiDataset
+
+
+def _dataset(*records: dict) -> dict:
+    return {"emojis": {"Smileys & Emotion": {"face-smiling": list(records)}}}
+
+
+GRINNING = {"code": ["1F600"], "emoji": "😀", "name": "grinning face"}
+
+
+def test_parse_trusted_matches_validated():
+    trusted = EmojiDataset.from_raw(_dataset(GRINNING), trusted=True)
+    validated = EmojiDataset.from_raw(_dataset(GRINNING))
+    assert trusted.emojis == validated.emojis
+
+
+def test_parse_trusted_invalid_dataset_falls_back():
+    invalid = {"code": [], "emoji": "?", "name": "broken"}
+    dataset = EmojiDataset.from_raw(_dataset(GRINNING, invalid), trusted=True)
+    assert [emoji.name for emoji in dataset.emojis] == ["grinning face"]
+
+
+def test_indexes_built_on_first_use():
+    dataset = EmojiDataset.from_raw(_dataset(GRINNING), trusted=True)
+    assert "name_index" not in vars(dataset)
+    assert dataset.name_index["grinning face"] == "😀"
+    assert "name_index" in vars(dataset)
+    assert "scanner" not in vars(dataset)
+
+    dataset.warmup()
+    assert "scanner" in vars(dataset)
+    assert "word_index" in vars(dataset)
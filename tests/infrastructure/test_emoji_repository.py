@@ -1,3 +1,5 @@
+import pytest
+
 from pymojis.domain.entities.emojis import Categories, Emoji
 from pymojis.infrastructure.pymojis_repository import PymojisRepositoryImpl
 
@@ -93,3 +95,67 @@ def test_to_html(repository: PymojisRepositoryImpl):
 def test_to_html_complex(repository: PymojisRepositoryImpl):
     result = repository.to_html("😵‍💫")
     assert result == "&#x1F635;&#x200D;&#x1F4AB;"
+
+
+def test_get_by_name_case_insensitive(repository: PymojisRepositoryImpl):
+    assert repository.get_by_name("GRINNING Face") == "😀"
+
+
+def test_get_by_category_case_insensitive(repository: PymojisRepositoryImpl):
+    expected = repository.get_by_category("Smileys & Emotion")
+    assert repository.get_by_category("smileys & emotion") == expected
+    assert expected == [
+        emoji.emoji
+        for emoji in repository.get_all()
+        if emoji.category == "Smileys & Emotion"
+    ]
+
+
+def test_get_by_code_ignores_sequences(repository: PymojisRepositoryImpl):
+    # "200D" only appears inside ZWJ sequences, never as a standalone emoji
+    assert repository.get_by_code("200D") is None
+
+
+def test_get_by_emoji_unknown(repository: PymojisRepositoryImpl):
+    assert repository.get_by_emoji("not an emoji") is None
+    with pytest.warns(UserWarning):
+        assert repository.get_by_emoji(5) is None  # type: ignore[arg-type]
+
+
+def test_find_emojis(repository: PymojisRepositoryImpl):
+    text = "Dizzy 😵‍💫 then 😀"
+    result = repository.find_emojis(text)
+    assert [text[match.start : match.end] for match in result] == ["😵‍💫", "😀"]
+    assert result[0].emoji == repository.get_by_emoji("😵‍💫")
+    assert result[1].emoji.name == "grinning face"
+
+
+def test_iter_emojis_empty(repository: PymojisRepositoryImpl):
+    assert list(repository.iter_emojis("no emojis here")) == []
+
+
+def test_is_emoji_sequence(repository: PymojisRepositoryImpl):
+    assert repository.is_emoji("😀😵‍💫")
+    assert repository.is_emoji("🇫🇷")
+
+
+def test_is_emoji_rejects_non_emoji_characters(repository: PymojisRepositoryImpl):
+    # Previously accepted by the hand-written "enclosed characters" range
+    assert not repository.is_emoji("中文")
+    assert not repository.is_emoji("‍")
+
+
+def test_emojifie_match_policies(repository: PymojisRepositoryImpl):
+    assert repository.emojifie("so sleep") == "🧑 😪"
+    assert repository.emojifie("so sleep", match="prefix") == "🍦 😪"
+    assert repository.emojifie("so sleep", match="word") == "so sleep"
+    assert repository.emojifie("so sleeping", match="word") == "so 😴"
+
+
+def test_emoji_repository_get_all_is_memoised(repository: PymojisRepositoryImpl):
+    assert repository.get_all() is repository.get_all()
+    excluded = repository.get_all(["Flags", "Symbols"])
+    assert repository.get_all(["symbols", "flags", "unknown"]) is excluded
+    assert not any(emoji.category in ("Flags", "Symbols") for emoji in excluded)
+    assert repository.get_all("complex") is repository.get_all("complex")
+    assert len(repository.get_all([])) == len(repository.get_all())
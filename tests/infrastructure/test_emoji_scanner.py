@@ -0,0 +1,51 @@
+from pymojis.infrastructure.emoji_scanner import EmojiScanner
+
+GLYPHS = ["😵", "💫", "😵‍💫", "👍", "👍🏽", "🇫🇷", "❤️", "#️⃣"]
+
+
+def test_scanner_longest_match():
+    scanner = EmojiScanner(GLYPHS)
+    matches = list(scanner.iter_matches("a😵‍💫b👍🏽c🇫🇷"))
+    assert matches == [(1, 4, 2), (5, 7, 4), (8, 10, 5)]
+
+
+def test_scanner_falls_back_to_shorter_match():
+    scanner = EmojiScanner(GLYPHS)
+    assert list(scanner.iter_matches("😵‍x")) == [(0, 1, 0)]
+
+
+def test_scanner_optional_variation_selector():
+    scanner = EmojiScanner(GLYPHS)
+    assert list(scanner.iter_matches("❤")) == [(0, 1, 6)]
+    assert list(scanner.iter_matches("#⃣")) == [(0, 2, 7)]
+    assert list(scanner.iter_matches("👍️!")) == [(0, 2, 3)]
+
+
+def test_scanner_no_match():
+    scanner = EmojiScanner(GLYPHS)
+    assert not scanner.contains("plain # text 123")
+    assert not EmojiScanner(()).contains("😵")
+
+
+def test_scanner_fullmatch():
+    scanner = EmojiScanner(GLYPHS)
+    assert scanner.fullmatch("😵‍💫")
+    assert scanner.fullmatch("👍🏽🇫🇷")
+    assert not scanner.fullmatch("")
+    assert not scanner.fullmatch("👍 ")
+    assert not scanner.fullmatch("‍")
+
+
+def test_scanner_stream_matches_across_chunks():
+    scanner = EmojiScanner(GLYPHS)
+    text = "a😵‍💫b👍🏽c🇫🇷🇫🇷 ❤️#️⃣👍"
+    expected = list(scanner.iter_matches(text))
+    for size in range(1, len(text) + 1):
+        chunks = [text[i : i + size] for i in range(0, len(text), size)]
+        assert list(scanner.iter_matches_stream(chunks)) == expected
+
+
+def test_scanner_stream_empty_chunks():
+    scanner = EmojiScanner(GLYPHS)
+    assert list(scanner.iter_matches_stream(["", "😵", "", "‍💫"])) == [(0, 3, 2)]
+    assert list(scanner.iter_matches_stream([])) == []
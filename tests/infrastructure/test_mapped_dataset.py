@@ -0,0 +1,128 @@
+import os
+import pickle
+import struct
+from array import array
+
+import pytest
+
+from pymojis.infrastructure.data_loader.emojis_loader import (
+    DatasetConfig,
+    EmojiDataLoader,
+)
+from pymojis.infrastructure.data_loader.file_loader import FileLoader
+from pymojis.infrastructure.exceptions import InfrastructureError
+from pymojis.infrastructure.mapped_dataset import (
+    _HEADER,
+    _SECTIONS,
+    MappedEmojiDataset,
+    _MappedIndex,
+)
+from pymojis.infrastructure.pymojis_repository import PymojisRepositoryImpl
+
+
+@pytest.fixture
+def mapped_repository(tmp_path) -> PymojisRepositoryImpl:
+    light = EmojiDataLoader.DEFAULT_DATASETS[0]
+    config = DatasetConfig(
+        light.module,
+        light.filename,
+        light.dataset_type,
+        storage="mmap",
+        mapped_file=str(tmp_path / "light.map"),
+    )
+    repo = PymojisRepositoryImpl(dataset_configs=[config])
+    repo.load_emojis()
+    return repo
+
+
+def test_mapped_dataset_is_used(mapped_repository: PymojisRepositoryImpl):
+    assert isinstance(mapped_repository._dataset, MappedEmojiDataset)
+
+
+def test_mapped_lookups_match_memory(
+    mapped_repository: PymojisRepositoryImpl, repository: PymojisRepositoryImpl
+):
+    assert mapped_repository.get_all() == repository.get_all()
+    assert mapped_repository.get_by_code("1f600") == "😀"
+    assert mapped_repository.get_by_code("200D") is None
+    assert mapped_repository.get_by_name("Grinning Face") == "😀"
+    assert mapped_repository.get_by_emoji("😀") == repository.get_by_emoji("😀")
+    assert mapped_repository.get_by_category("Flags") == repository.get_by_category(
+        "Flags"
+    )
+    assert mapped_repository.emojifie("I'm sleepy") == "I'm 😪"
+    assert mapped_repository.contains_emojis("dizzy 😵‍💫")
+
+
+def test_mapped_file_is_reused(tmp_path, mapped_repository: PymojisRepositoryImpl):
+    mapped_file = tmp_path / "light.map"
+    modified = mapped_file.stat().st_mtime_ns
+    mapped_repository.load_emojis()
+    assert mapped_file.stat().st_mtime_ns == modified
+
+
+def test_mapped_dataset_pickles_to_its_file(
+    mapped_repository: PymojisRepositoryImpl,
+):
+    dataset = mapped_repository._dataset
+    payload = pickle.dumps(dataset)
+    assert len(payload) < 1024
+    restored = pickle.loads(payload)
+    assert isinstance(restored, MappedEmojiDataset)
+    assert restored.path == dataset.path
+    assert restored.emojis[0] == dataset.emojis[0]
+
+
+def test_mapped_index_stops_on_full_table():
+    table = memoryview(array("I", [1, 2, 3, 4]))
+    index = _MappedIndex(table, lambda ordinal: f"key{ordinal}", lambda o: o)
+    assert index.find("key2") == 2
+    assert index.find("missing") is None
+
+
+def _source() -> bytes:
+    light = EmojiDataLoader.DEFAULT_DATASETS[0]
+    return FileLoader().read_package_bytes(light.module, light.filename)
+
+
+def test_mapped_dataset_rejects_out_of_bounds_sections(
+    tmp_path, mapped_repository: PymojisRepositoryImpl
+):
+    mapped_file = tmp_path / "light.map"
+    content = bytearray(mapped_file.read_bytes())
+    # Move the "strings" section past the end of the file
+    offset = _HEADER.size - 8 * len(_SECTIONS) + 8 * _SECTIONS.index("strings")
+    struct.pack_into("<I", content, offset, len(content))
+    mapped_file.write_bytes(content)
+    with pytest.raises(InfrastructureError, match="Corrupted"):
+        MappedEmojiDataset(mapped_file, _source())
+
+
+@pytest.mark.skipif(not hasattr(os, "getuid"), reason="POSIX permissions")
+def test_mapped_dataset_rejects_shared_writable_file(
+    tmp_path, mapped_repository: PymojisRepositoryImpl
+):
+    mapped_file = tmp_path / "light.map"
+    mapped_file.chmod(0o666)
+    with pytest.raises(InfrastructureError, match="writable"):
+        MappedEmojiDataset(mapped_file, _source())
+
+
+def test_unmappable_dataset_stays_in_memory(tmp_path, caplog):
+    light = EmojiDataLoader.DEFAULT_DATASETS[0]
+    # A directory cannot be replaced by the mapped file
+    blocked = tmp_path / "light.map"
+    blocked.mkdir()
+    (blocked / "keep").touch()
+    config = DatasetConfig(
+        light.module,
+        light.filename,
+        light.dataset_type,
+        storage="mmap",
+        mapped_file=str(blocked),
+    )
+    repo = PymojisRepositoryImpl(dataset_configs=[config])
+    repo.load_emojis()
+    assert not isinstance(repo._dataset, MappedEmojiDataset)
+    assert repo.get_by_name("grinning face") == "😀"
+    assert "keeping it in memory" in caplog.text
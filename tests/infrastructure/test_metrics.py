@@ -0,0 +1,85 @@
+from collections.abc import Iterator
+
+import pytest
+
+from pymojis.application.pymojis_manager import PymojisManager
+from pymojis.infrastructure import metrics as metrics_module
+from pymojis.infrastructure.dataset_registry import DatasetRegistry
+from pymojis.infrastructure.emoji_dataset import EmojiDataset
+from pymojis.infrastructure.metrics import PymojisMetrics, add_hook, remove_hook
+from pymojis.infrastructure.pymojis_repository import PymojisRepositoryImpl
+
+
+@pytest.fixture
+def metrics() -> Iterator[PymojisMetrics]:
+    metrics = PymojisMetrics()
+    yield metrics
+    remove_hook(metrics)
+
+
+def test_load_pipeline_events(metrics):
+    repository = PymojisRepositoryImpl(registry=DatasetRegistry(), metrics=metrics)
+    repository.warmup()
+
+    snapshot = metrics.snapshot()
+    timings = snapshot["timings"]
+    for name in ("file_read", "json_decode"):
+        assert any(series.startswith(f"{name}{{") for series in timings)
+    assert "entity_parse" in timings
+    assert timings['index_build{index="scanner"}']["count"] == 1
+    assert snapshot["calls"]["warmup"]["count"] == 1
+
+
+def test_skipped_records(metrics):
+    data = {
+        "emojis": {
+            "Smileys & Emotion": {
+                "face-smiling": [
+                    {"code": ["1F600"], "emoji": "😀", "name": "grinning face"},
+                    "not an emoji",
+                ],
+                "broken": "not a list",
+            },
+            "Broken": "not a dict",
+        }
+    }
+    add_hook(metrics)
+    assert len(EmojiDataset.from_raw(data).emojis) == 1
+
+    counters = metrics.snapshot()["counters"]
+    assert counters['skipped_records{record="category"}'] == 1
+    assert counters['skipped_records{record="subcategory"}'] == 1
+    assert counters['skipped_records{record="emoji"}'] == 1
+
+
+def test_method_calls(metrics):
+    manager = PymojisManager(metrics=metrics)
+    manager.get_by_code("1F604")
+    manager.get_by_code("1F605")
+    list(manager.iter_emojis_stream(["hello 😄", " world"]))
+
+    calls = metrics.snapshot()["calls"]
+    assert calls["get_by_code"]["count"] == 2
+    assert calls["get_by_code"]["total"] >= calls["get_by_code"]["max"] > 0
+    assert calls["iter_emojis_stream"]["count"] == 1
+
+    metrics.reset()
+    assert metrics.snapshot()["calls"] == {}
+
+
+def test_metrics_scoped_to_their_repository():
+    loaded, other = PymojisMetrics(), PymojisMetrics()
+    PymojisRepositoryImpl(registry=DatasetRegistry(), metrics=loaded).warmup()
+    repository = PymojisRepositoryImpl(registry=DatasetRegistry(), metrics=other)
+    repository.find_emojis("hello 😄")
+    repository.contains_emojis_stream(["hello 😄"])
+
+    assert loaded.snapshot()["timings"]
+    assert "warmup" not in other.snapshot()["calls"]
+    assert loaded not in metrics_module._hooks
+    # Nested calls of tracked methods are not recorded again
+    calls = other.snapshot()["calls"]
+    assert calls["find_emojis"]["count"] == 1
+    assert calls["contains_emojis_stream"]["count"] == 1
+    assert "iter_emojis" not in calls
+    assert "iter_emojis_stream" not in calls
@@ -0,0 +1,49 @@
+import pytest
+
+from pymojis.infrastructure import name_index
+from pymojis.infrastructure.name_index import EmojiNameIndex
+
+NAMES = ["grinning face", "sleepy face", "sleeping face", "flag: France"]
+
+
+def test_name_index_substring_first_match():
+    index = EmojiNameIndex(NAMES)
+    assert index.find("face") == 0
+    assert index.find("EEP") == 1
+    assert index.find("ee") == 1
+    assert index.find("nce") == 3
+    assert index.find("xyz") is None
+
+
+def test_name_index_word():
+    index = EmojiNameIndex(NAMES)
+    assert index.find("sleeping", "word") == 2
+    assert index.find("sleep", "word") is None
+    assert index.find("france", "word") == 3
+
+
+def test_name_index_prefix():
+    index = EmojiNameIndex(NAMES)
+    assert index.find("sleep", "prefix") == 1
+    assert index.find("ning", "prefix") is None
+
+
+def test_name_index_unknown_policy():
+    with pytest.raises(ValueError):
+        EmojiNameIndex(NAMES).find("face", "fuzzy")
+
+
+def test_name_index_lower_cases_like_emojifie():
+    # lower() leaves ß as is, where casefold() would turn it into ss
+    index = EmojiNameIndex(["kiss", "STRASSE"])
+    assert index.find("ß") is None
+    assert index.find("S", "prefix") == 1
+
+
+def test_name_index_bounds_short_substrings(monkeypatch):
+    monkeypatch.setattr(name_index, "_MAX_SHORT_SUBSTRINGS", 2)
+    index = EmojiNameIndex(NAMES)
+    for token in ["a", "b", "c", "ee"]:
+        index.find(token)
+    assert len(index._short_substrings) <= 2
+    assert index.find("ee") == 1
@@ -0,0 +1,59 @@
+from itertools import islice
+from random import Random
+
+import pytest
+
+from pymojis.infrastructure.random_pools import RandomPools
+
+# Ordinals 0-2 are people, 3-4 are animals; 1 and 4 are complex
+POOLS = RandomPools(
+    ["People & Body"] * 3 + ["Animals & Nature"] * 2,
+    [False, True, False, False, True],
+)
+
+
+def test_pool_filters():
+    assert list(POOLS.pool(None, None)) == [0, 1, 2, 3, 4]
+    assert list(POOLS.pool(None, "complex")) == [0, 2, 3]
+    assert list(POOLS.pool(None, ["people & body"])) == [3, 4]
+    assert list(POOLS.pool(["Animals & Nature"], "complex")) == [3, 4]
+    assert list(POOLS.pool(["Unknown"], None)) == []
+
+
+def test_pool_cached():
+    assert POOLS.pool(None, ["Animals & Nature"]) is POOLS.pool(
+        None, ["animals & nature"]
+    )
+
+
+def test_sample_distinct_and_seeded():
+    first = POOLS.sample(Random(7), 10)
+    assert sorted(first) == [0, 1, 2, 3, 4]
+    assert POOLS.sample(Random(7), 10) == first
+
+
+def test_choices_weighted():
+    drawn = POOLS.choices(Random(1), 50, {"animals & nature": 1, "People & Body": 0})
+    assert len(drawn) == 50
+    assert set(drawn) <= {3, 4}
+    assert POOLS.choices(Random(1), 5, {"Travel & Places": 1}) == []
+
+
+def test_choices_negative_weight():
+    with pytest.raises(ValueError):
+        POOLS.choices(Random(), 1, {"Animals & Nature": -1})
+
+
+def test_iter_sample_window():
+    drawn = list(islice(POOLS.iter_sample(Random(3), window=3), 100))
+    assert all(len(set(drawn[i : i + 3])) == 3 for i in range(len(drawn) - 2))
+    assert set(drawn) == {0, 1, 2, 3, 4}
+
+
+def test_iter_sample_window_capped():
+    drawn = list(islice(POOLS.iter_sample(Random(3), None, "complex", 10), 9))
+    assert sorted(drawn[:3]) == sorted(drawn[3:6]) == [0, 2, 3]
+
+
+def test_iter_sample_empty_pool():
+    assert list(POOLS.iter_sample(Random(), ["Flags"])) == []
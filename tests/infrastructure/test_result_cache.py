@@ -0,0 +1,61 @@
+import pytest
+
+from pymojis.infrastructure.result_cache import ResultCache
+
+
+def test_lru_eviction():
+    cache = ResultCache(max_entries=2)
+    cache.get_or_compute("a", lambda: 1)
+    cache.get_or_compute("b", lambda: 2)
+    assert cache.get_or_compute("a", lambda: -1) == 1
+    cache.get_or_compute("c", lambda: 3)
+    assert cache.get_or_compute("b", lambda: -2) == -2
+
+    stats = cache.stats()
+    assert (stats.hits, stats.misses, stats.evictions) == (1, 4, 2)
+    assert stats.entries == 2
+
+
+def test_max_bytes():
+    cache = ResultCache(max_entries=None, max_bytes=400)
+    for index in range(10):
+        cache.get_or_compute(("key", index), lambda: "value")
+    stats = cache.stats()
+    assert 0 < stats.size_bytes <= 400
+    assert stats.evictions == 10 - stats.entries
+    cache.get_or_compute("big", lambda: "x" * 1000)
+    assert cache.get_or_compute("big", lambda: "recomputed") == "recomputed"
+
+
+def test_ttl_expiry():
+    now = [0.0]
+    cache = ResultCache(ttl=10, clock=lambda: now[0])
+    cache.get_or_compute("a", lambda: 1)
+    now[0] = 5
+    assert cache.get_or_compute("a", lambda: 2) == 1
+    now[0] = 11
+    assert cache.get_or_compute("a", lambda: 2) == 2
+
+
+def test_caches_none_and_bypasses_unhashable():
+    cache = ResultCache()
+    assert cache.get_or_compute("missing", lambda: None) is None
+    assert cache.get_or_compute("missing", lambda: "found") is None
+    assert cache.get_or_compute(("key", ["list"]), lambda: "computed") == "computed"
+    assert len(cache) == 1
+
+
+def test_clear_drops_values_computed_before():
+    cache = ResultCache()
+
+    def compute():
+        cache.clear()
+        return "stale"
+
+    assert cache.get_or_compute("a", compute) == "stale"
+    assert len(cache) == 0
+
+
+def test_invalid_bounds():
+    with pytest.raises(ValueError):
+        ResultCache(max_entries=0)
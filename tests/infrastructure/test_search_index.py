@@ -0,0 +1,76 @@
+from pymojis.infrastructure.search_index import EmojiSearchIndex, _distance
+
+NAMES = [
+    "grinning face with big eyes",
+    "grinning face",
+    "grinning cat",
+    "red heart",
+    "heart suit",
+    "flag: France",
+    "cat face",
+    "sleepy face",
+]
+SUB_CATEGORIES = [
+    "face-smiling",
+    "face-smiling",
+    "cat-face",
+    "heart",
+    "game",
+    "country-flag",
+    "animal-mammal",
+    "face-sleepy",
+]
+
+
+def test_search_ranks_exact_prefix_then_tokens():
+    index = EmojiSearchIndex(NAMES, SUB_CATEGORIES)
+    # Exact name first, then names starting with the query, shorter first
+    assert index.search("Grinning Face") == [1, 0, 2]
+    assert index.search("grin") == [2, 1, 0]
+    # Words in any order, matches through the name before the sub category
+    assert index.search("face grin") == [1, 0, 2]
+    assert index.search("heart") == [4, 3]
+    assert index.search("flag: fr") == [5]
+    assert index.search("flag fr") == [5]
+
+
+def test_search_fuzzy():
+    index = EmojiSearchIndex(NAMES, SUB_CATEGORIES)
+    assert index.search("red hert") == [3]
+    assert index.search("haert") == [3, 4]
+    assert index.search("grining face") == [1, 0, 2]
+    # Too short to be corrected
+    assert index.search("xa") == []
+    assert index.search("xyzzy") == []
+
+
+def test_search_fuzzy_short_words():
+    # Three letter typos share no trigram with the words they mistype
+    index = EmojiSearchIndex(["dog", "cat", "cut"], ["animal", "animal", "tool"])
+    assert index.search("dgo") == [0]
+    assert index.search("cst") == [1, 2]
+    assert index.search("ctt") == [1, 2]
+
+
+def test_search_fuzzy_long_words():
+    index = EmojiSearchIndex(["butterfly", "construction worker"], ["bug", "job"])
+    # Two edits are allowed from ten letters on, even over a shorter word
+    assert index.search("buttterrfly") == [0]
+    assert index.search("constrcutoin") == [1]
+    assert index.search("buterfyl") == []
+
+
+def test_search_limit():
+    index = EmojiSearchIndex(NAMES, SUB_CATEGORIES)
+    assert index.search("face", limit=2) == [6, 7]
+    assert len(index.search("face", limit=None)) == 5
+    assert index.search("face", limit=0) == []
+    assert index.search("  ") == []
+
+
+def test_distance():
+    assert _distance("heart", "heart", 1) == 0
+    assert _distance("hert", "heart", 1) == 1
+    assert _distance("haert", "heart", 1) == 1
+    assert _distance("hrt", "heart", 1) == 2
+    assert _distance("grinning", "grin", 2) == 3
@@ -0,0 +1,91 @@
+import json
+
+import pytest
+
+from pymojis.infrastructure.data_loader import snapshot as snapshot_module
+from pymojis.infrastructure.data_loader.emojis_loader import (
+    DatasetConfig,
+    EmojiDataLoader,
+)
+from pymojis.infrastructure.data_loader.file_loader import FileLoader
+from pymojis.infrastructure.data_loader.snapshot import dumps_snapshot, loads_snapshot
+from pymojis.infrastructure.emoji_dataset import EmojiDataset
+from pymojis.infrastructure.exceptions import FileLoadingError, SnapshotError
+
+SOURCE = json.dumps(
+    {
+        "emojis": {
+            "Smileys & Emotion": {
+                "face-smiling": [
+                    {"code": ["1F600"], "emoji": "😀", "name": "grinning face"}
+                ]
+            }
+        }
+    }
+).encode()
+
+
+class InMemoryFileLoader(FileLoader):
+    def __init__(self, resources: dict[str, bytes]):
+        super().__init__()
+        self.resources = resources
+
+    def read_package_bytes(self, module: str, filename: str) -> bytes:
+        if filename not in self.resources:
+            raise FileLoadingError(f"Resource not found {module}/{filename}")
+        return self.resources[filename]
+
+
+def _dataset() -> EmojiDataset:
+    return EmojiDataset.from_raw(json.loads(SOURCE), trusted=True)
+
+
+def test_snapshot_roundtrip():
+    dataset = loads_snapshot(dumps_snapshot(_dataset(), SOURCE), SOURCE)
+    assert dataset.emojis == _dataset().emojis
+    assert dataset.name_index == {"grinning face": "😀"}
+    assert dataset.scanner.contains("hi 😀")
+
+
+def test_snapshot_leaves_indexes_lazy():
+    built = _dataset()
+    built.warmup()
+    dataset = loads_snapshot(dumps_snapshot(built, SOURCE), SOURCE)
+    assert "search_index" not in vars(dataset)
+    assert dataset.search_index.search("grinnign") == [0]
+
+
+def test_snapshot_rejects_other_source():
+    snapshot = dumps_snapshot(_dataset(), SOURCE)
+    with pytest.raises(SnapshotError):
+        loads_snapshot(snapshot, SOURCE + b" ")
+    with pytest.raises(SnapshotError):
+        loads_snapshot(b"not a snapshot", SOURCE)
+
+
+def test_snapshot_rejects_other_code(monkeypatch):
+    snapshot = dumps_snapshot(_dataset(), SOURCE)
+    monkeypatch.setattr(snapshot_module, "_code_digest", lambda: bytes(32))
+    with pytest.raises(SnapshotError):
+        loads_snapshot(snapshot, SOURCE)
+
+
+def test_loader_prefers_snapshot():
+    snapshot_dataset = _dataset()
+    file_loader = InMemoryFileLoader(
+        {
+            "data.json": SOURCE,
+            "data.snapshot": dumps_snapshot(snapshot_dataset, SOURCE),
+        }
+    )
+    config = DatasetConfig("module", "data.json", "test", "data.snapshot")
+    loader = EmojiDataLoader(file_loader, [config])
+    assert loader.load_dataset_from_default_sources().emojis == snapshot_dataset.emojis
+
+
+def test_loader_falls_back_to_json_on_stale_snapshot():
+    stale = dumps_snapshot(EmojiDataset(()), b"previous dataset")
+    file_loader = InMemoryFileLoader({"data.json": SOURCE, "data.snapshot": stale})
+    config = DatasetConfig("module", "data.json", "test", "data.snapshot")
+    dataset = EmojiDataLoader(file_loader, [config]).load_dataset_from_default_sources()
+    assert len(dataset) == 1